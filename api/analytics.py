@@ -0,0 +1,193 @@
+# api/analytics.py
+# Dashboard aggregates kept up to date from job change events, so analytics reads
+# cost O(result size) instead of a full scan of the jobs table per request.
+
+import heapq
+import threading
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from storage import JOB_STATUSES, JobStore
+from telemetry import ANALYTICS_SECONDS, timed
+
+# Columns each job contributes to the aggregates
+ANALYTICS_COLUMNS = ["id", "created_at", "company", "match_score", "status", "skill_breakdown"]
+
+GAP_LEVELS = ("missing", "partial")
+
+# Shown by the trends chart before any job has been added
+SAMPLE_TRENDS = [
+    {'month': 'Week 1', 'applications': 12, 'avg_match_score': 75},
+    {'month': 'Week 2', 'applications': 18, 'avg_match_score': 82},
+    {'month': 'Week 3', 'applications': 8, 'avg_match_score': 65},
+    {'month': 'Week 4', 'applications': 15, 'avg_match_score': 78},
+]
+
+
+def _week_start(created_at: Optional[str]) -> Optional[date]:
+    if not created_at:
+        return None
+    job_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+    return job_date.date() - timedelta(days=job_date.weekday())
+
+
+def _gap_skills(skill_breakdown) -> Tuple[str, ...]:
+    return tuple(
+        skill.get('skill') for skill in (skill_breakdown or [])
+        if skill.get('match_level') in GAP_LEVELS
+    )
+
+
+def _average(totals: List[int]) -> float:
+    count, score_sum, scored = totals
+    return score_sum / scored if scored else 0
+
+
+class JobAnalytics:
+    """Per-company score sums, status counts, gap-skill frequencies and weekly buckets.
+
+    Each job's contribution is remembered by id, so updates and deletes can be
+    subtracted without re-reading the old row from storage.
+    """
+
+    def __init__(self):
+        # Re-entrant so snapshot() can hold it across the individual views
+        self._lock = threading.RLock()
+        # Bumped on every change; versions this worker's analytics responses
+        self.generation = 0
+        self._contributions: Dict[Any, tuple] = {}
+        # Rows still waiting for a score count as applications but not in averages
+        self._companies: Dict[str, List[int]] = {}   # company -> [count, score_sum, scored]
+        self._statuses: Counter = Counter()
+        self._gaps: Counter = Counter()
+        self._weeks: Dict[date, List[int]] = {}      # week start -> [count, score_sum, scored]
+        # Changes seen while a rebuild scans storage, one buffer per rebuild in progress
+        self._rebuilds: List[List[Tuple[str, List[Dict[str, Any]]]]] = []
+
+    @timed(ANALYTICS_SECONDS, operation="rebuild")
+    def rebuild(self, store: JobStore) -> None:
+        """Recompute everything from storage (startup and periodic resync).
+
+        Changes applied while storage is scanned are replayed onto the fresh
+        aggregates before they replace the current ones, so none are lost.
+        Replaying one the scan already saw is harmless: apply() replaces a job's
+        contribution by id.
+        """
+        fresh = JobAnalytics()
+        changes: List[Tuple[str, List[Dict[str, Any]]]] = []
+        with self._lock:
+            self._rebuilds.append(changes)
+        try:
+            for page in store.iter_jobs(columns=ANALYTICS_COLUMNS):
+                fresh.apply("insert", page)
+            self._swap_in(fresh, changes)
+        finally:
+            with self._lock:
+                self._rebuilds.remove(changes)
+
+    def _swap_in(self, fresh: "JobAnalytics", changes: List[Tuple[str, List[Dict[str, Any]]]]) -> None:
+        with self._lock:
+            for kind, rows in changes:
+                fresh.apply(kind, rows)
+            self._contributions = fresh._contributions
+            self._companies = fresh._companies
+            self._statuses = fresh._statuses
+            self._gaps = fresh._gaps
+            self._weeks = fresh._weeks
+            self.generation += 1
+
+    @timed(ANALYTICS_SECONDS, operation="apply")
+    def apply(self, kind: str, rows: List[Dict[str, Any]]) -> None:
+        """JobStore change listener."""
+        with self._lock:
+            for row in rows:
+                self._remove(row["id"])
+                if kind != "delete":
+                    self._add(row)
+            for changes in self._rebuilds:
+                changes.append((kind, rows))
+            self.generation += 1
+
+    def _add(self, row: Dict[str, Any]) -> None:
+        contribution = (
+            row.get("company"),
+            row.get("match_score"),
+            row.get("status"),
+            _gap_skills(row.get("skill_breakdown")),
+            _week_start(row.get("created_at")),
+        )
+        self._contributions[row["id"]] = contribution
+        self._bump(contribution, 1)
+
+    def _remove(self, job_id) -> None:
+        contribution = self._contributions.pop(job_id, None)
+        if contribution is not None:
+            self._bump(contribution, -1)
+
+    def _bump(self, contribution: tuple, sign: int) -> None:
+        company, score, status, gaps, week = contribution
+        scored = score is not None
+        totals = self._companies.setdefault(company, [0, 0, 0])
+        totals[0] += sign
+        if scored:
+            totals[1] += sign * score
+            totals[2] += sign
+        if totals[0] == 0:
+            del self._companies[company]
+        self._statuses[status] += sign
+        for skill in gaps:
+            self._gaps[skill] += sign
+            if self._gaps[skill] <= 0:
+                del self._gaps[skill]
+        if week is not None:
+            bucket = self._weeks.setdefault(week, [0, 0, 0])
+            bucket[0] += sign
+            if scored:
+                bucket[1] += sign * score
+                bucket[2] += sign
+            if bucket[0] == 0:
+                del self._weeks[week]
+
+    @timed(ANALYTICS_SECONDS, operation="top_companies")
+    def top_companies(self, limit: int = 5) -> List[Dict[str, Any]]:
+        with self._lock:
+            best = heapq.nlargest(limit, self._companies.items(), key=lambda item: _average(item[1]))
+            return [{
+                'company': company,
+                'avg_match_score': round(_average(totals), 1),
+                'application_count': totals[0]
+            } for company, totals in best]
+
+    @timed(ANALYTICS_SECONDS, operation="funnel")
+    def funnel(self) -> Dict[str, int]:
+        with self._lock:
+            return {status: self._statuses.get(status, 0) for status in JOB_STATUSES}
+
+    @timed(ANALYTICS_SECONDS, operation="common_gaps")
+    def common_gaps(self, limit: int = 5) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [{'skill': skill, 'frequency': count} for skill, count in self._gaps.most_common(limit)]
+
+    @timed(ANALYTICS_SECONDS, operation="weekly_trends")
+    def weekly_trends(self, weeks: int = 4) -> List[Dict[str, Any]]:
+        with self._lock:
+            if not self._weeks:
+                return SAMPLE_TRENDS
+            latest = heapq.nlargest(weeks, self._weeks.items())
+            return [{
+                'month': week.strftime('%b %d'),
+                'applications': totals[0],
+                'avg_match_score': round(_average(totals), 1)
+            } for week, totals in reversed(latest)]
+
+    @timed(ANALYTICS_SECONDS, operation="snapshot")
+    def snapshot(self) -> Dict[str, Any]:
+        """All four dashboard views from one consistent state, for /analytics/dashboard."""
+        with self._lock:
+            return {
+                "funnel": self.funnel(),
+                "top_companies": self.top_companies(),
+                "common_gaps": self.common_gaps(),
+                "monthly_trends": self.weekly_trends(),
+            }
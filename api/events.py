@@ -0,0 +1,171 @@
+# api/events.py
+# Job change feed behind GET /events. Every worker appends its store changes to a
+# shared SQLite log and tails it, so a client connected to any uvicorn worker sees
+# writes made through all of them.
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from fastapi.concurrency import run_in_threadpool
+
+from telemetry import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_EVENTS_PATH = Path(__file__).resolve().parent.parent / ".data" / "events.sqlite3"
+
+# Logged (other workers' job index needs it) but left out of what clients are
+# sent; they fetch it from GET /jobs/{id} when needed
+CLIENT_EXCLUDED_COLUMNS = {"description"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    origin TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    rows TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+# listener(kind, rows) for changes written by other processes
+RemoteListener = Callable[[str, List[Dict[str, Any]]], None]
+
+
+class EventLog:
+    """Append-only log of job changes with per-process fan-out to subscribers.
+
+    `append` is a JobStore change listener. A tail loop reads new entries every
+    `poll_seconds` (or right after a local append) and hands each one to the
+    in-process subscriber queues; entries from other processes are also passed
+    to `on_remote` so per-process state such as analytics stays in step.
+    """
+
+    def __init__(self, path: str, origin: str, poll_seconds: float = 0.25,
+                 retention_seconds: float = 3600, queue_size: int = 1000):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=10)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self.origin = origin
+        self.poll_seconds = poll_seconds
+        self.retention_seconds = retention_seconds
+        self.queue_size = queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.last_seq = self._query("SELECT COALESCE(MAX(seq), 0) FROM job_events")[0][0]
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def append(self, kind: str, rows: List[Dict[str, Any]]) -> None:
+        """Record one change; safe to call from any thread."""
+        self._query(
+            "INSERT INTO job_events (origin, kind, rows, created_at) VALUES (?, ?, ?, ?)",
+            (self.origin, kind, json.dumps(rows, default=str), time.time()),
+        )
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def since(self, seq: int) -> List[Dict[str, Any]]:
+        """Logged events after `seq`, oldest first."""
+        return [
+            {"seq": s, "origin": origin, "kind": kind, "rows": json.loads(rows)}
+            for s, origin, kind, rows in self._query(
+                "SELECT seq, origin, kind, rows FROM job_events WHERE seq > ? ORDER BY seq", (seq,))
+        ]
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def _fan_out(self, event: Dict[str, Any]) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Slow client: end its stream; EventSource reconnects with
+                # Last-Event-ID and replays what it missed from the log
+                self._subscribers.discard(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+    def _read(self, on_remote: Optional[RemoteListener]) -> List[Dict[str, Any]]:
+        """Entries after last_seq, with the ones from other processes already passed to on_remote."""
+        events = self.since(self.last_seq)
+        if on_remote is not None:
+            for event in events:
+                if event["origin"] == self.origin:
+                    continue
+                try:
+                    on_remote(event["kind"], event["rows"])
+                except Exception:
+                    logger.exception("Applying remote event failed", extra={"seq": event["seq"]})
+        return events
+
+    async def _tail(self, on_remote: Optional[RemoteListener]) -> None:
+        last_prune = time.time()
+        while True:
+            self._wakeup.clear()
+            try:
+                # Reading the log and re-indexing remote rows happen in the threadpool;
+                # only the fan-out to subscriber queues runs on the loop
+                for event in await run_in_threadpool(self._read, on_remote):
+                    self.last_seq = event["seq"]
+                    self._fan_out(event)
+                if time.time() - last_prune > 60:
+                    await run_in_threadpool(self._query, "DELETE FROM job_events WHERE created_at < ?",
+                                            (time.time() - self.retention_seconds,))
+                    last_prune = time.time()
+            except Exception:
+                logger.exception("Event feed read failed")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self, on_remote: Optional[RemoteListener] = None) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._tail(on_remote))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._loop = None
+        self._task = None
+
+
+def client_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [{k: v for k, v in row.items() if k not in CLIENT_EXCLUDED_COLUMNS} for row in rows]
+
+
+def format_sse(event: str, data: Any, event_id: Optional[int] = None) -> str:
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {event}", f"data: {json.dumps(data, default=str)}"]
+    return "\n".join(lines) + "\n\n"
+
+
+event_log = EventLog(
+    path=os.getenv("EVENTS_PATH", str(DEFAULT_EVENTS_PATH)),
+    origin=uuid.uuid4().hex[:8],
+    poll_seconds=float(os.getenv("EVENTS_POLL_SECONDS", "0.25")),
+    retention_seconds=float(os.getenv("EVENTS_RETENTION_SECONDS", "3600")),
+)
@@ -0,0 +1,59 @@
+# api/http_cache.py
+# Conditional GETs for polled endpoints: the ETag comes from a cheap data-version
+# token rather than a hash of the response body, so an unchanged poll costs one
+# version lookup and a bodiless 304.
+
+import hashlib
+from typing import Any, Callable, Dict
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import msgpack
+except ImportError:  # optional compact format
+    msgpack = None
+
+MSGPACK_TYPES = ("application/msgpack", "application/x-msgpack")
+
+
+def _wants_msgpack(request: Request) -> bool:
+    accept = request.headers.get("accept", "")
+    return msgpack is not None and any(t in accept for t in MSGPACK_TYPES)
+
+
+def make_etag(request: Request, version: str) -> str:
+    # Same data renders differently per query string and format
+    variant = f"{request.url.path}?{request.url.query}|{_wants_msgpack(request)}"
+    digest = hashlib.blake2b(f"{version}|{variant}".encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [tag.strip() for tag in header.split(",")]
+    return "*" in candidates or etag in candidates or etag[2:] in candidates
+
+
+def conditional_response(request: Request, version: str,
+                         build_payload: Callable[[], Dict[str, Any]]) -> Response:
+    """304 if the client already has `version`, otherwise the payload as JSON or MessagePack.
+
+    build_payload only runs when the client's copy is stale.
+    """
+    etag = make_etag(request, version)
+    headers = {
+        "ETag": etag,
+        # Let browsers keep the body but revalidate on every poll
+        "Cache-Control": "no-cache",
+        "Vary": "Accept, Accept-Encoding",
+    }
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    payload = build_payload()
+    if _wants_msgpack(request):
+        return Response(msgpack.packb(payload, default=str), media_type=MSGPACK_TYPES[0], headers=headers)
+    return JSONResponse(payload, headers=headers)
@@ -0,0 +1,269 @@
+# api/rescore.py
+# Re-score every stored job against a newly uploaded resume version. Runs walk the
+# table in keyset chunks, score each chunk concurrently and write it back in one
+# batch, checkpointing after every chunk so an interrupted run picks up where it
+# stopped.
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from llm.match_engine import fallback_match_scores, get_match_score_async
+from llm.resume_profile import resume_profiles
+from llm.semantic_index import job_index
+from storage import JobStore
+from telemetry import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_RESCORE_PATH = Path(__file__).resolve().parent.parent / ".data" / "rescore.sqlite3"
+
+RUN_COLUMNS = [
+    "run_id", "resume_version", "status_filter", "min_similarity", "state", "total", "processed",
+    "llm_scored", "failed", "cursor_created_at", "cursor_id", "active_seconds", "started_at",
+    "updated_at", "owner", "heartbeat_at", "error",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rescore_runs (
+    run_id TEXT PRIMARY KEY,
+    resume_version TEXT NOT NULL,
+    status_filter TEXT,
+    min_similarity REAL,
+    state TEXT NOT NULL,            -- running, done, cancelled, failed
+    total INTEGER NOT NULL,
+    processed INTEGER NOT NULL DEFAULT 0,
+    llm_scored INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    -- Keyset position of the last chunk written back
+    cursor_created_at TEXT,
+    cursor_id INTEGER,
+    active_seconds REAL NOT NULL DEFAULT 0,
+    started_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    owner TEXT,
+    heartbeat_at REAL NOT NULL DEFAULT 0,
+    error TEXT
+);
+"""
+
+SCORE_COLUMNS = ["id", "created_at", "description"]
+
+
+class RescoreRuns:
+    """Checkpointed re-scoring runs, shared by every worker process on the host.
+
+    The worker that starts a run owns it and heartbeats while it scores. Runs
+    whose owner stops heartbeating (crash, restart) are claimed and resumed by
+    whichever worker notices first; a chunk is only written back by a worker
+    that still owns the run.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 50, stale_seconds: float = 60.0):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=10)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self.chunk_size = chunk_size
+        self.stale_seconds = stale_seconds
+        self.owner = uuid.uuid4().hex[:8]
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._watcher: Optional[asyncio.Task] = None
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        with self._lock:
+            return self._db.execute(sql, params)
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        row = self._fetch_run(run_id)
+        return self._progress(dict(zip(RUN_COLUMNS, row))) if row else None
+
+    @staticmethod
+    def _progress(run: Dict[str, Any]) -> Dict[str, Any]:
+        rate = run["processed"] / run["active_seconds"] if run["active_seconds"] else 0.0
+        remaining = max(run["total"] - run["processed"], 0)
+        return {
+            "run_id": run["run_id"],
+            "resume_version": run["resume_version"],
+            "status_filter": run["status_filter"],
+            "min_similarity": run["min_similarity"],
+            "state": run["state"],
+            "total": run["total"],
+            "processed": run["processed"],
+            "llm_scored": run["llm_scored"],
+            "failed": run["failed"],
+            "jobs_per_second": round(rate, 2),
+            "eta_seconds": round(remaining / rate, 1) if rate and run["state"] == "running" else None,
+            "error": run["error"],
+        }
+
+    def _create(self, store: JobStore, resume_version: str, status: Optional[str],
+                min_similarity: Optional[float]) -> str:
+        run_id = uuid.uuid4().hex[:12]
+        total = store.count(status=status)
+        now = time.time()
+        self._execute(
+            "INSERT INTO rescore_runs (run_id, resume_version, status_filter, min_similarity, state, total,"
+            " started_at, updated_at, owner, heartbeat_at) VALUES (?, ?, ?, ?, 'running', ?, ?, ?, ?, ?)",
+            (run_id, resume_version, status, min_similarity, total, now, now, self.owner, now),
+        )
+        return run_id
+
+    async def start(self, store: JobStore, resume_version: str, status: Optional[str] = None,
+                    min_similarity: Optional[float] = None) -> Dict[str, Any]:
+        """Create a run and begin scoring it on this worker; returns its progress."""
+        # The store count and the run bookkeeping are blocking calls, kept off the event loop
+        run_id = await run_in_threadpool(self._create, store, resume_version, status, min_similarity)
+        self._launch(store, run_id)
+        return await run_in_threadpool(self.get, run_id)
+
+    async def cancel(self, run_id: str) -> Optional[Dict[str, Any]]:
+        await run_in_threadpool(self._execute, "UPDATE rescore_runs SET state = 'cancelled', updated_at = ?"
+                                " WHERE run_id = ? AND state = 'running'", (time.time(), run_id))
+        task = self._tasks.pop(run_id, None)
+        if task is not None:
+            task.cancel()
+        return await run_in_threadpool(self.get, run_id)
+
+    def _launch(self, store: JobStore, run_id: str) -> None:
+        self._tasks[run_id] = asyncio.create_task(self._run(store, run_id))
+
+    async def _run(self, store: JobStore, run_id: str) -> None:
+        try:
+            await self._process(store, run_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception("Re-score run failed", extra={"run_id": run_id})
+            await run_in_threadpool(self._execute, "UPDATE rescore_runs SET state = 'failed', error = ?,"
+                                    " updated_at = ? WHERE run_id = ?", (str(e), time.time(), run_id))
+        finally:
+            self._tasks.pop(run_id, None)
+
+    def _renew(self, run_id: str) -> bool:
+        """Refresh the heartbeat of a run this worker still owns; False once it was lost or stopped."""
+        return self._execute(
+            "UPDATE rescore_runs SET heartbeat_at = ? WHERE run_id = ? AND state = 'running' AND owner = ?",
+            (time.time(), run_id, self.owner)).rowcount > 0
+
+    async def _heartbeat(self, run_id: str) -> None:
+        # Scoring one chunk can outlast stale_seconds under rate limiting and backoff
+        while True:
+            await asyncio.sleep(self.stale_seconds / 3)
+            try:
+                if not await run_in_threadpool(self._renew, run_id):
+                    return
+            except Exception:
+                logger.exception("Re-score heartbeat failed", extra={"run_id": run_id})
+
+    async def _process(self, store: JobStore, run_id: str) -> None:
+        heartbeat = asyncio.create_task(self._heartbeat(run_id))
+        try:
+            await self._process_chunks(store, run_id)
+        finally:
+            heartbeat.cancel()
+
+    async def _process_chunks(self, store: JobStore, run_id: str) -> None:
+        run = dict(zip(RUN_COLUMNS, await run_in_threadpool(self._fetch_run, run_id)))
+        profile = await run_in_threadpool(resume_profiles.get, run["resume_version"])
+        if profile is None:
+            raise RuntimeError(f"Unknown resume_version {run['resume_version']!r}")
+        resume = profile["normalized_text"]
+
+        dissimilar = set()
+        if run["min_similarity"] is not None:
+            # Jobs the local index deems too far from the resume get the keyword
+            # score instead of an LLM call; jobs it has not indexed yet still go to the LLM
+            ranked = await run_in_threadpool(job_index.rank, resume, job_index.size, run["status_filter"])
+            dissimilar = {job["id"] for job in ranked if job["similarity"] < run["min_similarity"]}
+
+        after = (run["cursor_created_at"], run["cursor_id"]) if run["cursor_id"] is not None else None
+        while True:
+            started = time.perf_counter()
+            chunk = await run_in_threadpool(store.list_jobs, status=run["status_filter"], columns=SCORE_COLUMNS,
+                                            limit=self.chunk_size, after=after)
+            if not chunk:
+                break
+
+            llm_jobs = [job for job in chunk if job["id"] not in dissimilar]
+            results = await asyncio.gather(
+                *(get_match_score_async(resume, job["description"], profile, fallback=False) for job in llm_jobs),
+                return_exceptions=True)
+            scored = dict(zip((job["id"] for job in llm_jobs), results))
+            skipped = [job for job in chunk if job["id"] not in scored]
+            if skipped:
+                keyword = await run_in_threadpool(fallback_match_scores, resume,
+                                                  [job["description"] for job in skipped], profile)
+                scored.update(zip((job["id"] for job in skipped), keyword))
+
+            changes = [
+                {"id": job_id, "match_score": result["match_score"], "strengths": result["strengths"],
+                 "gaps": result["gaps"], "skill_breakdown": result.get("skill_breakdown", []),
+                 "resume_version": run["resume_version"], "scoring_status": "done"}
+                for job_id, result in scored.items() if not isinstance(result, BaseException)
+            ]
+            # Checked and renewed right before writing, so a worker that lost the run
+            # to _claim_stale does not write a chunk its new owner will score again
+            if not await run_in_threadpool(self._renew, run_id):
+                return
+            await run_in_threadpool(store.update_many, changes)
+
+            failed = len(scored) - len(changes)
+            after = (chunk[-1]["created_at"], chunk[-1]["id"])
+            cursor = await run_in_threadpool(
+                self._execute,
+                "UPDATE rescore_runs SET processed = processed + ?, llm_scored = llm_scored + ?, failed = failed + ?,"
+                " cursor_created_at = ?, cursor_id = ?, active_seconds = active_seconds + ?, updated_at = ?,"
+                " heartbeat_at = ? WHERE run_id = ? AND state = 'running' AND owner = ?",
+                (len(chunk), len(llm_jobs) - failed, failed, after[0], after[1],
+                 time.perf_counter() - started, time.time(), time.time(), run_id, self.owner),
+            )
+            if cursor.rowcount == 0:
+                return  # cancelled, or another worker took over
+            if len(chunk) < self.chunk_size:
+                break
+
+        await run_in_threadpool(self._execute, "UPDATE rescore_runs SET state = 'done', updated_at = ?"
+                                " WHERE run_id = ? AND owner = ?", (time.time(), run_id, self.owner))
+
+    def _fetch_run(self, run_id: str) -> tuple:
+        return self._execute(f"SELECT {', '.join(RUN_COLUMNS)} FROM rescore_runs WHERE run_id = ?",
+                             (run_id,)).fetchone()
+
+    def _claim_stale(self) -> List[str]:
+        """Take over runs whose owner stopped heartbeating; returns the ones claimed."""
+        now = time.time()
+        stale = self._execute("SELECT run_id FROM rescore_runs WHERE state = 'running' AND heartbeat_at < ?",
+                              (now - self.stale_seconds,)).fetchall()
+        return [run_id for (run_id,) in stale if self._execute(
+            "UPDATE rescore_runs SET owner = ?, heartbeat_at = ? WHERE run_id = ? AND state = 'running'"
+            " AND heartbeat_at < ?", (self.owner, now, run_id, now - self.stale_seconds)).rowcount]
+
+    async def _watch(self, store: JobStore) -> None:
+        while True:
+            try:
+                for run_id in await run_in_threadpool(self._claim_stale):
+                    if run_id not in self._tasks:
+                        logger.info("Resuming re-score run", extra={"run_id": run_id})
+                        self._launch(store, run_id)
+            except Exception:
+                logger.exception("Re-score watcher failed")
+            await asyncio.sleep(self.stale_seconds / 2)
+
+    def resume_interrupted(self, store: JobStore) -> None:
+        """Start watching for runs left behind by a stopped worker."""
+        self._watcher = asyncio.create_task(self._watch(store))
+
+
+rescore_runs = RescoreRuns(
+    path=os.getenv("RESCORE_PATH", str(DEFAULT_RESCORE_PATH)),
+    chunk_size=int(os.getenv("RESCORE_CHUNK_SIZE", "50")),
+)
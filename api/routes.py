@@ -2,16 +2,37 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from fastapi import FastAPI, HTTPException, UploadFile, File
+import asyncio
+import base64
+import json
+import re
+import threading
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 import os
-from dotenv import load_dotenv
-from supabase import create_client
-from llm.match_engine import get_match_score
+import uuid
+# First, so .env is loaded before the modules below read their settings
+from clients import close_clients, warm_up
+from storage import JOB_COLUMNS, JOB_STATUSES, get_job_store
+from api.analytics import JobAnalytics
+from api.events import client_rows, event_log, format_sse
+from api.rescore import rescore_runs
+from api.http_cache import conditional_response
+from api.scoring_queue import scoring_queue
+from llm.match_engine import (fallback_match_scores, get_match_score_async, get_match_scores_async, llm_scheduler,
+                              stream_match_score)
+from llm.match_cache import match_cache
 from llm.resume_parser import parse_resume_file
+from llm.resume_profile import build_profile, resolve_profile, resume_profiles
+from llm.duplicate_index import duplicate_index
+from llm.search_index import search_index
+from llm.semantic_index import INDEX_COLUMNS, job_index
+from telemetry import TimingMiddleware, get_logger, render_metrics
 
-# Load environment
-load_dotenv()
+logger = get_logger(__name__)
 
 app = FastAPI(title="Job Tracker API", version="1.0.0")
 
@@ -24,24 +45,156 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Supabase setup
-supabase_url = os.getenv("SUPABASE_URL")
-supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+# Compress larger responses; brotli when brotli-asgi is installed, gzip otherwise
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(BrotliMiddleware, minimum_size=1024, gzip_fallback=True)
+except ImportError:
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
 
-print(f"🔍 DEBUG: Supabase URL: {supabase_url}")
-print(f"🔍 DEBUG: Supabase Key length: {len(supabase_key) if supabase_key else 'MISSING'}")
+# Outermost, so compression counts towards request time
+app.add_middleware(TimingMiddleware)
 
-supabase = create_client(
-    os.getenv("SUPABASE_URL"),
-    os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-)
+# Jobs table access (Supabase by default, local SQLite with JOB_STORE=sqlite); the
+# Supabase client itself connects on the first query
+store = get_job_store()
+
+# Analytics aggregates follow every write made through the store
+analytics = JobAnalytics()
+# Analytics state is per process, so its ETags are only valid against this worker
+WORKER_ID = uuid.uuid4().hex[:8]
+store.subscribe(analytics.apply)
+# Change feed for GET /events; also how other workers' writes reach our analytics
+store.subscribe(event_log.append)
+STORE_CHANGE_KINDS = ("insert", "update", "delete")
+# Safety net in case the event log was pruned or missed something
+ANALYTICS_RESYNC_SECONDS = float(os.getenv("ANALYTICS_RESYNC_SECONDS", "300"))
+
+async def _resync_analytics():
+    while True:
+        await asyncio.sleep(ANALYTICS_RESYNC_SECONDS)
+        try:
+            await run_in_threadpool(analytics.rebuild, store)
+        except Exception:
+            logger.exception("Analytics resync failed")
+
+# Changes seen while _indexed_pages scans storage. A page read before a change would
+# otherwise bring back the old row, so they are replayed onto the indexes after the scan
+_index_lock = threading.Lock()
+_index_changes = None
+
+def _apply_to_indexes(kind: str, rows: list):
+    # Local TF-IDF index over job descriptions behind GET /jobs/rank
+    job_index.apply(kind, rows)
+    # Near-duplicate postings per company, checked before a new job is scored
+    duplicate_index.apply(kind, rows)
+    # BM25 full-text index behind GET /jobs/search
+    search_index.apply(kind, rows)
+
+def _apply_index_change(kind: str, rows: list):
+    with _index_lock:
+        _apply_to_indexes(kind, rows)
+        if _index_changes is not None:
+            _index_changes.append((kind, rows))
+
+store.subscribe(_apply_index_change)
+
+def _apply_remote_change(kind: str, rows: list):
+    if kind in STORE_CHANGE_KINDS:
+        analytics.apply(kind, rows)
+        _apply_index_change(kind, rows)
+
+def _indexed_pages():
+    """Every stored job, read once for all local indexes; feeds duplicate_index and
+    search_index on the way, then replays the changes made while it ran."""
+    global _index_changes
+    with _index_lock:
+        _index_changes = []
+    try:
+        duplicate_index.clear()
+        search_index.clear()
+        for page in store.iter_jobs(columns=INDEX_COLUMNS + ["duplicate_of"]):
+            duplicate_index.apply("insert", page)
+            search_index.apply("insert", page)
+            yield page
+        # Resumed only once job_index.rebuild has taken the last page
+        with _index_lock:
+            for kind, rows in _index_changes:
+                _apply_to_indexes(kind, rows)
+    finally:
+        with _index_lock:
+            _index_changes = None
+
+@app.on_event("startup")
+async def load_analytics():
+    await run_in_threadpool(analytics.rebuild, store)
+    # Reads every description, so build the index in the background; /jobs/rank
+    # reports how many jobs are indexed so far
+    asyncio.create_task(run_in_threadpool(job_index.rebuild, _indexed_pages()))
+    event_log.start(on_remote=_apply_remote_change)
+    if ANALYTICS_RESYNC_SECONDS > 0:
+        asyncio.create_task(_resync_analytics())
+    # Not awaited: the worker serves reads while the OpenAI SDK loads
+    asyncio.create_task(run_in_threadpool(warm_up))
+
+@app.on_event("shutdown")
+async def stop_event_feed():
+    await event_log.stop()
+    await close_clients()
+
+# Default for POST /jobs when the request does not pass async_scoring
+ASYNC_SCORING = os.getenv("ASYNC_SCORING", "false").lower() in ("1", "true", "yes")
+
+def _score_columns(result: dict) -> dict:
+    return {
+        "match_score": result["match_score"],
+        "strengths": result["strengths"],
+        "gaps": result["gaps"],
+        "skill_breakdown": result.get("skill_breakdown", []),
+    }
+
+async def _score_queued_job(task: dict):
+    profile = await run_in_threadpool(resume_profiles.get, task["resume_version"])
+    if profile is None:
+        raise RuntimeError(f"Unknown resume_version {task['resume_version']!r}")
+    job = await run_in_threadpool(store.get, task["job_id"], ["id", "description"])
+    if job is None:
+        return  # deleted while queued
+    # Let OpenAI errors surface so the queue retries with backoff
+    result = await get_match_score_async(profile["normalized_text"], job["description"], profile, fallback=False)
+    await run_in_threadpool(store.update, task["job_id"], {**_score_columns(result), "scoring_status": "done"})
+    await run_in_threadpool(event_log.append, "scored", [{"id": task["job_id"], "scoring_status": "done"}])
+
+async def _scoring_failed(task: dict, error: str):
+    # Out of retries: keep the keyword-based score so the row is still usable
+    profile = await run_in_threadpool(resume_profiles.get, task["resume_version"])
+    job = await run_in_threadpool(store.get, task["job_id"], ["id", "description"])
+    if job is None:
+        return
+    changes = {"scoring_status": "failed"}
+    if profile is not None:
+        result = (await run_in_threadpool(fallback_match_scores, profile["normalized_text"],
+                                          [job["description"]], profile))[0]
+        changes.update(_score_columns(result))
+    await run_in_threadpool(store.update, task["job_id"], changes)
+    await run_in_threadpool(event_log.append, "scored", [{"id": task["job_id"], "scoring_status": "failed"}])
+
+@app.on_event("startup")
+async def start_scoring_workers():
+    scoring_queue.start(_score_queued_job, _scoring_failed)
+    rescore_runs.resume_interrupted(store)
+
+@app.on_event("shutdown")
+async def stop_scoring_workers():
+    await scoring_queue.stop()
 
 @app.get("/")
 async def root():
     return {"message": "Job Tracker API is running!"}
 
 @app.post("/upload-resume")
-async def upload_resume(file: UploadFile = File(...)):
+async def upload_resume(file: UploadFile = File(...), resume_version: str = Form(None),
+                        rescore: bool = Form(False)):
     try:
         # Validate file type
         if not file.content_type in ["application/pdf", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"]:
@@ -50,210 +203,597 @@ async def upload_resume(file: UploadFile = File(...)):
         # Parse resume
         resume_text = await parse_resume_file(file)
         
+        # Analyze once so scoring can reference the profile by resume_version
+        profile = await run_in_threadpool(build_profile, resume_text, resume_version)
+        profile = await run_in_threadpool(resume_profiles.save, profile)
+        
+        # Optionally refresh every stored job's score against this resume
+        run = await rescore_runs.start(store, profile["resume_version"]) if rescore else None
+        
         return {
             "success": True,
             "resume_text": resume_text,
             "file_name": file.filename,
-            "char_count": len(resume_text)
+            "char_count": len(resume_text),
+            "resume_version": profile["resume_version"],
+            "content_hash": profile["content_hash"],
+            "token_count": profile["token_count"],
+            "skills": profile["skills"],
+            "rescore_run": run
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Resume upload failed: {str(e)}")
 
+JOBS_PAGE_SIZE = 50
+JOBS_PAGE_SIZE_MAX = 500
+# Heavy columns left out of list responses unless requested with full=true or fields=
+LIST_MODE_EXCLUDED = {"description", "skill_breakdown"}
+
+# ISO 8601 as the stores write it; anything else could smuggle syntax into a PostgREST filter
+_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}(:?\d{2})?)?")
+
+def _encode_cursor(job: dict) -> str:
+    raw = json.dumps([job["created_at"], job["id"]]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def _decode_cursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, job_id = json.loads(raw)
+        # created_at ends up in a PostgREST filter, so it has to look like a timestamp
+        if not isinstance(created_at, str) or not _TIMESTAMP.fullmatch(created_at):
+            raise ValueError("cursor created_at is not a timestamp")
+        return created_at, int(job_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _job_columns(fields: str = None, full: bool = False):
+    if fields:
+        columns = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = set(columns) - set(JOB_COLUMNS)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+        # Always include the keyset columns so the next cursor can be built
+        return ["id", "created_at"] + [c for c in columns if c not in ("id", "created_at")]
+    if full:
+        return None
+    return [c for c in JOB_COLUMNS if c not in LIST_MODE_EXCLUDED]
+
 @app.get("/jobs")
-async def get_jobs(status: str = None, company: str = None):
+async def get_jobs(request: Request, status: str = None, company: str = None, limit: int = JOBS_PAGE_SIZE,
+                   cursor: str = None, fields: str = None, full: bool = False):
+    """One page of jobs, newest first.
+
+    Pass the returned next_cursor back as `cursor` for the following page. `fields`
+    is a comma-separated projection; without it, description and skill_breakdown
+    are omitted unless full=true. `total` is only computed for the first page.
+    Honors If-None-Match against the store's data version.
+    """
+    limit = max(1, min(limit, JOBS_PAGE_SIZE_MAX))
+    columns = _job_columns(fields, full)
+    after = _decode_cursor(cursor) if cursor else None
+    status = status if status != "All" else None
+
+    def build_page():
+        # Fetch one extra row to learn whether another page exists
+        jobs = store.list_jobs(status=status, company=company, columns=columns,
+                               limit=limit + 1, after=after)
+        next_cursor = _encode_cursor(jobs[limit - 1]) if len(jobs) > limit else None
+        response = {"jobs": jobs[:limit], "next_cursor": next_cursor}
+        if after is None:
+            response["total"] = store.count(status=status, company=company)
+        return response
+
+    def respond():
+        # The version lookup and the page are storage round trips, so neither runs on the event loop
+        return conditional_response(request, store.data_version(), build_page)
+
     try:
-        print("🔄 DEBUG: Starting get_jobs")
-        print(f"🔄 DEBUG: Status: {status}, Company: {company}")
-        
-        # Test Supabase connection first
-        print("🔄 DEBUG: Testing Supabase connection...")
-        test = supabase.table("jobs").select("count").execute()
-        print("✅ DEBUG: Supabase connection works")
-        
-        query = supabase.table("jobs").select("*")
-        if status and status != "All":
-            query = query.eq("status", status)
-        if company:
-            query = query.ilike("company", f"%{company}%")
-        
-        print("🔄 DEBUG: Executing query...")
-        result = query.execute()
-        print(f"✅ DEBUG: Got {len(result.data)} jobs")
-        
-        return {"jobs": result.data}
+        return await run_in_threadpool(respond)
     except Exception as e:
-        print(f"❌ CRITICAL ERROR in /jobs: {e}")
-        import traceback
-        print(f"❌ TRACEBACK: {traceback.format_exc()}")
+        logger.exception("GET /jobs failed")
         raise HTTPException(status_code=500, detail=str(e))
 
+JOBS_RANK_LIMIT_MAX = 1000
+
+@app.get("/jobs/rank")
+async def rank_jobs(resume_version: str, limit: int = 20, status: str = None):
+    """Stored jobs ranked by text similarity to a resume profile, best first.
+
+    Uses the local TF-IDF index (no OpenAI calls); `similarity` is a cosine in
+    [0, 1]. Handy for deciding which postings deserve a full LLM score.
+    """
+    profile = await run_in_threadpool(resume_profiles.get, resume_version)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Unknown resume_version")
+    limit = max(1, min(limit, JOBS_RANK_LIMIT_MAX))
+    status = status if status != "All" else None
+    jobs = await run_in_threadpool(job_index.rank, profile["normalized_text"], limit, status)
+    return {"resume_version": resume_version, "indexed": job_index.size, "jobs": jobs}
+
+JOBS_SEARCH_LIMIT_MAX = 200
+
+@app.get("/jobs/search")
+async def search_jobs(q: str, status: str = None, limit: int = 20, offset: int = 0):
+    """Jobs whose title, company or description match `q`, best BM25 match first.
+
+    Every word must match (stemmed, so "pipelines" finds "pipeline"); use
+    "quoted phrases", -word to exclude and prefix* for word prefixes. `status`
+    takes a comma-separated list. Each hit carries a description snippet with
+    the matched words in <mark> tags.
+    """
+    limit = max(1, min(limit, JOBS_SEARCH_LIMIT_MAX))
+    statuses = [s.strip() for s in (status or "").split(",") if s.strip() and s.strip() != "All"]
+    try:
+        total, jobs = await run_in_threadpool(search_index.search, q, statuses, limit, max(0, offset))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"query": q, "total": total, "indexed": search_index.size, "jobs": jobs}
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: int, fields: str = None):
+    job = await run_in_threadpool(store.get, job_id, columns=_job_columns(fields, full=True))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {"job": job}
+
+def _job_row(job_data: dict, result: dict, resume_version: str = None) -> dict:
+    return {
+        "title": job_data["title"],
+        "company": job_data["company"],
+        "description": job_data["description"],
+        **_score_columns(result),
+        "status": job_data.get("status", "wishlist"),
+        "resume_version": job_data.get("resume_version", resume_version),
+        "notes": job_data.get("notes"),
+        "duplicate_of": job_data.get("duplicate_of"),
+    }
+
+# What a near-duplicate's stored row must provide for its score to be reused
+DUPLICATE_SOURCE_COLUMNS = ["id", "match_score", "strengths", "gaps", "skill_breakdown", "resume_version",
+                            "scoring_status"]
+
+def _find_duplicate(job_data: dict, resume_version: str):
+    """The stored posting this one near-duplicates (same company), or None.
+
+    Returns {"duplicate_of", "similarity", "score"}; score is the stored row when
+    it was scored against the same resume version and can be reused as is.
+    """
+    match = duplicate_index.find(job_data.get("company"), job_data.get("description"))
+    if match is None:
+        return None
+    existing = store.get(match[0], columns=DUPLICATE_SOURCE_COLUMNS)
+    if existing is None:
+        return None  # deleted since it was indexed
+    reusable = (existing["resume_version"] == resume_version and existing["match_score"] is not None
+                and existing["scoring_status"] in (None, "done"))
+    return {"duplicate_of": existing["id"], "similarity": match[1], "score": existing if reusable else None}
+
+def _duplicate_summary(duplicate: dict) -> dict:
+    return {"duplicate_of": duplicate["duplicate_of"], "similarity": duplicate["similarity"],
+            "score_reused": duplicate["score"] is not None}
+
 @app.post("/jobs")
-async def create_job(job_data: dict):
+async def create_job(job_data: dict, async_scoring: bool = None, skip_duplicates: bool = False):
+    """Score a posting against the resume and store it.
+
+    With async_scoring=true (or ASYNC_SCORING set), the row is inserted right away
+    with scoring_status "pending" and 202 is returned; a scoring worker fills in
+    the match fields later. Poll GET /jobs/{id}?fields=scoring_status,match_score.
+
+    A near-duplicate of a stored posting by the same company (DUPLICATE_SIMILARITY)
+    is stored with duplicate_of set, reusing that posting's score when it was
+    scored against the same resume version; with skip_duplicates=true it is not
+    stored at all.
+    """
     try:
-        print("🔄 DEBUG: Starting create_job")
-        print(f"📝 DEBUG: Job data received: {job_data}")
+        profile = await run_in_threadpool(resolve_profile, job_data.get("resume_text"), job_data.get("resume_version"))
+        if profile is None:
+            raise HTTPException(status_code=400, detail="resume_text or a known resume_version is required")
+        
+        duplicate = await run_in_threadpool(_find_duplicate, job_data, profile["resume_version"])
+        if duplicate is not None:
+            if skip_duplicates:
+                return {"message": "Duplicate of a stored job; not added", "duplicate": _duplicate_summary(duplicate)}
+            job_data = {**job_data, "duplicate_of": duplicate["duplicate_of"]}
+            if duplicate["score"] is not None:
+                job = await run_in_threadpool(store.insert,
+                                              _job_row(job_data, duplicate["score"], profile["resume_version"]))
+                return {"message": "Job added as a duplicate; score reused", "job": job,
+                        "duplicate": _duplicate_summary(duplicate)}
+        
+        if async_scoring if async_scoring is not None else ASYNC_SCORING:
+            pending = {"match_score": None, "strengths": None, "gaps": None, "skill_breakdown": []}
+            row = {**_job_row(job_data, pending, profile["resume_version"]), "scoring_status": "pending"}
+            job = await run_in_threadpool(store.insert, row)
+            await scoring_queue.enqueue(job["id"], profile["resume_version"])
+            return JSONResponse(status_code=202,
+                                content={"message": "Job added; scoring in progress", "job": job},
+                                headers={"Location": f"/jobs/{job['id']}"})
         
         # Run AI match scoring
-        result = get_match_score(job_data["resume_text"], job_data["description"])
-        print(f"🤖 DEBUG: AI match result: {result}")
+        result = await get_match_score_async(profile["normalized_text"], job_data["description"], profile)
         
         # Insert into database
-        data = supabase.table("jobs").insert({
-            "title": job_data["title"],
-            "company": job_data["company"],
-            "description": job_data["description"],
-            "match_score": result["match_score"],
-            "strengths": result["strengths"],
-            "gaps": result["gaps"],
-            "skill_breakdown": result.get("skill_breakdown", []),
-            "status": job_data.get("status", "wishlist"),
-            "resume_version": job_data.get("resume_version"),
-            "notes": job_data.get("notes")
-        }).execute()
-        
-        print("✅ DEBUG: Job inserted successfully")
-        return {"message": "Job added successfully", "job": data.data[0]}
+        job = await run_in_threadpool(store.insert, _job_row(job_data, result, profile["resume_version"]))
+        logger.debug("Job created", extra={"job_id": job["id"], "match_score": result["match_score"]})
+        return {"message": "Job added successfully", "job": job}
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ CRITICAL ERROR in /jobs POST: {e}")
-        import traceback
-        print(f"❌ FULL TRACEBACK: {traceback.format_exc()}")
+        # The payload is not logged: it carries the full resume text
+        logger.exception("POST /jobs failed")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/analytics/top-companies")
-async def get_top_companies():
+BULK_INSERT_BATCH_SIZE = int(os.getenv("BULK_INSERT_BATCH_SIZE", "100"))
+# Most jobs one batch request may carry or touch: POST /jobs/bulk postings, and
+# PATCH/DELETE /jobs/bulk rows, filters included
+JOBS_BATCH_MAX = 1000
+
+@app.post("/jobs/bulk")
+async def create_jobs_bulk(payload: dict):
+    """Score many postings against one resume and insert them in batches.
+
+    Body: {"resume_text": str?, "resume_version": str?, "skip_duplicates": bool?,
+           "jobs": [{title, company, description, ...}]}
+    The resume comes from the stored profile for resume_version when there is one.
+    Scoring runs concurrently (paced by llm_scheduler); each item reports
+    its own success or error so one bad row does not fail the rest. Near-duplicates
+    of stored postings are handled as in POST /jobs; items skipped as duplicates
+    report "skipped": true.
+    """
+    jobs = payload.get("jobs")
+    profile = await run_in_threadpool(resolve_profile, payload.get("resume_text"), payload.get("resume_version"))
+    if profile is None or not isinstance(jobs, list):
+        raise HTTPException(status_code=400,
+                            detail="resume_text or a known resume_version, and a list of jobs, are required")
+    if len(jobs) > JOBS_BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"A batch may carry at most {JOBS_BATCH_MAX} jobs")
+
+    results = [None] * len(jobs)
+    valid = []
+    for index, job_data in enumerate(jobs):
+        missing = [f for f in ("title", "company", "description")
+                   if not isinstance(job_data, dict) or not job_data.get(f)]
+        if missing:
+            results[index] = {"index": index, "success": False, "error": f"Missing fields: {', '.join(missing)}"}
+            continue
+        duplicate = await run_in_threadpool(_find_duplicate, job_data, profile["resume_version"])
+        if duplicate is None:
+            valid.append((index, job_data, None))
+        elif payload.get("skip_duplicates"):
+            results[index] = {"index": index, "success": True, "skipped": True,
+                              "duplicate": _duplicate_summary(duplicate)}
+        else:
+            valid.append((index, {**job_data, "duplicate_of": duplicate["duplicate_of"]}, duplicate["score"]))
+
+    to_score = [(index, job_data) for index, job_data, reused in valid if reused is None]
+    match_results = await get_match_scores_async(
+        profile["normalized_text"], [job["description"] for _, job in to_score], profile)
+    scores = dict(zip((index for index, _ in to_score), match_results))
+    scored = [(index, _job_row(job_data, reused if reused is not None else scores[index], profile["resume_version"]))
+              for index, job_data, reused in valid]
+
+    for start in range(0, len(scored), BULK_INSERT_BATCH_SIZE):
+        batch = scored[start:start + BULK_INSERT_BATCH_SIZE]
+        try:
+            inserted = await run_in_threadpool(store.insert_many, [row for _, row in batch])
+            for (index, _), job in zip(batch, inserted):
+                results[index] = {"index": index, "success": True, "job": job}
+        except Exception:
+            # Retry the failed batch row by row to isolate the bad rows
+            for index, row in batch:
+                try:
+                    job = await run_in_threadpool(store.insert, row)
+                    results[index] = {"index": index, "success": True, "job": job}
+                except Exception as e:
+                    results[index] = {"index": index, "success": False, "error": str(e)}
+
+    inserted_count = sum(1 for r in results if "job" in r)
+    skipped_count = sum(1 for r in results if r.get("skipped"))
+    return {
+        "inserted": inserted_count,
+        "skipped": skipped_count,
+        "failed": len(results) - inserted_count - skipped_count,
+        "results": results
+    }
+
+# Columns PATCH may change; the posting and its scores come from POST /jobs and scoring
+UPDATABLE_COLUMNS = ["status", "notes", "resume_version"]
+def _job_changes(data: dict) -> dict:
+    """The column changes in a request object (its id and updated_at aside), validated."""
+    changes = {k: v for k, v in data.items() if k not in ("id", "updated_at")}
+    unknown = set(changes) - set(UPDATABLE_COLUMNS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Not updatable: {', '.join(sorted(unknown))}")
+    if "status" in changes and changes["status"] not in JOB_STATUSES:
+        raise HTTPException(status_code=400, detail=f"status must be one of {', '.join(JOB_STATUSES)}")
+    return changes
+
+def _timestamp(value, name: str):
+    """`value` if it is an ISO timestamp (or None), else 400."""
+    if value is None or (isinstance(value, str) and _TIMESTAMP.fullmatch(value)):
+        return value
+    raise HTTPException(status_code=400, detail=f"{name} must be an ISO 8601 timestamp")
+
+def _versioned(row: dict) -> dict:
+    """{"id", "updated_at"?} of a selected row; updated_at only when the caller gave one."""
+    if "updated_at" not in row:
+        return {"id": row["id"]}
+    return {"id": row["id"], "updated_at": _timestamp(row["updated_at"], "updated_at")}
+
+async def _batch_selection(payload: dict) -> list:
+    """The rows a batch PATCH/DELETE body selects, as request objects carrying "id".
+
+    Exactly one of "jobs" ([{"id", "updated_at"?, ...}]), "ids" or "filter"
+    ({"status"?, "company"?}). Rows selected by a filter carry the updated_at
+    they had when read, so ones changed before the write count as conflicts.
+    """
+    given = [key for key in ("jobs", "ids", "filter") if payload.get(key) is not None]
+    if len(given) != 1:
+        raise HTTPException(status_code=400, detail="Exactly one of jobs, ids or filter is required")
+    if "filter" in given:
+        filters = payload["filter"]
+        if not isinstance(filters, dict) or not (filters.get("status") or filters.get("company")):
+            raise HTTPException(status_code=400, detail="filter needs a status or company")
+        rows = await run_in_threadpool(store.list_jobs, status=filters.get("status"),
+                                       company=filters.get("company"), columns=["id", "updated_at"],
+                                       limit=JOBS_BATCH_MAX + 1)
+    elif "ids" in given:
+        rows = [{"id": job_id} for job_id in payload["ids"]] if isinstance(payload["ids"], list) else None
+    else:
+        rows = payload["jobs"] if isinstance(payload["jobs"], list) else None
+    if rows is None or not all(isinstance(row, dict) and isinstance(row.get("id"), int) for row in rows):
+        raise HTTPException(status_code=400, detail="ids must be integers and jobs objects with an integer id")
+    if len(rows) > JOBS_BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"A batch may touch at most {JOBS_BATCH_MAX} jobs")
+    return rows
+
+def _missed(rows: list, done_ids: set) -> dict:
+    """Selected rows a batch did not touch: deleted meanwhile, or changed since the caller's updated_at."""
+    conflicts, not_found = [], []
+    for row in rows:
+        if row["id"] in done_ids:
+            continue
+        current = store.get(row["id"], columns=["id", "updated_at"]) if "updated_at" in row else None
+        if current is None:
+            not_found.append(row["id"])
+        else:
+            conflicts.append(current)
+    return {"conflicts": conflicts, "not_found": not_found}
+
+@app.patch("/jobs/bulk")
+async def update_jobs_bulk(payload: dict):
+    """Update many jobs in one grouped write.
+
+    Body: {"changes": {status?, notes?, resume_version?}?, plus one of
+           "jobs": [{"id", "updated_at"?, ...per-job changes}], "ids": [int],
+           "filter": {"status"?, "company"?}}
+    A job given with updated_at is only changed if it still has it (optimistic
+    concurrency); otherwise it is listed under "conflicts" with its current
+    updated_at. Listeners (analytics, indexes, the change feed) hear about the
+    batch once.
+    """
+    rows = await _batch_selection(payload)
+    common = _job_changes(payload.get("changes") or {})
+    changes = [{**common, **_job_changes(row)} for row in rows]
+    if not all(changes):
+        raise HTTPException(status_code=400, detail="Nothing to update")
+    changes = [{**change, **_versioned(row)} for change, row in zip(changes, rows)]
     try:
-        # Get all jobs data
-        result = supabase.table("jobs").select("company, match_score, title").execute()
-        
-        from collections import defaultdict
-        company_scores = defaultdict(list)
-        company_jobs = defaultdict(list)
-        
-        for job in result.data:
-            company_scores[job['company']].append(job['match_score'])
-            company_jobs[job['company']].append(job)
-        
-        # Calculate averages - include all companies now (removed the 2+ applications requirement)
-        top_companies = []
-        for company, scores in company_scores.items():
-            avg_score = sum(scores) / len(scores)
-            top_companies.append({
-                'company': company,
-                'avg_match_score': round(avg_score, 1),
-                'application_count': len(scores)
-            })
-        
-        # Sort by average score and take top 5
-        top_companies.sort(key=lambda x: x['avg_match_score'], reverse=True)
-        return {"top_companies": top_companies[:5]}
-        
+        updated = await run_in_threadpool(store.update_many, changes)
+        missed = await run_in_threadpool(_missed, rows, {job["id"] for job in updated})
     except Exception as e:
+        logger.exception("PATCH /jobs/bulk failed")
         raise HTTPException(status_code=500, detail=str(e))
+    return {"updated": len(updated), "jobs": [{"id": job["id"], "updated_at": job["updated_at"]} for job in updated],
+            **missed}
 
-@app.get("/analytics/application-funnel")
-async def get_application_funnel():
+async def _not_changed(row: dict) -> HTTPException:
+    """409 with the current updated_at if the job exists but moved on, else 404."""
+    missed = await run_in_threadpool(_missed, [row], set())
+    if missed["conflicts"]:
+        return HTTPException(status_code=409, detail={"message": "Job was changed since updated_at",
+                                                      "updated_at": missed["conflicts"][0]["updated_at"]})
+    return HTTPException(status_code=404, detail="Job not found")
+
+@app.delete("/jobs/bulk")
+async def delete_jobs_bulk(payload: dict):
+    """Delete many jobs in one grouped write.
+
+    Body: one of "jobs": [{"id", "updated_at"?}], "ids": [int] or
+    "filter": {"status"?, "company"?}. updated_at works as in PATCH /jobs/bulk.
+    """
+    rows = await _batch_selection(payload)
     try:
-        # Get count of jobs by status
-        result = supabase.table("jobs").select("status").execute()
-        
-        status_counts = {
-            'wishlist': 0,
-            'applied': 0,
-            'interview': 0,
-            'offer': 0,
-            'rejected': 0
-        }
-        
-        for job in result.data:
-            status = job['status']
-            if status in status_counts:
-                status_counts[status] += 1
-        
-        return {"funnel": status_counts}
-        
+        deleted = await run_in_threadpool(store.delete_many, [_versioned(row) for row in rows])
+        missed = await run_in_threadpool(_missed, rows, set(deleted))
     except Exception as e:
+        logger.exception("DELETE /jobs/bulk failed")
         raise HTTPException(status_code=500, detail=str(e))
+    return {"deleted": len(deleted), "ids": deleted, **missed}
+
+@app.patch("/jobs/{job_id}")
+async def update_job(job_id: int, job_data: dict):
+    """Change a job's status, notes or resume_version.
+
+    With "updated_at" in the body, the change is only made if the job still has
+    it; 409 (with the current updated_at) otherwise.
+    """
+    changes = _job_changes(job_data)
+    if not changes:
+        raise HTTPException(status_code=400, detail="Nothing to update")
+    row = _versioned({**job_data, "id": job_id})
+    job = await run_in_threadpool(store.update, job_id, {**changes, **row})
+    if job is None:
+        raise await _not_changed(row)
+    return {"job": job}
+
+@app.delete("/jobs/{job_id}")
+async def delete_job(job_id: int, updated_at: str = None):
+    """Delete a job; with `updated_at`, only if it still has it (409 otherwise)."""
+    row = _versioned({"id": job_id, **({"updated_at": updated_at} if updated_at is not None else {})})
+    if not await run_in_threadpool(store.delete_many, [row]):
+        raise await _not_changed(row)
+    return {"deleted": job_id}
+
+@app.post("/rescore")
+async def start_rescore(payload: dict):
+    """Re-score stored jobs against a resume version in the background.
+
+    Body: {"resume_version": str, "status": str?, "min_similarity": float?}
+    With min_similarity, jobs whose /jobs/rank similarity is below it get the
+    keyword score instead of an LLM call. Poll GET /rescore/{run_id} for progress.
+    """
+    resume_version = payload.get("resume_version")
+    if await run_in_threadpool(resume_profiles.get, resume_version) is None:
+        raise HTTPException(status_code=404, detail="Unknown resume_version")
+    status = payload.get("status") if payload.get("status") != "All" else None
+    run = await rescore_runs.start(store, resume_version, status, payload.get("min_similarity"))
+    return JSONResponse(status_code=202, content=run, headers={"Location": f"/rescore/{run['run_id']}"})
+
+@app.get("/rescore/{run_id}")
+async def get_rescore(run_id: str):
+    """Progress of a re-score run, with throughput and ETA."""
+    run = await run_in_threadpool(rescore_runs.get, run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Unknown re-score run")
+    return run
+
+@app.post("/rescore/{run_id}/cancel")
+async def cancel_rescore(run_id: str):
+    run = await rescore_runs.cancel(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Unknown re-score run")
+    return run
+
+@app.get("/resumes/{resume_version}")
+async def get_resume_profile(resume_version: str):
+    profile = await run_in_threadpool(resume_profiles.get, resume_version)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Unknown resume_version")
+    return {key: value for key, value in profile.items() if key != "normalized_text"}
+
+@app.get("/scoring/queue")
+async def get_scoring_queue():
+    """Depth of the scoring queue: ready, waiting on a retry, and being scored."""
+    return await run_in_threadpool(scoring_queue.depth)
+
+EVENTS_KEEPALIVE_SECONDS = 15
+
+def _sse_response(stream) -> StreamingResponse:
+    # identity encoding keeps the compression middleware from buffering the stream
+    return StreamingResponse(stream, media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "Content-Encoding": "identity",
+                                      "X-Accel-Buffering": "no"})
+
+@app.get("/events")
+async def stream_events(request: Request):
+    """Server-Sent Events feed of job changes.
+
+    `job` events carry {"kind": insert|update|delete|scored, "rows": [...]} with
+    rows as stored (minus description); deletes carry only ids. Each burst of job
+    events is followed by one `analytics` event with the dashboard snapshot. Event
+    ids are log positions, so a reconnecting EventSource resumes via Last-Event-ID.
+    """
+    last_event_id = request.headers.get("last-event-id")
+    queue = event_log.subscribe()
+
+    async def stream():
+        try:
+            sent = event_log.last_seq
+            yield "retry: 2000\n\n"
+            if last_event_id and last_event_id.isdigit():
+                sent = int(last_event_id)
+                for event in await run_in_threadpool(event_log.since, sent):
+                    sent = event["seq"]
+                    yield format_sse("job", {"kind": event["kind"], "rows": client_rows(event["rows"])}, sent)
+            # Give the client a position to resume from, plus the current dashboard
+            yield format_sse("analytics", analytics.snapshot(), sent)
+
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=EVENTS_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                batch = [event]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+                for event in batch:
+                    if event is None:
+                        return  # dropped for falling behind; the client reconnects
+                    if event["seq"] <= sent:
+                        continue
+                    sent = event["seq"]
+                    yield format_sse("job", {"kind": event["kind"], "rows": client_rows(event["rows"])}, sent)
+                yield format_sse("analytics", analytics.snapshot(), sent)
+        finally:
+            event_log.unsubscribe(queue)
+
+    return _sse_response(stream())
+
+@app.post("/match/stream")
+async def stream_match(payload: dict):
+    """Score a job description against a resume, streaming partial results as SSE.
+
+    Body: {"description": str, "resume_text": str?, "resume_version": str?}
+    Emits `field` events (match_score, strengths, gaps) and one `skill` event per
+    skill_breakdown entry as soon as each is complete, then `result` with the
+    full result. Malformed model output produces `error` and the keyword score.
+    Nothing is stored; use POST /jobs to save the job.
+    """
+    description = payload.get("description")
+    profile = await run_in_threadpool(resolve_profile, payload.get("resume_text"), payload.get("resume_version"))
+    if profile is None or not description:
+        raise HTTPException(status_code=400,
+                            detail="description and resume_text or a known resume_version are required")
+
+    async def stream():
+        async for event, data in stream_match_score(profile["normalized_text"], description, profile):
+            yield format_sse(event, data)
+
+    return _sse_response(stream())
+
+@app.get("/llm/cache-stats")
+async def get_cache_stats():
+    return match_cache.stats()
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus exposition: request, job store, LLM, resume parsing and analytics timings."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+@app.get("/llm/scheduler-stats")
+async def get_scheduler_stats():
+    """Queued calls, coalesced duplicates, 429s and retries of this worker's LLM scheduler."""
+    return llm_scheduler.stats()
+
+def _analytics_response(request: Request, build_payload):
+    return conditional_response(request, f"{WORKER_ID}:{analytics.generation}", build_payload)
+
+@app.get("/analytics/dashboard")
+async def get_dashboard(request: Request):
+    """Funnel, top companies, skill gaps and weekly trends in one response."""
+    return _analytics_response(request, analytics.snapshot)
+
+@app.get("/analytics/top-companies")
+async def get_top_companies(request: Request):
+    return _analytics_response(request, lambda: {"top_companies": analytics.top_companies()})
+
+@app.get("/analytics/application-funnel")
+async def get_application_funnel(request: Request):
+    return _analytics_response(request, lambda: {"funnel": analytics.funnel()})
 
 @app.get("/analytics/skills-gap-analysis")
-async def get_skills_gap_analysis():
-    try:
-        # Get all skill breakdowns to find common gaps
-        result = supabase.table("jobs").select("skill_breakdown").execute()
-        
-        gap_skills = {}
-        
-        for job in result.data:
-            if job.get('skill_breakdown'):
-                for skill in job['skill_breakdown']:
-                    if skill['match_level'] in ['missing', 'partial']:
-                        skill_name = skill['skill']
-                        if skill_name not in gap_skills:
-                            gap_skills[skill_name] = 0
-                        gap_skills[skill_name] += 1
-        
-        # Sort by frequency and get top 5
-        common_gaps = [{'skill': skill, 'frequency': count} 
-                      for skill, count in sorted(gap_skills.items(), 
-                                               key=lambda x: x[1], 
-                                               reverse=True)[:5]]
-        
-        return {"common_gaps": common_gaps}
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def get_skills_gap_analysis(request: Request):
+    return _analytics_response(request, lambda: {"common_gaps": analytics.common_gaps()})
 
 @app.get("/analytics/monthly-trends")
-async def get_monthly_trends():
-    try:
-        # Get applications by week for better trend data
-        result = supabase.table("jobs").select("created_at, match_score").execute()
-        
-        from collections import defaultdict
-        from datetime import datetime, timedelta
-        
-        # Generate last 4 weeks of data
-        weekly_data = defaultdict(lambda: {'count': 0, 'total_score': 0})
-        
-        for job in result.data:
-            if job.get('created_at'):
-                job_date = datetime.fromisoformat(job['created_at'].replace('Z', '+00:00'))
-                # Group by week
-                week_start = job_date - timedelta(days=job_date.weekday())
-                week_key = week_start.strftime('%b %d')
-                weekly_data[week_key]['count'] += 1
-                weekly_data[week_key]['total_score'] += job['match_score']
-        
-        # If no data, generate sample trends
-        if not weekly_data:
-            sample_weeks = ['Week 1', 'Week 2', 'Week 3', 'Week 4']
-            trends = []
-            for i, week in enumerate(sample_weeks):
-                trends.append({
-                    'month': week,
-                    'applications': [12, 18, 8, 15][i],
-                    'avg_match_score': [75, 82, 65, 78][i]
-                })
-            return {"monthly_trends": trends}
-        
-        # Calculate averages and format for chart
-        trends = []
-        for week, data in sorted(weekly_data.items()):
-            avg_score = data['total_score'] / data['count'] if data['count'] > 0 else 0
-            trends.append({
-                'month': week,
-                'applications': data['count'],
-                'avg_match_score': round(avg_score, 1)
-            })
-        
-        return {"monthly_trends": trends[-4:]}  # Last 4 weeks
-        
-    except Exception as e:
-        print(f"Trends error: {e}")
-        # Return sample data on error
-        return {"monthly_trends": [
-            {'month': 'Week 1', 'applications': 12, 'avg_match_score': 75},
-            {'month': 'Week 2', 'applications': 18, 'avg_match_score': 82},
-            {'month': 'Week 3', 'applications': 8, 'avg_match_score': 65},
-            {'month': 'Week 4', 'applications': 15, 'avg_match_score': 78}
-        ]}
\ No newline at end of file
+async def get_monthly_trends(request: Request):
+    # Grouped by week for better trend data; last 4 weeks
+    return _analytics_response(request, lambda: {"monthly_trends": analytics.weekly_trends()})
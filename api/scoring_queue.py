@@ -0,0 +1,166 @@
+# api/scoring_queue.py
+# Durable queue of jobs waiting for a match score. POST /jobs can insert the row
+# right away and leave the LLM round trip to these workers.
+
+import asyncio
+import os
+import random
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from telemetry import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scoring_tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER NOT NULL,
+    resume_version TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    -- A worker owns a task until this time; expired leases are picked up again,
+    -- which is how tasks held by a crashed process get retried
+    leased_until REAL NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_scoring_tasks_due ON scoring_tasks (next_attempt_at);
+"""
+
+Handler = Callable[[Dict[str, Any]], Awaitable[None]]
+FailureHandler = Callable[[Dict[str, Any], str], Awaitable[None]]
+
+
+class ScoringQueue:
+    """SQLite-backed task queue shared by every worker process on the host.
+
+    `workers` coroutines per process claim due tasks with a lease and run
+    `handler(task)`. A task that raises is retried with exponential backoff up to
+    `max_attempts` times, after which `on_failure(task, error)` is called and the
+    task is dropped. Queue reads and writes run in the threadpool, since a
+    database locked by another process can hold them for up to 10 seconds.
+    """
+
+    def __init__(self, path: str, workers: int = 4, max_attempts: int = 5,
+                 backoff_seconds: float = 2.0, lease_seconds: float = 300.0,
+                 poll_seconds: float = 1.0):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=10)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        with self._lock:
+            return self._db.execute(sql, params)
+
+    def _fetchone(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        with self._lock:
+            return self._db.execute(sql, params).fetchone()
+
+    async def enqueue(self, job_id: int, resume_version: str) -> None:
+        await run_in_threadpool(
+            self._execute,
+            "INSERT INTO scoring_tasks (job_id, resume_version, next_attempt_at) VALUES (?, ?, ?)",
+            (job_id, resume_version, time.time()),
+        )
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _claim(self) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        row = self._fetchone(
+            "UPDATE scoring_tasks SET leased_until = ?, attempts = attempts + 1"
+            " WHERE id = (SELECT id FROM scoring_tasks"
+            "             WHERE next_attempt_at <= ? AND leased_until <= ?"
+            "             ORDER BY next_attempt_at LIMIT 1)"
+            " RETURNING id, job_id, resume_version, attempts",
+            (now + self.lease_seconds, now, now),
+        )
+        if row is None:
+            return None
+        return {"id": row[0], "job_id": row[1], "resume_version": row[2], "attempts": row[3]}
+
+    def _complete(self, task: Dict[str, Any]) -> None:
+        self._execute("DELETE FROM scoring_tasks WHERE id = ?", (task["id"],))
+
+    def _retry_later(self, task: Dict[str, Any], error: str) -> None:
+        delay = self.backoff_seconds * (2 ** (task["attempts"] - 1)) * random.uniform(0.8, 1.2)
+        self._execute(
+            "UPDATE scoring_tasks SET next_attempt_at = ?, leased_until = 0, last_error = ? WHERE id = ?",
+            (time.time() + delay, error, task["id"]),
+        )
+
+    def depth(self) -> Dict[str, int]:
+        now = time.time()
+        ready, delayed, in_progress = self._fetchone(
+            "SELECT"
+            " COALESCE(SUM(leased_until <= ? AND next_attempt_at <= ?), 0),"
+            " COALESCE(SUM(leased_until <= ? AND next_attempt_at > ?), 0),"
+            " COALESCE(SUM(leased_until > ?), 0)"
+            " FROM scoring_tasks",
+            (now, now, now, now, now),
+        )
+        return {"ready": ready, "retry_scheduled": delayed, "in_progress": in_progress,
+                "total": ready + delayed + in_progress, "workers": self.workers}
+
+    async def _worker(self, handler: Handler, on_failure: FailureHandler) -> None:
+        while True:
+            task = await run_in_threadpool(self._claim)
+            if task is None:
+                self._wakeup.clear()
+                try:
+                    # Also polls for retries coming due and tasks queued by other processes
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await handler(task)
+                await run_in_threadpool(self._complete, task)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if task["attempts"] >= self.max_attempts:
+                    logger.error("Scoring job failed on its last attempt", extra={
+                        "job_id": task["job_id"], "attempts": task["attempts"], "error": str(e)})
+                    await run_in_threadpool(self._complete, task)
+                    try:
+                        await on_failure(task, str(e))
+                    except Exception:
+                        logger.exception("Scoring failure handler failed", extra={"job_id": task["job_id"]})
+                else:
+                    await run_in_threadpool(self._retry_later, task, str(e))
+
+    def start(self, handler: Handler, on_failure: FailureHandler) -> None:
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._worker(handler, on_failure)) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+DEFAULT_QUEUE_PATH = Path(__file__).resolve().parent.parent / ".data" / "scoring_queue.sqlite3"
+
+scoring_queue = ScoringQueue(
+    path=os.getenv("SCORING_QUEUE_PATH", str(DEFAULT_QUEUE_PATH)),
+    workers=int(os.getenv("SCORING_WORKERS", "4")),
+    max_attempts=int(os.getenv("SCORING_MAX_ATTEMPTS", "5")),
+    backoff_seconds=float(os.getenv("SCORING_BACKOFF_SECONDS", "2")),
+)
@@ -1,16 +1,36 @@
+import math
 import os
+
+import pandas as pd
 import streamlit as st
 from dotenv import load_dotenv
-from supabase import create_client
+from storage import JOB_COLUMNS, JOB_STATUSES, get_job_store
 
 # ======================
 # Setup
 # ======================
 load_dotenv()
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+# After load_dotenv, so EVENTS_PATH from .env points at the API's log
+from api.events import event_log
+
+
+@st.cache_resource
+def job_store():
+    store = get_job_store()
+    # Edits saved here go into the API's shared change feed, so its analytics, search,
+    # duplicate and /jobs/rank indexes and SSE clients hear about them
+    store.subscribe(event_log.append)
+    return store
+
 
-supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+store = job_store()
+
+# Seconds a fetched page or count is reused across reruns before storage is asked again
+CACHE_TTL_SECONDS = int(os.getenv("DASHBOARD_CACHE_TTL", "60"))
+PAGE_SIZES = [25, 50, 100, 200]
+# Heavy columns stay out of the table, as in GET /jobs list mode
+TABLE_COLUMNS = [c for c in JOB_COLUMNS if c not in ("description", "skill_breakdown")]
+EDITABLE_COLUMNS = ["status", "notes"]
 
 st.set_page_config(page_title="Job Tracker Pro", layout="wide")
 st.title("📊 Job Tracker Pro")
@@ -20,32 +40,60 @@ st.title("📊 Job Tracker Pro")
 # ======================
 status_filter = st.sidebar.selectbox(
     "Filter by status",
-    ["All", "wishlist", "applied", "interview", "offer", "rejected"]
+    ["All"] + JOB_STATUSES
 )
 company_filter = st.sidebar.text_input("Filter by company")
+page_size = st.sidebar.selectbox("Rows per page", PAGE_SIZES, index=1)
 
 # ======================
 # Query Jobs
 # ======================
-def fetch_jobs(status=None, company=None):
-    query = supabase.table("jobs").select("*")
-    if status and status != "All":
-        query = query.eq("status", status)
-    if company:
-        query = query.ilike("company", f"%{company}%")
-    return query.execute().data
+# Streamlit reruns this script on every widget interaction; these keep reruns
+# from going back to storage until the TTL passes or the dashboard writes
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def fetch_page(status, company, limit, after):
+    # One extra row tells whether there is a next page
+    return store.list_jobs(status=status, company=company or None, columns=TABLE_COLUMNS,
+                           limit=limit + 1, after=after)
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def count_jobs(status, company):
+    return store.count(status=status, company=company or None)
+
+def invalidate_cache():
+    fetch_page.clear()
+    count_jobs.clear()
 
-jobs = fetch_jobs(status_filter, company_filter)
+if st.sidebar.button("Refresh"):
+    invalidate_cache()
+
+status = status_filter if status_filter != "All" else None
+view = (status, company_filter, page_size)
+if st.session_state.get("view") != view:
+    # Keyset cursor of every page visited so far; back to the first page when filters change
+    st.session_state.view = view
+    st.session_state.cursors = [None]
+# Bumped after a save or discard so the editor starts from the stored rows again
+st.session_state.setdefault("editor_version", 0)
+cursors = st.session_state.cursors
+
+jobs = fetch_page(status, company_filter, page_size, cursors[-1])
+has_next = len(jobs) > page_size
+jobs = jobs[:page_size]
+total = count_jobs(status, company_filter)
 
 # ======================
 # Display
 # ======================
+if "save_warning" in st.session_state:
+    st.warning(st.session_state.pop("save_warning"))
+
 if not jobs:
     st.info("No jobs found. Try adjusting filters.")
 else:
     # Highlight match_score with colors
     def color_score(val):
-        if val is None:
+        if val is None or pd.isna(val):
             return ""
         if val >= 80:
             return "background-color: lightgreen"
@@ -54,7 +102,42 @@ else:
         else:
             return "background-color: lightcoral"
 
-    jobs_df = st.experimental_data_editor(jobs, num_rows="dynamic", use_container_width=True)
-    st.dataframe(
-        jobs_df.style.applymap(color_score, subset=["match_score"])
-    )
\ No newline at end of file
+    frame = pd.DataFrame(jobs, columns=TABLE_COLUMNS)
+    # Styled per column and for this page only; match_score is read-only, which Styler colors require
+    styled = frame.style.apply(lambda scores: [color_score(v) for v in scores], subset=["match_score"])
+
+    editor_key = f"jobs-{st.session_state.editor_version}-{view}-{len(cursors)}"
+    st.data_editor(
+        styled,
+        key=editor_key,
+        hide_index=True,
+        num_rows="fixed",
+        disabled=[c for c in TABLE_COLUMNS if c not in EDITABLE_COLUMNS],
+        column_config={"status": st.column_config.SelectboxColumn("status", options=JOB_STATUSES)},
+    )
+
+    page = len(cursors)
+    pages = max(1, math.ceil(total / page_size))
+    previous_col, next_col, info_col = st.columns([1, 1, 6])
+    previous_col.button("← Previous", disabled=page == 1, on_click=cursors.pop)
+    next_col.button("Next →", disabled=not has_next, on_click=cursors.append,
+                    args=((jobs[-1]["created_at"], jobs[-1]["id"]),))
+    info_col.caption(f"Page {page} of {pages} · {total} jobs")
+
+    # Only the cells changed in the editor are written, in one batch. Each row carries the
+    # updated_at it was read with, so rows changed elsewhere meanwhile are not overwritten
+    edited_rows = st.session_state[editor_key]["edited_rows"]
+    if edited_rows:
+        save_col, discard_col = st.columns([1, 7])
+        if save_col.button(f"Save {len(edited_rows)} changed rows", type="primary"):
+            saved = store.update_many([{"id": jobs[int(position)]["id"], "updated_at": jobs[int(position)]["updated_at"],
+                                        **changes} for position, changes in edited_rows.items()])
+            if len(saved) < len(edited_rows):
+                st.session_state.save_warning = (f"{len(edited_rows) - len(saved)} rows were changed or deleted "
+                                                 "elsewhere since they were loaded and were not saved.")
+            invalidate_cache()
+            st.session_state.editor_version += 1
+            st.rerun()
+        if discard_col.button("Discard changes"):
+            st.session_state.editor_version += 1
+            st.rerun()
@@ -0,0 +1,75 @@
+# benchmarks/bulk_import.py
+"""Compare importing N postings one POST /jobs at a time against one POST /jobs/bulk.
+
+The LLM is a local stub with configurable latency; the database is the local
+SQLite job store, committed per insert call like a remote round trip would be.
+
+    python benchmarks/bulk_import.py --jobs 200 --llm-latency 0.5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stubs import StubOpenAIServer, configure_offline_env
+
+RESUME = "Python and SQL ETL pipelines with Airflow and Docker."
+
+
+def _postings(n: int):
+    return [{
+        "title": f"Data Engineer {i}",
+        "company": f"Company {i % 25}",
+        # Distinct descriptions so the match cache does not short-circuit scoring
+        "description": f"Posting {i}. Required: Python, SQL, Spark. Nice to have: Kubernetes.",
+    } for i in range(n)]
+
+
+async def _run(n: int, workdir: str):
+    import httpx
+    from api import routes
+    from storage.sqlite_store import SQLiteJobStore
+
+    transport = httpx.ASGITransport(app=routes.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as http:
+        routes.store = SQLiteJobStore(os.path.join(workdir, "sequential.sqlite3"))
+        t0 = time.perf_counter()
+        for job in _postings(n):
+            await http.post("/jobs", json=dict(job, resume_text=RESUME))
+        sequential = time.perf_counter() - t0
+
+        routes.store = SQLiteJobStore(os.path.join(workdir, "bulk.sqlite3"))
+        # Different resume text keeps these requests out of the match cache
+        t0 = time.perf_counter()
+        response = await http.post("/jobs/bulk", json={"resume_text": RESUME + " ", "jobs": _postings(n)})
+        bulk = time.perf_counter() - t0
+
+    body = response.json()
+    print(f"sequential POST /jobs: {n} jobs in {sequential:.2f}s ({n / sequential:.1f} jobs/s)")
+    print(f"POST /jobs/bulk:       {body['inserted']} jobs in {bulk:.2f}s ({n / bulk:.1f} jobs/s), "
+          f"{body['failed']} failed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--llm-latency", type=float, default=0.5)
+    args = parser.parse_args()
+
+    stub = StubOpenAIServer(latency=args.llm_latency).start()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            configure_offline_env(stub, workdir)
+            asyncio.run(_run(args.jobs, workdir))
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# benchmarks/cold_start.py
+"""Measure worker cold start and connection reuse for outbound model calls.
+
+Starts fresh worker processes against the stub OpenAI and reports, per phase,
+how long a new worker takes to import the app, run its startup hooks, answer
+its first request and make its first and later scoring calls, plus how many
+TCP connections it opened to the model for those calls.
+
+    python benchmarks/cold_start.py --workers 5 --scores 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+
+from benchmarks.stubs import StubOpenAIServer, configure_offline_env
+
+PHASES = ("import", "startup", "first_request", "first_score", "later_score")
+RESUME = "Python and SQL ETL pipelines with Airflow and dbt."
+
+
+async def _worker(scores: int) -> dict:
+    """Runs inside a fresh process; times are seconds since the worker began importing the app."""
+    started = time.perf_counter()
+    from api.routes import app
+    timings = {"import": time.perf_counter() - started}
+
+    import httpx
+    from llm.match_engine import get_match_score_async
+
+    mark = time.perf_counter()
+    await app.router.startup()
+    timings["startup"] = time.perf_counter() - mark
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        mark = time.perf_counter()
+        (await http.get("/jobs")).raise_for_status()
+        timings["first_request"] = time.perf_counter() - mark
+    timings["ready"] = time.perf_counter() - started
+
+    later = []
+    for i in range(scores):
+        mark = time.perf_counter()
+        await get_match_score_async(RESUME, f"Data Engineer #{i} ({os.getpid()}). Required: Python, SQL.")
+        later.append(time.perf_counter() - mark)
+        timings.setdefault("scored", time.perf_counter() - started)
+    timings["first_score"] = later[0]
+    timings["later_score"] = statistics.median(later[1:]) if len(later) > 1 else later[0]
+
+    await app.router.shutdown()
+    return timings
+
+
+def _run_worker(scores: int) -> dict:
+    output = subprocess.run([sys.executable, __file__, "--worker", "--scores", str(scores)],
+                            cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=5)
+    parser.add_argument("--scores", type=int, default=10)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(asyncio.run(_worker(args.scores))))
+        return
+
+    stub = StubOpenAIServer(latency=0.0).start()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            configure_offline_env(stub, workdir)
+            # Unlimited budgets so pacing does not show up as connection time
+            os.environ["LLM_REQUESTS_PER_MINUTE"] = os.environ["LLM_TOKENS_PER_MINUTE"] = "1e9"
+            _run_worker(1)  # bytecode compilation and page cache
+            runs, connections = [], []
+            for _ in range(args.workers):
+                before = stub.connections
+                runs.append(_run_worker(args.scores))
+                connections.append(stub.connections - before)
+    finally:
+        stub.stop()
+
+    # ready: import to first response; scored: import to first scoring call answered
+    for phase in PHASES + ("ready", "scored"):
+        samples = [run[phase] * 1000 for run in runs]
+        print(f"{phase + ':':<15} median {statistics.median(samples):7.1f}ms  max {max(samples):7.1f}ms")
+    print(f"model connections per worker for {args.scores} scores: {statistics.median(connections):.0f}")
+
+
+if __name__ == "__main__":
+    main()
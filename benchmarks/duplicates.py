@@ -0,0 +1,119 @@
+# benchmarks/duplicates.py
+"""Accuracy and lookup latency of near-duplicate detection.
+
+Indexes --jobs postings spread over --companies companies, each posting a
+distinct role write-up plus its company's shared boilerplate. Then looks up
+reposted copies of some of them (the kind of edits aggregators make: a
+reworded line, an added location line, boilerplate cut off, different bullets
+and spacing) and as many new postings by the same companies. Reports how many
+reposts were found, how many new postings were wrongly matched, and the time
+to fingerprint and look up one posting.
+
+    python benchmarks/duplicates.py --jobs 50000 --probes 1000 --similarity 0.8
+"""
+
+import argparse
+import itertools
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from llm.duplicate_index import DuplicateIndex, minhash
+
+SYLLABLES = ["ba", "ko", "ri", "sen", "tal", "mu", "dor", "pe", "lin", "gar", "vo", "shi", "ne", "qua", "zel"]
+
+
+class PostingGenerator:
+    """Descriptions with realistic word statistics: a Zipf-distributed vocabulary,
+    a role write-up unique to each posting and boilerplate shared per company."""
+
+    def __init__(self, rng: random.Random, companies: int, vocabulary: int = 5000):
+        self.rng = rng
+        self.words = list({"".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4)))
+                           for _ in range(vocabulary * 2)})[:vocabulary]
+        self.cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(self.words) + 1)))
+        self.boilerplate = {f"Company {i}": ["About us"] + self.lines(6) + ["What we offer"] + self.lines(3, "- ")
+                            for i in range(companies)}
+
+    def lines(self, count: int, prefix: str = "") -> list:
+        return [prefix + " ".join(self.rng.choices(self.words, cum_weights=self.cum_weights, k=self.rng.randint(8, 16)))
+                for _ in range(count)]
+
+    def posting(self) -> dict:
+        company = self.rng.choice(list(self.boilerplate))
+        role = ["About the role"] + self.lines(self.rng.randint(6, 14)) + ["Requirements"] + \
+            self.lines(self.rng.randint(4, 8), "- ")
+        return {"company": company, "description": "\n".join(role + self.boilerplate[company])}
+
+    def repost(self, description: str) -> str:
+        """The same posting as an aggregator or a re-listing might show it."""
+        lines = description.split("\n")
+        edit = self.rng.randrange(4)
+        if edit == 0:
+            index = self.rng.randrange(1, len(lines))
+            lines[index] = self.lines(1)[0]
+        elif edit == 1:
+            lines.insert(1, self.rng.choice(["Location: Remote (US)", "Hybrid - 3 days in office",
+                                             "Reposted 2 days ago"]))
+        elif edit == 2:
+            lines = lines[:lines.index("What we offer")]
+        else:
+            lines = [("* " + line[2:]) if line.startswith("- ") else line for line in lines]
+        return "  \n".join(lines)
+
+
+def _ms(samples) -> str:
+    samples = sorted(samples)
+    return f"median {statistics.median(samples) * 1000:.3f}ms, p99 {samples[int(len(samples) * 0.99)] * 1000:.3f}ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=50000)
+    parser.add_argument("--companies", type=int, default=200)
+    parser.add_argument("--probes", type=int, default=1000)
+    parser.add_argument("--similarity", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generator = PostingGenerator(random.Random(args.seed), args.companies)
+    jobs = [{"id": i, **generator.posting()} for i in range(args.jobs + args.probes)]
+    indexed, unseen = jobs[:args.jobs], jobs[args.jobs:]
+
+    index = DuplicateIndex(args.similarity)
+    started = time.perf_counter()
+    index.apply("insert", indexed)
+    build = time.perf_counter() - started
+
+    originals = generator.rng.sample(indexed, args.probes)
+    probes = [(job["company"], generator.repost(job["description"]), job["id"]) for job in originals]
+    probes += [(job["company"], job["description"], None) for job in unseen]
+
+    found = false_matches = 0
+    hash_times, lookup_times = [], []
+    for company, description, expected in probes:
+        started = time.perf_counter()
+        signature = minhash(description)
+        hashed = time.perf_counter()
+        match = index.find(company, description, signature)
+        lookup_times.append(time.perf_counter() - hashed)
+        hash_times.append(hashed - started)
+        if expected is None:
+            false_matches += match is not None
+        elif match is not None and match[0] == expected:
+            found += 1
+
+    print(f"indexed {index.size} postings in {build:.1f}s "
+          f"({index.bands} LSH bands of {index.rows}, similarity >= {index.similarity})")
+    print(f"reposts found: {found}/{args.probes}")
+    print(f"new postings wrongly matched: {false_matches}/{len(unseen)}")
+    print(f"fingerprint: {_ms(hash_times)}")
+    print(f"lookup:      {_ms(lookup_times)}")
+
+
+if __name__ == "__main__":
+    main()
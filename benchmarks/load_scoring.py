@@ -0,0 +1,94 @@
+# benchmarks/load_scoring.py
+"""Show that read endpoints stay responsive while POST /jobs is waiting on the LLM.
+
+Runs the FastAPI app in-process against a stub OpenAI server with artificial
+latency and the local SQLite job store, fires a burst of job creations and
+samples GET /jobs and /analytics/* latency while they are in flight.
+
+    python benchmarks/load_scoring.py --creates 20 --llm-latency 2
+
+With --async-scoring, jobs are created with POST /jobs?async_scoring=true and the
+create latency is reported separately from the time until every job is scored.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stubs import StubOpenAIServer, configure_offline_env
+
+READ_PATHS = ["/jobs", "/analytics/top-companies", "/analytics/application-funnel"]
+
+
+async def _create(http, job, async_scoring: bool):
+    t0 = time.perf_counter()
+    response = await http.post("/jobs", json=job, params={"async_scoring": str(async_scoring).lower()})
+    return response, (time.perf_counter() - t0) * 1000
+
+
+async def _run(creates: int, reads: int, async_scoring: bool):
+    import httpx
+    from api import routes
+
+    # ASGITransport does not send lifespan events; start the scoring workers by hand
+    await routes.start_scoring_workers()
+    transport = httpx.ASGITransport(app=routes.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as http:
+        job = {
+            "title": "Data Engineer",
+            "company": "Acme",
+            "description": "Required: Python, SQL, Airflow. Nice to have: Docker.",
+            "resume_text": "Python and SQL ETL pipelines.",
+        }
+        started = time.perf_counter()
+        writers = [asyncio.create_task(_create(http, job, async_scoring)) for _ in range(creates)]
+
+        latencies = []
+        for i in range(reads):
+            t0 = time.perf_counter()
+            await http.get(READ_PATHS[i % len(READ_PATHS)])
+            latencies.append((time.perf_counter() - t0) * 1000)
+            await asyncio.sleep(0.01)
+
+        created = await asyncio.gather(*writers)
+        while (await http.get("/scoring/queue")).json()["total"]:
+            await asyncio.sleep(0.05)
+        total = time.perf_counter() - started
+
+    await routes.stop_scoring_workers()
+    ok = sum(1 for r, _ in created if r.status_code in (200, 202))
+    create_ms = sorted(ms for _, ms in created)
+    latencies.sort()
+    print(f"creates: {ok}/{creates} ok, all scored in {total:.2f}s")
+    print(f"create latency: p50={statistics.median(create_ms):.1f}ms max={create_ms[-1]:.1f}ms")
+    print(f"reads during scoring: n={len(latencies)} "
+          f"p50={statistics.median(latencies):.1f}ms "
+          f"p95={latencies[int(len(latencies) * 0.95) - 1]:.1f}ms "
+          f"max={latencies[-1]:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--creates", type=int, default=20)
+    parser.add_argument("--reads", type=int, default=100)
+    parser.add_argument("--llm-latency", type=float, default=2.0)
+    parser.add_argument("--async-scoring", action="store_true")
+    args = parser.parse_args()
+
+    stub = StubOpenAIServer(latency=args.llm_latency).start()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            configure_offline_env(stub, workdir)
+            asyncio.run(_run(args.creates, args.reads, args.async_scoring))
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# benchmarks/prompt_compaction.py
+"""Measure how much prompt compaction saves and whether scores move because of it.
+
+For every job description in the corpus, builds the match prompt from the raw
+text and from the compacted text, and reports token counts, the time spent
+compacting, and the score difference. Scores come from the keyword scorer; add
+--llm (with a real OPENAI_API_KEY) to compare OpenAI scores as well.
+
+    python benchmarks/prompt_compaction.py
+    python benchmarks/prompt_compaction.py --corpus my_jds/ --jd-budget 800 --llm
+    JOB_STORE=sqlite python benchmarks/prompt_compaction.py --from-store
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "data" / "job_descriptions.jsonl"
+
+RESUME = """Data engineer with 6 years of experience.
+Built ELT pipelines in Python, SQL, Airflow and dbt on Snowflake.
+Ran Kafka ingestion and Spark batch jobs; deployed services with Docker on AWS."""
+
+
+def _load_corpus(path: Path):
+    files = sorted(f for f in path.iterdir() if f.suffix in (".txt", ".md", ".jsonl")) if path.is_dir() else [path]
+    descriptions = []
+    for file in files:
+        if file.suffix == ".jsonl":
+            descriptions += [json.loads(line)["description"] for line in file.open() if line.strip()]
+        else:
+            descriptions.append(file.read_text())
+    return descriptions
+
+
+def _load_store():
+    from storage import get_job_store
+
+    return [job["description"] for page in get_job_store().iter_jobs(columns=["description"])
+            for job in page if job.get("description")]
+
+
+async def _llm_scores(prompts):
+    from clients import async_openai_client
+    from llm.match_engine import MATCH_MAX_TOKENS, MODEL_NAME, _safe_parse_json
+
+    async_client = async_openai_client()
+
+    async def score(prompt):
+        response = await async_client.chat.completions.create(
+            model=MODEL_NAME,
+            messages=[{"role": "system", "content": "Only return valid JSON. No markdown."},
+                      {"role": "user", "content": prompt}],
+            temperature=0.3,
+            max_tokens=MATCH_MAX_TOKENS,
+        )
+        return _safe_parse_json(response.choices[0].message.content)["match_score"]
+
+    return await asyncio.gather(*(score(p) for p in prompts))
+
+
+async def _compare_llm(raw_prompts, compact_prompts):
+    return await _llm_scores(raw_prompts), await _llm_scores(compact_prompts)
+
+
+def _report_diffs(label, before, after):
+    diffs = [abs(a - b) for a, b in zip(before, after)]
+    print(f"{label} score change: mean {statistics.mean(diffs):.1f}, max {max(diffs)} points "
+          f"({sum(1 for d in diffs if d == 0)}/{len(diffs)} unchanged)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS,
+                        help="directory of .txt/.md files or a .jsonl with a description field")
+    parser.add_argument("--from-store", action="store_true", help="use descriptions from the configured job store")
+    parser.add_argument("--jd-budget", type=int, default=1200)
+    parser.add_argument("--resume-budget", type=int, default=2000)
+    parser.add_argument("--llm", action="store_true", help="also compare OpenAI scores (costs two calls per JD)")
+    args = parser.parse_args()
+
+    from llm.match_engine import _prompt_for_match, fallback_match_scores
+    from llm.prompt_compactor import compact_job_description, compact_resume
+    from llm.text_utils import count_tokens, normalize_text
+
+    corpus = _load_store() if args.from_store else _load_corpus(args.corpus)
+    if not corpus:
+        sys.exit("No job descriptions found")
+
+    started = time.perf_counter()
+    compacted = [compact_job_description(jd, args.jd_budget) for jd in corpus]
+    compact_ms = (time.perf_counter() - started) * 1000 / len(corpus)
+    resume = compact_resume(RESUME, args.resume_budget)
+
+    raw_prompts = [_prompt_for_match(normalize_text(RESUME), jd) for jd in corpus]
+    compact_prompts = [_prompt_for_match(resume, jd) for jd in compacted]
+    jd_before = [count_tokens(jd) for jd in corpus]
+    jd_after = [count_tokens(jd) for jd in compacted]
+    prompt_before = sum(map(count_tokens, raw_prompts))
+    prompt_after = sum(map(count_tokens, compact_prompts))
+
+    print(f"{len(corpus)} job descriptions, compaction {compact_ms:.2f}ms each")
+    print(f"description tokens: {sum(jd_before)} -> {sum(jd_after)} "
+          f"({100 * (1 - sum(jd_after) / sum(jd_before)):.0f}% fewer, "
+          f"median per JD {statistics.median(jd_before)} -> {statistics.median(jd_after)})")
+    print(f"prompt tokens: {prompt_before} -> {prompt_after} ({100 * (1 - prompt_after / prompt_before):.0f}% fewer)")
+
+    _report_diffs("keyword", [r["match_score"] for r in fallback_match_scores(RESUME, corpus)],
+                  [r["match_score"] for r in fallback_match_scores(RESUME, compacted)])
+    if args.llm:
+        from clients import openai_configured
+
+        if not openai_configured():
+            sys.exit("--llm needs OPENAI_API_KEY")
+        before, after = asyncio.run(_compare_llm(raw_prompts, compact_prompts))
+        _report_diffs("OpenAI", before, after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# benchmarks/rate_limits.py
+"""Score a burst of jobs against a stub OpenAI that answers some requests with 429.
+
+Counts how many results came from OpenAI versus the keyword fallback, and how
+many calls were shared by identical in-flight prompts. Run with --max-retries 0
+to see the old behaviour (every 429 becomes a degraded keyword score).
+
+    python benchmarks/rate_limits.py --jobs 200 --distinct 50 --rate-limit-ratio 0.3
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stubs import STUB_MATCH_RESULT, StubOpenAIServer, configure_offline_env
+
+
+async def _run(jobs: int, distinct: int):
+    from llm.match_engine import get_match_score_async, llm_scheduler
+
+    resume = "Python and SQL ETL pipelines with Airflow and dbt."
+    descriptions = [f"Data Engineer #{i % distinct}. Required: Python, SQL. Nice to have: Docker."
+                    for i in range(jobs)]
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(get_match_score_async(resume, jd) for jd in descriptions))
+    elapsed = time.perf_counter() - started
+
+    stub_breakdown = STUB_MATCH_RESULT["skill_breakdown"]
+    from_llm = sum(1 for r in results if r.get("skill_breakdown") == stub_breakdown)
+    print(f"scored {jobs} jobs ({distinct} distinct) in {elapsed:.2f}s")
+    print(f"OpenAI results: {from_llm}, keyword fallbacks: {jobs - from_llm}")
+    print(f"scheduler: {llm_scheduler.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--distinct", type=int, default=50)
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.3)
+    parser.add_argument("--retry-after", type=float, default=0.5)
+    parser.add_argument("--max-retries", type=int, default=4)
+    parser.add_argument("--rpm", type=float, default=3000)
+    args = parser.parse_args()
+
+    stub = StubOpenAIServer(latency=args.llm_latency, rate_limit_ratio=args.rate_limit_ratio,
+                            retry_after=args.retry_after).start()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            configure_offline_env(stub, workdir)
+            os.environ["LLM_MAX_RETRIES"] = str(args.max_retries)
+            os.environ["LLM_REQUESTS_PER_MINUTE"] = str(args.rpm)
+            asyncio.run(_run(args.jobs, args.distinct))
+            print(f"stub: {stub.calls} requests, {stub.rate_limited} answered with 429")
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/search.py
+"""Build time and query latency of the /jobs/search full-text index.
+
+Indexes --jobs synthetic postings, then times --queries runs of each query
+shape: a single word, several words, a quoted phrase, a prefix, an excluded
+word and a status filter. Also times updating a posting's status and
+re-indexing an edited description, the per-write cost of keeping the index in
+step with the store.
+
+    python benchmarks/search.py --jobs 50000 --queries 200
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic import generate_jobs
+from llm.search_index import SearchIndex
+
+QUERIES = {
+    "word": ("airflow", None),
+    "words": ("python kubernetes terraform", None),
+    "phrase": ('"data engineer"', None),
+    "prefix": ("kube*", None),
+    "exclude": ("python -java", None),
+    "status": ("snowflake dbt", ["applied", "interview"]),
+}
+PAGE = 1000
+
+
+def _ms(samples) -> str:
+    samples = sorted(samples)
+    return f"median {statistics.median(samples) * 1000:7.3f}ms  p99 {samples[int(len(samples) * 0.99)] * 1000:7.3f}ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    jobs = [{"id": i + 1, **job} for i, job in enumerate(generate_jobs(args.jobs, seed=args.seed))]
+    index = SearchIndex()
+    started = time.perf_counter()
+    index.rebuild(jobs[i:i + PAGE] for i in range(0, len(jobs), PAGE))
+    print(f"indexed {index.size} postings in {time.perf_counter() - started:.1f}s")
+
+    for name, (query, statuses) in QUERIES.items():
+        samples = []
+        for _ in range(args.queries):
+            started = time.perf_counter()
+            total, _ = index.search(query, statuses)
+            samples.append(time.perf_counter() - started)
+        print(f"{name + ':':<9} {_ms(samples)}  {total:6d} matches  {query}")
+
+    rng = random.Random(args.seed)
+    status_samples, edit_samples = [], []
+    for job in rng.sample(jobs, min(args.queries, len(jobs))):
+        started = time.perf_counter()
+        index.apply("update", [{"id": job["id"], "status": "applied"}])
+        status_samples.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        index.apply("update", [{**job, "description": job["description"] + "\nVisa sponsorship available."}])
+        edit_samples.append(time.perf_counter() - started)
+    print(f"{'status update:':<15} {_ms(status_samples)}")
+    print(f"{'reindex:':<15} {_ms(edit_samples)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/streaming.py
+"""Compare time to first useful field for streamed versus buffered match scoring.
+
+Scores the same distinct job descriptions both ways against a stub OpenAI that
+spreads its latency over the streamed chunks, and reports when match_score,
+the first skill and the complete result became available.
+
+    python benchmarks/streaming.py --jobs 20 --llm-latency 1.0
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stubs import StubOpenAIServer, configure_offline_env
+
+RESUME = "Python and SQL ETL pipelines with Airflow and dbt."
+
+
+def _ms(samples):
+    return f"median {statistics.median(samples) * 1000:.0f}ms, max {max(samples) * 1000:.0f}ms"
+
+
+async def _buffered(jd: str) -> float:
+    from llm.match_engine import get_match_score_async
+
+    started = time.perf_counter()
+    await get_match_score_async(RESUME, jd)
+    return time.perf_counter() - started
+
+
+async def _streamed(jd: str):
+    from llm.match_engine import stream_match_score
+
+    started = time.perf_counter()
+    marks = {}
+    async for event, data in stream_match_score(RESUME, jd):
+        name = data.get("name") if event == "field" else event
+        marks.setdefault(name, time.perf_counter() - started)
+    return marks
+
+
+async def _run(jobs: int):
+    buffered = [await _buffered(f"Data Engineer #{i}. Required: Python, SQL.") for i in range(jobs)]
+    streamed = [await _streamed(f"Analytics Engineer #{i}. Required: Python, dbt.") for i in range(jobs)]
+
+    print(f"buffered  result:      {_ms(buffered)}")
+    for mark in ("match_score", "skill", "result"):
+        samples = [marks[mark] for marks in streamed if mark in marks]
+        if samples:
+            print(f"streamed  {mark + ':':<12} {_ms(samples)}")
+    errors = sum(1 for marks in streamed if "error" in marks)
+    print(f"stream errors: {errors}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--llm-latency", type=float, default=1.0)
+    args = parser.parse_args()
+
+    stub = StubOpenAIServer(latency=args.llm_latency).start()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            configure_offline_env(stub, workdir)
+            asyncio.run(_run(args.jobs))
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
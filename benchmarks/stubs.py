@@ -0,0 +1,141 @@
+# benchmarks/stubs.py
+# Local stand-in for OpenAI so the API can be load tested offline.
+# The database side uses the SQLite job store (JOB_STORE=sqlite).
+
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STUB_MATCH_RESULT = {
+    "match_score": 72,
+    "strengths": "Python, SQL",
+    "gaps": "Docker",
+    "skill_breakdown": [
+        {"skill": "Python", "match_level": "strong", "reason": "stub", "importance": "high"},
+        {"skill": "Docker", "match_level": "missing", "reason": "stub", "importance": "high"},
+    ],
+}
+
+
+class StubOpenAIServer:
+    """OpenAI-compatible /v1/chat/completions endpoint that sleeps for `latency` seconds.
+
+    Point the OpenAI SDK at it with OPENAI_BASE_URL=<server.base_url>. With
+    `rate_limit_ratio`, that fraction of requests is answered with a 429 and a
+    Retry-After of `retry_after` seconds, like OpenAI does when over quota.
+    """
+
+    def __init__(self, latency: float = 2.0, host: str = "127.0.0.1", port: int = 0,
+                 rate_limit_ratio: float = 0.0, retry_after: float = 0.5):
+        self.latency = latency
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self.calls = 0
+        self.rate_limited = 0
+        self.connections = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, like the real API, so clients can reuse connections
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                stub.connections += 1
+
+            def _send_json(self, status: int, payload: dict, headers: dict = None):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _stream(self):
+                """Send the answer as chat.completion.chunk events, spreading latency over them."""
+                content = json.dumps(STUB_MATCH_RESULT, indent=2)
+                pieces = [content[i:i + 8] for i in range(0, len(content), 8)]
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                for piece in pieces:
+                    time.sleep(stub.latency / len(pieces))
+                    chunk = {
+                        "id": "chatcmpl-stub",
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": "stub",
+                        "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}],
+                    }
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                    self.wfile.flush()
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.close_connection = True
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                stub.calls += 1
+                if random.random() < stub.rate_limit_ratio:
+                    stub.rate_limited += 1
+                    self._send_json(429, {"error": {"message": "Rate limit reached", "type": "requests",
+                                                    "code": "rate_limit_exceeded"}},
+                                    {"Retry-After": str(stub.retry_after)})
+                    return
+                if request.get("stream"):
+                    self._stream()
+                    return
+                time.sleep(stub.latency)
+                self._send_json(200, {
+                    "id": "chatcmpl-stub",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": "stub",
+                    "choices": [{
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": json.dumps(STUB_MATCH_RESULT)},
+                    }],
+                    "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+                })
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+
+
+def configure_offline_env(stub: StubOpenAIServer, workdir: str) -> None:
+    """Point the app at the stub model and keep all local state under `workdir`.
+
+    Must run before api.routes (or llm.*) is imported.
+    """
+    os.environ["OPENAI_API_KEY"] = "sk-stub"
+    os.environ["OPENAI_BASE_URL"] = stub.base_url
+    os.environ["JOB_STORE"] = "sqlite"
+    os.environ["JOB_STORE_PATH"] = os.path.join(workdir, "jobs.sqlite3")
+    os.environ["RESUME_PROFILE_PATH"] = os.path.join(workdir, "resume_profiles.sqlite3")
+    os.environ["SCORING_QUEUE_PATH"] = os.path.join(workdir, "scoring_queue.sqlite3")
+    os.environ["EVENTS_PATH"] = os.path.join(workdir, "events.sqlite3")
+    os.environ["RESCORE_PATH"] = os.path.join(workdir, "rescore.sqlite3")
+    os.environ["MATCH_CACHE_PATH"] = ""
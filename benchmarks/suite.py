@@ -0,0 +1,314 @@
+# benchmarks/suite.py
+"""Time the scoring, parsing and analytics hot paths plus an end-to-end API load test, and save the results as JSON.
+
+Runs against a synthetic corpus (benchmarks/synthetic.py), a stub OpenAI server
+and the local SQLite job store in place of Supabase. Results go to
+benchmarks/results/<commit>.json; pass --compare with an earlier file to see
+what got slower. The exit status is 1 when anything regressed by more than
+--threshold, so the script can gate CI.
+
+    python benchmarks/suite.py --jobs 2000
+    python benchmarks/suite.py --only analytics --compare benchmarks/results/abc1234.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.stubs import STUB_MATCH_RESULT, StubOpenAIServer, configure_offline_env
+from benchmarks.synthetic import generate_jobs, generate_resumes, resume_docx, resume_pdf
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def _git(*args) -> str:
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _summary(per_call_ms):
+    per_call_ms = sorted(per_call_ms)
+    median = statistics.median(per_call_ms)
+    return {
+        "median_ms": round(median, 4),
+        "p95_ms": round(per_call_ms[max(0, int(len(per_call_ms) * 0.95) - 1)], 4),
+        "ops_per_sec": round(1000 / median, 1) if median else None,
+        "samples": len(per_call_ms),
+    }
+
+
+def measure(fn, repeat: int, min_sample_ms: float = 5.0):
+    """Per-call timings of fn(); fast calls are batched so each sample lasts at least min_sample_ms."""
+    fn()  # warm-up
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = (time.perf_counter() - started) * 1000
+        if elapsed >= min_sample_ms or number >= 1 << 16:
+            break
+        number *= 4
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - started) * 1000 / number)
+    return _summary(samples)
+
+
+def bench_scoring(ctx, repeat):
+    from llm.match_engine import _fallback_match_score, fallback_match_scores
+
+    pairs = [(resume, job["description"]) for resume in ctx["resumes"] for job in ctx["jobs"][:50]]
+    cycle = iter(pairs * (1 + 100000 // len(pairs)))
+    batch = [job["description"] for job in ctx["jobs"][:200]]
+    return {
+        "scoring.fallback_match_score": measure(lambda: _fallback_match_score(*next(cycle)), repeat),
+        "scoring.fallback_match_scores_200": measure(lambda: fallback_match_scores(ctx["resumes"][0], batch), repeat),
+    }
+
+
+def bench_parse_json(ctx, repeat):
+    from llm.match_engine import _safe_parse_json
+
+    valid = json.dumps(STUB_MATCH_RESULT, indent=2)
+    fenced = f"Here is the analysis:\n```json\n{valid}\n```"
+    malformed = valid[:-20]
+
+    def parse_quietly(text):
+        # The failure path prints on every call
+        with contextlib.redirect_stdout(io.StringIO()):
+            _safe_parse_json(text)
+
+    return {
+        "parse_json.valid": measure(lambda: _safe_parse_json(valid), repeat),
+        "parse_json.fenced": measure(lambda: _safe_parse_json(fenced), repeat),
+        "parse_json.malformed": measure(lambda: parse_quietly(malformed), repeat),
+    }
+
+
+def bench_parse_resume(ctx, repeat):
+    from fastapi import UploadFile
+    from starlette.datastructures import Headers
+
+    from llm import resume_parser
+
+    loop = ctx["loop"]
+    files = {
+        "pdf": (resume_parser.PDF_TYPE, [resume_pdf(text) for text in ctx["resumes"]]),
+        "docx": (resume_parser.DOCX_TYPE, [resume_docx(text) for text in ctx["resumes"]]),
+    }
+    results = {}
+    for kind, (content_type, blobs) in files.items():
+        cycle = iter(blobs * 100000)
+
+        def parse(clear_cache: bool):
+            if clear_cache:
+                resume_parser._parsed.clear()
+            upload = UploadFile(io.BytesIO(next(cycle)), filename=f"resume.{kind}",
+                                headers=Headers({"content-type": content_type}))
+            loop.run_until_complete(resume_parser.parse_resume_file(upload))
+
+        results[f"parse_resume.{kind}"] = measure(lambda: parse(True), repeat)
+        results[f"parse_resume.{kind}_cached"] = measure(lambda: parse(False), repeat)
+    return results
+
+
+def bench_analytics(ctx, repeat):
+    from api.analytics import JobAnalytics
+
+    store = ctx["store"]
+    analytics = JobAnalytics()
+    analytics.rebuild(store)
+    row = dict(store.list_jobs(limit=1)[0])
+
+    def update():
+        row["match_score"] = random.randint(0, 100)
+        analytics.apply("update", [row])
+
+    return {
+        "analytics.rebuild": measure(lambda: analytics.rebuild(store), max(3, repeat // 3)),
+        "analytics.apply_update": measure(update, repeat),
+        "analytics.top_companies": measure(analytics.top_companies, repeat),
+        "analytics.funnel": measure(analytics.funnel, repeat),
+        "analytics.common_gaps": measure(analytics.common_gaps, repeat),
+        "analytics.weekly_trends": measure(analytics.weekly_trends, repeat),
+        "analytics.snapshot": measure(analytics.snapshot, repeat),
+    }
+
+
+async def _load(requests: int, concurrency: int, resume: str):
+    import httpx
+
+    from api import routes
+    from llm.resume_profile import build_profile, resume_profiles
+
+    resume_profiles.save(build_profile(resume, "bench"))
+    transport = httpx.ASGITransport(app=routes.app)
+    ids = [job["id"] for job in routes.store.list_jobs(columns=["id"], limit=500)]
+    timings = {}
+    counter = iter(range(requests))
+
+    def next_request(i):
+        pick = i % 10
+        if pick < 4:
+            return "GET /jobs", ("GET", "/jobs", {"params": {"limit": 50}})
+        if pick < 6:
+            return "GET /jobs/{id}", ("GET", f"/jobs/{random.choice(ids)}", {})
+        if pick < 8:
+            return "GET /analytics/dashboard", ("GET", "/analytics/dashboard", {})
+        if pick < 9:
+            return "GET /jobs/rank", ("GET", "/jobs/rank", {"params": {"resume_version": "bench", "limit": 20}})
+        # Distinct descriptions so every create reaches the (stub) model
+        job = {"title": "Bench", "company": "Bench Co", "resume_version": "bench",
+               "description": f"Posting {i}. Required: Python, SQL, Airflow. Nice to have: Docker."}
+        return "POST /jobs", ("POST", "/jobs", {"json": job})
+
+    async def client(http):
+        for i in counter:
+            route, (method, url, kwargs) = next_request(i)
+            started = time.perf_counter()
+            response = await http.request(method, url, **kwargs)
+            elapsed = (time.perf_counter() - started) * 1000
+            if response.status_code >= 400:
+                raise RuntimeError(f"{method} {url} -> {response.status_code}: {response.text[:200]}")
+            timings.setdefault(route, []).append(elapsed)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as http:
+        # First requests build the rank index and warm caches; keep them out of the numbers
+        for i in range(9):
+            _, (method, url, kwargs) = next_request(i)
+            await http.request(method, url, **kwargs)
+        started = time.perf_counter()
+        await asyncio.gather(*(client(http) for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+
+    results = {f"e2e.{route}": _summary(samples) for route, samples in sorted(timings.items())}
+    results["e2e.throughput"] = {"requests": requests, "concurrency": concurrency,
+                                 "requests_per_sec": round(requests / wall, 1)}
+    return results
+
+
+def bench_e2e(ctx, repeat):
+    return ctx["loop"].run_until_complete(_load(ctx["requests"], ctx["concurrency"], ctx["resumes"][0]))
+
+
+GROUPS = {
+    "scoring": bench_scoring,
+    "parse_json": bench_parse_json,
+    "parse_resume": bench_parse_resume,
+    "analytics": bench_analytics,
+    "e2e": bench_e2e,
+}
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> int:
+    """Print median changes against `baseline`; returns how many regressed beyond threshold."""
+    regressions = 0
+    print(f"\ncompared with {baseline.get('commit') or 'baseline'} (threshold {threshold:.0%}):")
+    for name, result in current["results"].items():
+        before = baseline.get("results", {}).get(name, {}).get("median_ms")
+        after = result.get("median_ms")
+        if not before or after is None:
+            continue
+        change = (after - before) / before
+        flag = ""
+        if change > threshold:
+            flag, regressions = "  REGRESSION", regressions + 1
+        elif change < -threshold:
+            flag = "  faster"
+        print(f"  {name:<40} {before:>10.3f}ms -> {after:>10.3f}ms  {change:+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=2000, help="rows in the job store")
+    parser.add_argument("--resumes", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=15, help="samples per micro-benchmark")
+    parser.add_argument("--requests", type=int, default=500, help="requests in the end-to-end load test")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--llm-latency", type=float, default=0.05)
+    parser.add_argument("--only", action="append", choices=sorted(GROUPS), help="run only these groups")
+    parser.add_argument("--output", type=Path, help="results file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", type=Path, help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="slowdown that counts as a regression")
+    args = parser.parse_args()
+
+    commit = _git("rev-parse", "--short", "HEAD")
+    dirty = bool(_git("status", "--porcelain", "--untracked-files=no"))
+    output = args.output or RESULTS_DIR / f"{commit or 'unknown'}{'-dirty' if dirty else ''}.json"
+
+    stub = StubOpenAIServer(latency=args.llm_latency).start()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            configure_offline_env(stub, workdir)
+            # Measure the code, not the per-minute OpenAI budget the scheduler enforces
+            os.environ["LLM_REQUESTS_PER_MINUTE"] = os.environ["LLM_TOKENS_PER_MINUTE"] = "1e9"
+            from storage import get_job_store
+
+            random.seed(args.seed)
+            store = get_job_store()
+            store.insert_many(generate_jobs(args.jobs, args.seed))
+            ctx = {"loop": loop, "store": store, "jobs": store.list_jobs(limit=200),
+                   "resumes": generate_resumes(args.resumes, args.seed),
+                   "requests": args.requests, "concurrency": args.concurrency}
+
+            results = {}
+            for group in args.only or GROUPS:
+                started = time.perf_counter()
+                results.update(GROUPS[group](ctx, args.repeat))
+                print(f"{group}: {time.perf_counter() - started:.1f}s")
+    finally:
+        loop.close()
+        stub.stop()
+
+    report = {
+        "commit": commit,
+        "dirty": dirty,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "params": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+        "results": results,
+    }
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+
+    for name, result in results.items():
+        if "median_ms" in result:
+            print(f"  {name:<40} median {result['median_ms']:>10.3f}ms  p95 {result['p95_ms']:>10.3f}ms")
+        else:
+            print(f"  {name:<40} {result}")
+    print(f"saved {output}")
+
+    if args.compare:
+        regressions = compare(json.loads(args.compare.read_text()), report, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+# benchmarks/synthetic.py
+"""Generate a synthetic corpus: job rows with realistic description lengths and resumes as text, PDF and DOCX.
+
+Everything is derived from a seed, so two runs with the same arguments produce
+the same corpus and benchmark numbers stay comparable between commits.
+
+    python benchmarks/synthetic.py --jobs 1000 --resumes 20 --out .cache/corpus
+"""
+
+import argparse
+import io
+import json
+import random
+import sys
+import textwrap
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from storage import JOB_STATUSES
+
+SKILLS = [
+    "Python", "SQL", "Java", "JavaScript", "TypeScript", "React", "Node.js", "Go", "Rust", "C++",
+    "AWS", "GCP", "Azure", "Docker", "Kubernetes", "Terraform", "Airflow", "dbt", "Spark", "Kafka",
+    "Snowflake", "PostgreSQL", "Redis", "FastAPI", "Django", "Tableau", "Power BI", "pandas",
+    "PyTorch", "TensorFlow", "scikit-learn", "Git", "CI/CD", "Linux", "GraphQL", "REST APIs",
+]
+TITLES = [
+    "Data Engineer", "Senior Data Engineer", "Backend Engineer", "Full Stack Developer",
+    "Machine Learning Engineer", "Data Analyst", "Analytics Engineer", "DevOps Engineer",
+    "Platform Engineer", "Data Scientist", "Software Engineer", "Site Reliability Engineer",
+]
+COMPANIES = [
+    "Northwind", "Contoso", "Globex", "Initech", "Umbrella Health", "Stark Logistics", "Wayne Fintech",
+    "Acme Robotics", "Hooli", "Pied Piper", "Vandelay Imports", "Soylent Foods", "Tyrell Systems",
+    "Cyberdyne", "Massive Dynamic", "Aperture Labs", "Oscorp", "Wonka Retail", "Gringotts Bank", "Dunder Mifflin",
+]
+VERBS = ["Build", "Design", "Own", "Maintain", "Scale", "Improve", "Automate", "Migrate", "Monitor", "Operate"]
+OBJECTS = [
+    "batch and streaming data pipelines", "customer-facing REST APIs", "internal analytics dashboards",
+    "our machine learning platform", "the deployment pipeline", "data quality checks",
+    "event ingestion services", "reporting for finance and operations", "the core billing service",
+    "observability and alerting", "feature pipelines for ranking models", "the data warehouse",
+]
+FILLER = [
+    "You will work closely with product managers, designers and other engineers.",
+    "We value clear writing, thoughtful code review and shipping in small increments.",
+    "The team is distributed across several time zones and collaborates asynchronously.",
+    "You will take part in a lightweight on-call rotation once the service is stable.",
+    "We care about reliability, cost and developer experience in equal measure.",
+    "Our stack has grown quickly and there is plenty of room to simplify it.",
+    "You will help define technical direction and mentor other engineers.",
+    "Most of our work is greenfield, with a few legacy systems left to retire.",
+]
+BOILERPLATE = [
+    "What we offer\n- Competitive salary and equity\n- Health, dental and vision insurance\n"
+    "- 401(k) matching\n- Flexible PTO\n- Annual learning budget",
+    "{company} is an equal opportunity employer. All qualified applicants will receive consideration "
+    "for employment without regard to race, color, religion, sex, sexual orientation, gender identity, "
+    "national origin, disability, or protected veteran status.",
+    "If you need a reasonable accommodation during the application process, please let us know.",
+]
+MATCH_LEVELS = ["strong", "good", "partial", "missing"]
+IMPORTANCE = ["high", "medium", "low"]
+
+
+def _job_description(rng: random.Random, title: str, company: str) -> str:
+    required = rng.sample(SKILLS, rng.randint(3, 7))
+    nice = rng.sample([s for s in SKILLS if s not in required], rng.randint(1, 4))
+    # Posting lengths are long-tailed: most are a few hundred words, some run past a thousand
+    paragraphs = max(1, min(25, int(rng.lognormvariate(1.6, 0.7))))
+    parts = [
+        title,
+        f"About {company}\n" + " ".join(rng.choice(FILLER) for _ in range(rng.randint(2, 4))),
+        "About the role\n" + " ".join(rng.choice(FILLER) for _ in range(paragraphs * 3)),
+        "Responsibilities\n" + "\n".join(f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)}"
+                                          for _ in range(rng.randint(4, 9))),
+        "Requirements\n" + "\n".join(f"- {rng.randint(1, 6)}+ years with {skill}" for skill in required),
+        "Nice to have\n" + "\n".join(f"- Experience with {skill}" for skill in nice),
+    ]
+    parts += [text.format(company=company) for text in BOILERPLATE if rng.random() < 0.8]
+    return "\n\n".join(parts)
+
+
+def _skill_breakdown(rng: random.Random) -> List[Dict[str, str]]:
+    return [{"skill": skill, "match_level": rng.choice(MATCH_LEVELS), "reason": "synthetic",
+             "importance": rng.choice(IMPORTANCE)} for skill in rng.sample(SKILLS, rng.randint(4, 8))]
+
+
+def generate_jobs(n: int, seed: int = 0, weeks: int = 12) -> List[Dict[str, Any]]:
+    """Scored job rows spread over the last `weeks` weeks, ready for JobStore.insert_many."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    jobs = []
+    for _ in range(n):
+        title, company = rng.choice(TITLES), rng.choice(COMPANIES)
+        jobs.append({
+            "title": title,
+            "company": company,
+            "description": _job_description(rng, title, company),
+            "status": rng.choice(JOB_STATUSES),
+            "match_score": rng.randint(20, 95),
+            "strengths": ", ".join(rng.sample(SKILLS, 2)),
+            "gaps": ", ".join(rng.sample(SKILLS, 2)),
+            "skill_breakdown": _skill_breakdown(rng),
+            "created_at": (now - timedelta(seconds=rng.uniform(0, weeks * 7 * 86400))).isoformat(),
+        })
+    return jobs
+
+
+def generate_resumes(m: int, seed: int = 0) -> List[str]:
+    """Plain-text resumes of one to three pages."""
+    rng = random.Random(seed + 1)
+    resumes = []
+    for i in range(m):
+        skills = rng.sample(SKILLS, rng.randint(6, 14))
+        lines = [f"Candidate {i}", f"{rng.choice(TITLES)} with {rng.randint(1, 12)} years of experience.", "",
+                 "SKILLS", ", ".join(skills), "", "EXPERIENCE"]
+        for _ in range(rng.randint(2, 5)):
+            lines += ["", f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)} ({rng.randint(2010, 2024)})"]
+            lines += [f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(skills)} and {rng.choice(skills)}"
+                      for _ in range(rng.randint(3, 8))]
+        lines += ["", "EDUCATION", "B.Sc. Computer Science"]
+        resumes.append("\n".join(lines))
+    return resumes
+
+
+def _pdf_escape(line: str) -> str:
+    line = line.encode("latin-1", "replace").decode("latin-1")
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def resume_pdf(text: str) -> bytes:
+    """A minimal text-only PDF (Helvetica, 60 lines per page) readable by PyPDF2."""
+    lines = [wrapped for line in text.split("\n") for wrapped in (textwrap.wrap(line, 95) or [""])]
+    pages = [lines[i:i + 60] for i in range(0, len(lines), 60)] or [[]]
+    objects = {1: "<< /Type /Catalog /Pages 2 0 R >>",
+               3: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    kids = []
+    for number, page in enumerate(pages):
+        content_id, page_id = 4 + 2 * number, 5 + 2 * number
+        stream = "BT /F1 10 Tf 12 TL 50 760 Td " + " ".join(f"({_pdf_escape(line)}) Tj T*" for line in page) + " ET"
+        objects[content_id] = f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream"
+        objects[page_id] = (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>")
+        kids.append(page_id)
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(f'{k} 0 R' for k in kids)}] /Count {len(kids)} >>"
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for object_id in range(1, len(objects) + 1):
+        offsets.append(out.tell())
+        out.write(f"{object_id} 0 obj\n{objects[object_id]}\nendobj\n".encode("latin-1"))
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    out.write("".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode())
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    return out.getvalue()
+
+
+def resume_docx(text: str) -> bytes:
+    import docx
+
+    document = docx.Document()
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def write_corpus(out: Path, jobs: int, resumes: int, seed: int = 0) -> None:
+    """jobs.jsonl plus resumes/<i>.txt, .pdf and .docx under `out`."""
+    (out / "resumes").mkdir(parents=True, exist_ok=True)
+    with (out / "jobs.jsonl").open("w") as f:
+        for job in generate_jobs(jobs, seed):
+            f.write(json.dumps(job) + "\n")
+    for i, text in enumerate(generate_resumes(resumes, seed)):
+        (out / "resumes" / f"{i}.txt").write_text(text)
+        (out / "resumes" / f"{i}.pdf").write_bytes(resume_pdf(text))
+        (out / "resumes" / f"{i}.docx").write_bytes(resume_docx(text))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--resumes", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=Path(".cache") / "corpus")
+    args = parser.parse_args()
+    write_corpus(args.out, args.jobs, args.resumes, args.seed)
+    print(f"wrote {args.jobs} jobs and {args.resumes} resumes to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# clients/__init__.py
+# Outbound HTTP clients (OpenAI, Supabase), created on first use rather than at
+# import. They share keep-alive connection pools with limits from the
+# environment: one synchronous pool (Supabase and the sync OpenAI client) and one
+# asynchronous pool (AsyncOpenAI, used by the API).
+#
+# Importing this package also loads the project's .env, once, so import it
+# before any module that reads its settings from the environment.
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent / ".env")
+
+# Connection pool limits, per pool and per worker process
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+# How long an idle connection stays open for reuse
+HTTP_KEEPALIVE_SECONDS = float(os.getenv("HTTP_KEEPALIVE_SECONDS", "30"))
+
+_lock = threading.RLock()
+_clients: Dict[str, Any] = {}
+
+
+def _shared(name: str, factory: Callable[[], Any]) -> Any:
+    """The process-wide instance of `name`, built by `factory` on first use."""
+    client = _clients.get(name)
+    if client is None:
+        with _lock:
+            client = _clients.get(name)
+            if client is None:
+                client = _clients[name] = factory()
+    return client
+
+
+def _pool_options() -> Dict[str, Any]:
+    import httpx
+
+    limits = httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                          max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                          keepalive_expiry=HTTP_KEEPALIVE_SECONDS)
+    # The OpenAI SDK sets its own timeout on every request; 120s is supabase-py's default
+    return {"limits": limits, "timeout": 120.0, "follow_redirects": True}
+
+
+def _http_pool():
+    import httpx
+
+    return _shared("http", lambda: httpx.Client(**_pool_options()))
+
+
+def _async_http_pool():
+    import httpx
+
+    return _shared("async_http", lambda: httpx.AsyncClient(**_pool_options()))
+
+
+def openai_configured() -> bool:
+    key = os.getenv("OPENAI_API_KEY")
+    return bool(key and key.startswith("sk-"))
+
+
+def openai_client():
+    """Shared OpenAI client, or None when no API key is configured."""
+    if not openai_configured():
+        return None
+
+    def build():
+        from openai import OpenAI
+
+        return OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=_http_pool())
+
+    return _shared("openai", build)
+
+
+def async_openai_client():
+    """Shared AsyncOpenAI client, or None when no API key is configured.
+
+    SDK retries are off: llm_scheduler retries so 429 backoff is shared across calls.
+    """
+    if not openai_configured():
+        return None
+
+    def build():
+        from openai import AsyncOpenAI
+
+        return AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), max_retries=0, http_client=_async_http_pool())
+
+    return _shared("async_openai", build)
+
+
+def supabase_client():
+    """Shared Supabase client for SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY."""
+
+    def build():
+        from supabase import create_client
+
+        url, key = os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+        try:
+            from supabase import ClientOptions
+
+            options = ClientOptions(httpx_client=_http_pool())
+        except (ImportError, TypeError):
+            # Older supabase-py releases cannot be given an HTTP client and keep their own pool
+            return create_client(url, key)
+        return create_client(url, key, options=options)
+
+    return _shared("supabase", build)
+
+
+def warm_up() -> None:
+    """Import the OpenAI SDK and build its client ahead of the first scoring call.
+
+    The SDK takes most of a second to import, and its API resources are imported
+    on first use of `client.chat`; run this off the event loop after startup.
+    """
+    client = async_openai_client()
+    if client is not None:
+        client.chat.completions  # imports openai.resources
+
+
+async def close_clients() -> None:
+    """Close the connection pools; clients are rebuilt if used again."""
+    with _lock:
+        pools = [_clients.pop(name, None) for name in ("http", "async_http")]
+        _clients.clear()
+    http, async_http = pools
+    if http is not None:
+        http.close()
+    if async_http is not None:
+        await async_http.aclose()
+
+
+__all__ = [
+    "HTTP_KEEPALIVE_SECONDS", "HTTP_MAX_CONNECTIONS", "HTTP_MAX_KEEPALIVE_CONNECTIONS", "async_openai_client",
+    "close_clients", "openai_client", "openai_configured", "supabase_client", "warm_up",
+]
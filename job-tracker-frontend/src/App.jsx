@@ -4,7 +4,7 @@ import "./App.css";
 const API_BASE = "http://localhost:8000";
 
 // Add Job Modal Component
-function AddJobModal({ isOpen, onClose, onJobAdded, resumeText }) {
+function AddJobModal({ isOpen, onClose, resumeText, resumeVersion }) {
   const [formData, setFormData] = useState({
     title: '',
     company: '',
@@ -19,19 +19,20 @@ function AddJobModal({ isOpen, onClose, onJobAdded, resumeText }) {
     setLoading(true);
     
     try {
-      const response = await fetch(`${API_BASE}/jobs`, {
+      // Scoring is queued; the row and its score arrive over the /events feed
+      const response = await fetch(`${API_BASE}/jobs?async_scoring=true`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({
           ...formData,
-          resume_text: resumeText || "Built ETL pipelines using Python and SQL. Familiar with dbt and Streamlit."
+          resume_text: resumeText || "Built ETL pipelines using Python and SQL. Familiar with dbt and Streamlit.",
+          ...(resumeVersion ? { resume_version: resumeVersion } : {})
         })
       });
 
       if (response.ok) {
-        alert('🎉 Job added with AI match score!');
+        alert('🎉 Job added! AI match score is on its way.');
         setFormData({ title: '', company: '', description: '', status: 'wishlist', notes: '' });
-        onJobAdded();
         onClose();
       } else {
         throw new Error('Failed to add job');
@@ -711,6 +712,9 @@ function App() {
   const [resumeText, setResumeText] = useState(
     localStorage.getItem('jobTrackerResume') || "Built ETL pipelines using Python and SQL. Familiar with dbt and Streamlit. Experience with React, FastAPI, and machine learning. Strong background in data analysis and visualization."
   );
+  const [resumeVersion, setResumeVersion] = useState(
+    localStorage.getItem('jobTrackerResumeVersion') || ""
+  );
   const [uploadedFileName, setUploadedFileName] = useState("");
   const [isUploading, setIsUploading] = useState(false);
   
@@ -724,6 +728,10 @@ function App() {
     localStorage.setItem('jobTrackerResume', resumeText);
   }, [resumeText]);
 
+  useEffect(() => {
+    localStorage.setItem('jobTrackerResumeVersion', resumeVersion);
+  }, [resumeVersion]);
+
   useEffect(() => {
     fetchJobs();
     fetchAnalytics();
@@ -733,23 +741,39 @@ function App() {
     filterAndSortJobs();
   }, [jobs, titleFilter, sortBy, activeMatchFilter]);
 
+  // Patch local state from the server's change feed instead of refetching
+  useEffect(() => {
+    const source = new EventSource(`${API_BASE}/events`);
+    source.addEventListener("job", (e) => applyJobEvent(JSON.parse(e.data)));
+    source.addEventListener("analytics", (e) => applyDashboard(JSON.parse(e.data)));
+    return () => source.close();
+  }, [statusFilter, companyFilter]);
+
   async function fetchJobs() {
     try {
       setLoading(true);
       setError("");
       
-      const params = new URLSearchParams();
+      const params = new URLSearchParams({ limit: "500" });
       if (statusFilter !== "All") params.append("status", statusFilter);
       if (companyFilter) params.append("company", companyFilter);
       
-      const response = await fetch(`${API_BASE}/jobs?${params}`);
-      
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
-      }
-      
-      const data = await response.json();
-      setJobs(data.jobs || []);
+      // Follow next_cursor through the pages (list mode omits description/skill_breakdown)
+      const allJobs = [];
+      let cursor = null;
+      do {
+        if (cursor) params.set("cursor", cursor);
+        const response = await fetch(`${API_BASE}/jobs?${params}`);
+        
+        if (!response.ok) {
+          throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        
+        const data = await response.json();
+        allJobs.push(...(data.jobs || []));
+        cursor = data.next_cursor;
+      } while (cursor);
+      setJobs(allJobs);
     } catch (err) {
       console.error("❌ Fetch error:", err);
       setError(`Failed to load jobs: ${err.message}`);
@@ -758,21 +782,41 @@ function App() {
     }
   }
 
+  function matchesServerFilters(job) {
+    return (statusFilter === "All" || job.status === statusFilter) &&
+      (!companyFilter || (job.company || "").toLowerCase().includes(companyFilter.toLowerCase()));
+  }
+
+  function applyJobEvent({ kind, rows }) {
+    if (kind === "scored") return;  // the accompanying update already carries the score
+    setJobs(current => {
+      const byId = new Map(current.map(job => [job.id, job]));
+      for (const row of rows) {
+        if (kind === "delete") {
+          byId.delete(row.id);
+        } else {
+          const job = { ...byId.get(row.id), ...row };
+          if (matchesServerFilters(job)) byId.set(row.id, job);
+          else byId.delete(row.id);
+        }
+      }
+      return [...byId.values()];
+    });
+  }
+
+  function applyDashboard(dashboard) {
+    setTopCompanies(dashboard.top_companies || []);
+    setApplicationFunnel(dashboard.funnel || {});
+    setSkillsGap(dashboard.common_gaps || []);
+    setMonthlyTrends(dashboard.monthly_trends || []);
+  }
+
   async function fetchAnalytics() {
     try {
       setAnalyticsLoading(true);
       
-      const [companiesRes, funnelRes, gapsRes, trendsRes] = await Promise.all([
-        fetch(`${API_BASE}/analytics/top-companies`),
-        fetch(`${API_BASE}/analytics/application-funnel`),
-        fetch(`${API_BASE}/analytics/skills-gap-analysis`),
-        fetch(`${API_BASE}/analytics/monthly-trends`)
-      ]);
-
-      if (companiesRes.ok) setTopCompanies((await companiesRes.json()).top_companies || []);
-      if (funnelRes.ok) setApplicationFunnel((await funnelRes.json()).funnel || {});
-      if (gapsRes.ok) setSkillsGap((await gapsRes.json()).common_gaps || []);
-      if (trendsRes.ok) setMonthlyTrends((await trendsRes.json()).monthly_trends || []);
+      const response = await fetch(`${API_BASE}/analytics/dashboard`);
+      if (response.ok) applyDashboard(await response.json());
       
     } catch (err) {
       console.error("Analytics fetch error:", err);
@@ -846,6 +890,7 @@ function App() {
       
       if (result.success) {
         setResumeText(result.resume_text);
+        setResumeVersion(result.resume_version || "");
         setUploadedFileName(file.name);
         alert(`✅ Resume uploaded successfully! Extracted ${result.char_count} characters.`);
       } else {
@@ -876,9 +921,20 @@ function App() {
     return `status-badge status-${status}`;
   };
 
-  const viewSkillBreakdown = (job) => {
+  const viewSkillBreakdown = async (job) => {
     setSelectedJob(job);
     setIsSkillModalOpen(true);
+    if (job.skill_breakdown === undefined) {
+      try {
+        const response = await fetch(`${API_BASE}/jobs/${job.id}?fields=skill_breakdown`);
+        if (response.ok) {
+          const data = await response.json();
+          setSelectedJob({ ...job, skill_breakdown: data.job.skill_breakdown });
+        }
+      } catch (err) {
+        console.error("Skill breakdown fetch error:", err);
+      }
+    }
   };
 
   return (
@@ -926,7 +982,11 @@ function App() {
           <label className="block text-primary mb-4 text-xl font-semibold">Or paste resume text manually:</label>
           <textarea
             value={resumeText}
-            onChange={(e) => setResumeText(e.target.value)}
+            onChange={(e) => {
+              setResumeText(e.target.value);
+              // Edited text no longer matches the uploaded resume's stored profile
+              setResumeVersion("");
+            }}
             className="resume-textarea form-input"
             placeholder="Paste your resume text here... AI will match jobs against this text"
           />
@@ -1116,7 +1176,7 @@ function App() {
                     onClick={() => viewSkillBreakdown(job)}
                     title="Click to view detailed skill breakdown"
                   >
-                    {job.match_score}%
+                    {job.scoring_status === "pending" ? "⏳ scoring" : `${job.match_score}%`}
                   </td>
                   <td className="py-5 px-6 text-gray-300 text-lg truncate max-w-xs">{job.notes || "-"}</td>
                   <td className="py-5 px-6 text-gray-400 text-lg">
@@ -1132,11 +1192,8 @@ function App() {
       <AddJobModal 
         isOpen={isAddModalOpen}
         onClose={() => setIsAddModalOpen(false)}
-        onJobAdded={() => {
-          fetchJobs();
-          fetchAnalytics();
-        }}
         resumeText={resumeText}
+        resumeVersion={resumeVersion}
       />
 
       <SkillBreakdownModal 
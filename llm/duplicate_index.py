@@ -0,0 +1,165 @@
+# llm/duplicate_index.py
+# Near-duplicate detection for job postings: MinHash signatures of each
+# description's word 3-gram shingles, bucketed per company by LSH bands so a
+# lookup only compares against postings likely to be similar.
+
+import os
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+_COMPANY_SUFFIX = re.compile(r"\s+(?:inc|llc|ltd|limited|corp|corporation|co|gmbh|plc|sa|ag|bv)$")
+
+SHINGLE_SIZE = 3
+NUM_PERM = 128
+# Multiply-shift hash functions, one per signature slot; fixed so signatures are comparable
+_rng = np.random.default_rng(20240601)
+_MULTIPLIERS = _rng.integers(1, 2 ** 63, NUM_PERM, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_OFFSETS = _rng.integers(0, 2 ** 63, NUM_PERM, dtype=np.uint64)
+
+
+def company_key(company: Optional[str]) -> str:
+    """Company name compared case- and punctuation-insensitively, without a legal suffix."""
+    key = " ".join(re.sub(r"[^a-z0-9]+", " ", (company or "").lower()).split())
+    return _COMPANY_SUFFIX.sub("", key)
+
+
+def minhash(text: Optional[str]) -> Optional[np.ndarray]:
+    """MinHash signature of the text's word shingles; None for text without words.
+
+    Shingles are hashed with the built-in str hash: stable within a process,
+    which is all an in-memory index needs.
+    """
+    tokens = _TOKEN_RE.findall((text or "").lower())
+    if not tokens:
+        return None
+    size = min(SHINGLE_SIZE, len(tokens))
+    shingles = {hash(tuple(tokens[i:i + size])) for i in range(len(tokens) - size + 1)}
+    hashes = np.fromiter(shingles, dtype=np.int64, count=len(shingles)).view(np.uint64)
+    # uint64 arithmetic wraps, which is the "mod 2^64" of multiply-shift hashing
+    with np.errstate(over="ignore"):
+        mixed = hashes[:, None] * _MULTIPLIERS + _OFFSETS
+    return (mixed >> np.uint64(32)).astype(np.uint32).min(axis=0)
+
+
+def _lsh_shape(similarity: float) -> Tuple[int, int]:
+    """(bands, rows per band) whose candidate threshold sits a little below `similarity`.
+
+    A pair with Jaccard similarity s shares at least one band with probability
+    1 - (1 - s^rows)^bands, which rises steeply around (1/bands)^(1/rows).
+    """
+    shapes = [(NUM_PERM // rows, rows) for rows in range(1, NUM_PERM + 1) if NUM_PERM % rows == 0]
+    below = [shape for shape in shapes if (1 / shape[0]) ** (1 / shape[1]) <= similarity - 0.05]
+    return max(below, key=lambda shape: (1 / shape[0]) ** (1 / shape[1])) if below else shapes[0]
+
+
+class DuplicateIndex:
+    """Postings per company, found again when a new description is within `similarity`.
+
+    Similarity is the Jaccard similarity of the two descriptions' word 3-gram
+    sets, estimated from NUM_PERM-slot MinHash signatures. Signatures are split
+    into LSH bands; only postings of the same company sharing a band with the
+    new one are compared. similarity=0 disables the index: nothing is stored
+    and find() never matches.
+    """
+
+    def __init__(self, similarity: float = 0.8):
+        self.enabled = similarity > 0
+        self.similarity = min(1.0, similarity)
+        self.bands, self.rows = _lsh_shape(self.similarity)
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets: Dict[Tuple[str, int, bytes], Set[Any]] = {}
+            self._entries: Dict[Any, Tuple[str, np.ndarray]] = {}
+            # Hash of each row's company and description; updates that keep both skip the MinHash
+            self._digest: Dict[Any, int] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    def _keys(self, company: str, signature: np.ndarray) -> Iterable[Tuple[str, int, bytes]]:
+        for band in range(self.bands):
+            yield company, band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def find(self, company: Optional[str], description: Optional[str],
+             signature: Optional[np.ndarray] = None) -> Optional[Tuple[Any, float]]:
+        """(job id, similarity) of the closest indexed posting by the same company, if near enough."""
+        if not self.enabled:
+            return None
+        signature = minhash(description) if signature is None else signature
+        if signature is None:
+            return None
+        company = company_key(company)
+        with self._lock:
+            candidates = set()
+            for key in self._keys(company, signature):
+                candidates |= self._buckets.get(key, set())
+            if not candidates:
+                return None
+            ids = list(candidates)
+            others = np.stack([self._entries[job_id][1] for job_id in ids])
+        similarities = np.count_nonzero(others == signature, axis=1) / NUM_PERM
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity:
+            return None
+        return ids[best], round(float(similarities[best]), 4)
+
+    def rebuild(self, pages: Iterable[List[Dict[str, Any]]]) -> None:
+        """Index every row from scratch (startup); `pages` yields lists of job rows."""
+        self.clear()
+        for page in pages:
+            self.apply("insert", page)
+
+    def apply(self, kind: str, rows: List[Dict[str, Any]]) -> None:
+        """JobStore change listener; rows need id, and company plus description to be (re)indexed.
+
+        Rows already marked as a duplicate (duplicate_of set) are not indexed, so
+        later copies are matched to the original posting.
+        """
+        if not self.enabled:
+            return
+        for row in rows:
+            job_id = row["id"]
+            if kind == "delete" or row.get("duplicate_of") is not None:
+                self._remove(job_id)
+                continue
+            if "description" not in row or "company" not in row:
+                continue
+            digest = hash((row["company"], row["description"]))
+            if self._digest.get(job_id) == digest:
+                continue
+            signature = minhash(row["description"])
+            with self._lock:
+                self._remove_locked(job_id)
+                self._digest[job_id] = digest
+                if signature is not None:
+                    company = company_key(row["company"])
+                    self._entries[job_id] = (company, signature)
+                    for key in self._keys(company, signature):
+                        self._buckets.setdefault(key, set()).add(job_id)
+
+    def _remove(self, job_id: Any) -> None:
+        with self._lock:
+            self._remove_locked(job_id)
+
+    def _remove_locked(self, job_id: Any) -> None:
+        self._digest.pop(job_id, None)
+        entry = self._entries.pop(job_id, None)
+        if entry is None:
+            return
+        for key in self._keys(*entry):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(job_id)
+                if not bucket:
+                    del self._buckets[key]
+
+
+duplicate_index = DuplicateIndex(float(os.getenv("DUPLICATE_SIMILARITY", "0.8")))
@@ -0,0 +1,140 @@
+# llm/json_stream.py
+# Push parser for a JSON object that arrives a few characters at a time (a
+# streamed completion). Reports each value as soon as its closing character is
+# seen and fails on the first character that cannot belong to valid JSON.
+
+import json
+from typing import Any, List, Optional, Tuple
+
+Path = Tuple[Any, ...]
+
+_WHITESPACE = " \t\r\n"
+_SCALAR_END = ",}]" + _WHITESPACE
+
+
+class StreamError(ValueError):
+    """The stream stopped being valid JSON."""
+
+
+class JSONStreamParser:
+    """Incrementally parse one JSON object.
+
+    feed() returns (path, value) for every value completed by the new text, up
+    to `max_depth` levels deep: ("match_score",) for a top-level member,
+    ("skill_breakdown", 0) for the first element of a top-level array, and ()
+    for the whole object once it closes. Text before the first "{" and after the
+    closing "}" is ignored, like the markdown fences models sometimes add.
+    """
+
+    def __init__(self, max_depth: int = 2):
+        self.max_depth = max_depth
+        self.text = ""
+        self.done = False
+        self._pos = 0
+        # One frame per open container: [kind, state, key or index, start offset]
+        self._stack: List[list] = []
+        self._string_start: Optional[int] = None
+        self._string_is_key = False
+        self._escape = False
+        self._scalar_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Tuple[Path, Any]]:
+        self.text += chunk
+        events: List[Tuple[Path, Any]] = []
+        text = self.text
+        while self._pos < len(text) and not self.done:
+            i = self._pos
+            c = text[i]
+            self._pos += 1
+
+            if self._string_start is not None:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    start, self._string_start = self._string_start, None
+                    if self._string_is_key:
+                        frame = self._stack[-1]
+                        frame[2] = self._loads(start, i + 1)
+                        frame[1] = "colon"
+                    else:
+                        self._complete(start, i + 1, events)
+                continue
+
+            if self._scalar_start is not None:
+                if c not in _SCALAR_END:
+                    continue
+                start, self._scalar_start = self._scalar_start, None
+                self._complete(start, i, events)
+
+            if not self._stack:
+                if c == "{":
+                    self._stack.append(["{", "key", None, i])
+                continue  # preamble before the object
+            if c in _WHITESPACE:
+                continue
+
+            frame = self._stack[-1]
+            kind, state = frame[0], frame[1]
+            if state == "comma":
+                if c == ",":
+                    frame[1] = "key" if kind == "{" else "value"
+                elif c == ("}" if kind == "{" else "]"):
+                    self._stack.pop()
+                    self._complete(frame[3], i + 1, events)
+                else:
+                    self._fail(c, i)
+            elif state == "key":
+                if c == '"':
+                    self._string_start, self._string_is_key = i, True
+                elif c == "}" and frame[2] is None:
+                    self._stack.pop()
+                    self._complete(frame[3], i + 1, events)
+                else:
+                    self._fail(c, i)
+            elif state == "colon":
+                if c != ":":
+                    self._fail(c, i)
+                frame[1] = "value"
+            else:  # value
+                if kind == "[":
+                    frame[2] = -1 if frame[2] is None else frame[2]
+                    if c == "]" and frame[2] == -1:
+                        self._stack.pop()
+                        self._complete(frame[3], i + 1, events)
+                        continue
+                    frame[2] += 1
+                self._start_value(c, i)
+        return events
+
+    def _start_value(self, c: str, i: int) -> None:
+        if c == "{":
+            self._stack.append(["{", "key", None, i])
+        elif c == "[":
+            self._stack.append(["[", "value", None, i])
+        elif c == '"':
+            self._string_start, self._string_is_key = i, False
+        elif c in "-0123456789tfn":
+            self._scalar_start = i
+        else:
+            self._fail(c, i)
+
+    def _complete(self, start: int, end: int, events: List[Tuple[Path, Any]]) -> None:
+        """A value spanning text[start:end] just closed inside the current frame."""
+        path = tuple(frame[2] for frame in self._stack)
+        if len(path) <= self.max_depth:
+            events.append((path, self._loads(start, end)))
+        if self._stack:
+            self._stack[-1][1] = "comma"
+        else:
+            self.done = True
+
+    def _loads(self, start: int, end: int) -> Any:
+        try:
+            return json.loads(self.text[start:end])
+        except ValueError as e:
+            raise StreamError(f"Invalid JSON value at offset {start}: {e}") from None
+
+    def _fail(self, c: str, i: int) -> None:
+        raise StreamError(f"Unexpected {c!r} at offset {i}")
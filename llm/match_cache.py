@@ -0,0 +1,198 @@
+# llm/match_cache.py
+# Two-tier cache for match results: an in-process LRU in front of a SQLite file
+# that survives restarts and is shared by every uvicorn worker on the host.
+# Only the LRU is touched on the caller's thread: disk reads from async code go
+# through aget() in a worker thread, and disk writes are queued for a background
+# writer, so a scoring coroutine never waits on SQLite.
+
+import asyncio
+import atexit
+import hashlib
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from telemetry import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / ".cache" / "match_cache.sqlite3"
+
+
+def make_key(resume_hash: str, job_desc: str, model: str, prompt_version: str) -> str:
+    """Content address for one scoring request; resume_hash is llm.text_utils.content_hash(resume)."""
+    h = hashlib.sha256()
+    for part in (model, prompt_version, resume_hash, job_desc):
+        data = part.encode("utf-8")
+        # Length-prefix each field so ("ab", "c") and ("a", "bc") never collide
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+    return h.hexdigest()
+
+
+class MatchCache:
+    def __init__(self, max_entries: int = 2048, ttl_seconds: float = 7 * 24 * 3600,
+                 path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        # _lock guards the LRU and counters only; _db_lock serializes the SQLite connection
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._db = None
+        self._writes = 0
+        self._pending: "queue.Queue[tuple]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA busy_timeout=5000")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS match_cache ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            # Queued writes are finished before the interpreter exits
+            atexit.register(self.flush)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached result for key, reading SQLite on this thread on a memory miss."""
+        found = self._memory_get(key)
+        if found is None and self._db is not None:
+            found = self._disk_get(key)
+        return self._counted(found)
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """get() for the event loop: the LRU is checked inline, SQLite in a worker thread."""
+        found = self._memory_get(key)
+        if found is None and self._db is not None:
+            found = await asyncio.to_thread(self._disk_get, key)
+        return self._counted(found)
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store result in the LRU now and queue it for the SQLite file."""
+        value = json.dumps(result)
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+        if self._db is not None:
+            self._pending.put((key, value, now))
+            self._start_writer()
+
+    def flush(self) -> None:
+        """Wait until every queued write has reached the SQLite file."""
+        if self._writer is not None:
+            self._pending.join()
+
+    def _memory_get(self, key: str) -> Optional[tuple]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            value, created_at = entry
+            if now - created_at > self.ttl_seconds:
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return "memory", value
+
+    def _disk_get(self, key: str) -> Optional[tuple]:
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT value, created_at FROM match_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            return None
+        with self._lock:
+            self._remember(key, row[0], row[1])
+        return "disk", row[0]
+
+    def _counted(self, found: Optional[tuple]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if found is None:
+                self.misses += 1
+                return None
+            tier, value = found
+            if tier == "memory":
+                self.memory_hits += 1
+            else:
+                self.disk_hits += 1
+        return json.loads(value)
+
+    def _start_writer(self) -> None:
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_behind, name="match-cache-writer", daemon=True)
+                self._writer.start()
+
+    def _write_behind(self) -> None:
+        while True:
+            batch = [self._pending.get()]
+            # Whatever queued up meanwhile goes in the same transaction, one commit for all
+            while True:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            except sqlite3.Error:
+                # Losing a cache write only costs a later re-score
+                logger.exception("Match cache write failed", extra={"entries": len(batch)})
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+
+    def _write(self, batch) -> None:
+        with self._db_lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO match_cache (key, value, created_at) VALUES (?, ?, ?)", batch
+                )
+                previous, self._writes = self._writes, self._writes + len(batch)
+                if previous // 500 != self._writes // 500:
+                    self._db.execute(
+                        "DELETE FROM match_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+                    )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def _remember(self, key: str, value: str, created_at: float) -> None:
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "persistent": self._db is not None,
+        }
+
+
+match_cache = MatchCache(
+    max_entries=int(os.getenv("MATCH_CACHE_SIZE", "2048")),
+    ttl_seconds=float(os.getenv("MATCH_CACHE_TTL", str(7 * 24 * 3600))),
+    # Set MATCH_CACHE_PATH to an empty string to keep the cache in memory only
+    path=os.getenv("MATCH_CACHE_PATH", str(DEFAULT_CACHE_PATH)) or None,
+)
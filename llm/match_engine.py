@@ -1,22 +1,40 @@
 # llm/match_engine.py
 
-from openai import OpenAI, RateLimitError, AuthenticationError
+import asyncio
 import os
 import json
-from dotenv import load_dotenv
-from pathlib import Path
-from typing import Dict, Any
+import time
+from functools import lru_cache
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 
-# Load .env from project root
-load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent / ".env")
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-MODEL_NAME = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+from clients import async_openai_client, openai_client, openai_configured
+from llm.json_stream import JSONStreamParser, StreamError
+from llm.match_cache import match_cache, make_key
+from llm.prompt_compactor import compact_job_description, compact_resume
+from llm.scheduler import LLMScheduler, SchedulerBusy
+from llm.text_utils import content_hash, count_tokens
+from telemetry import LLM_SECONDS, get_logger
+
+logger = get_logger(__name__)
 
-client = None
-if OPENAI_API_KEY and OPENAI_API_KEY.startswith("sk-"):
-    client = OpenAI(api_key=OPENAI_API_KEY)
-else:
-    print("⚠️  OpenAI key not found — using fallback match engine")
+MODEL_NAME = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+# Bump whenever _prompt_for_match, prompt compaction or _safe_parse_json changes so cached results are not reused
+PROMPT_VERSION = "3"
+# Upper bound on LLM requests in flight from one worker process
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+# Per-worker share of the account's OpenAI limits
+LLM_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+LLM_TOKENS_PER_MINUTE = float(os.getenv("LLM_TOKENS_PER_MINUTE", "200000"))
+LLM_QUEUE_MAX = int(os.getenv("LLM_QUEUE_MAX", "1000"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "4"))
+MATCH_MAX_TOKENS = 1000
+# Token budgets for the resume and job description once compacted into the prompt
+PROMPT_RESUME_MAX_TOKENS = int(os.getenv("PROMPT_RESUME_MAX_TOKENS", "2000"))
+PROMPT_JD_MAX_TOKENS = int(os.getenv("PROMPT_JD_MAX_TOKENS", "1200"))
+
+# The OpenAI clients themselves are built on first use (clients/__init__.py)
+if not openai_configured():
+    logger.warning("OpenAI key not found — using fallback match engine")
 
 
 def _prompt_for_match(resume: str, job_desc: str) -> str:
@@ -65,40 +83,44 @@ JOB DESCRIPTION:
 """
 
 
+def _clamp_score(value: Any) -> int:
+    return max(0, min(100, int(round(float(value)))))
+
+
+def _validate_skill(skill: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        "skill": str(skill.get("skill", "Unknown")),
+        "match_level": str(skill.get("match_level", "missing")),
+        "reason": str(skill.get("reason", "")),
+        "importance": str(skill.get("importance", "medium"))
+    }
+
+
+def _normalize_result(parsed: Dict[str, Any]) -> Dict[str, Any]:
+    # Ensure all required fields with defaults
+    parsed["match_score"] = _clamp_score(parsed.get("match_score", 0))
+    parsed["strengths"] = str(parsed.get("strengths", ""))
+    parsed["gaps"] = str(parsed.get("gaps", ""))
+
+    # Ensure skill_breakdown exists and has proper structure
+    skill_breakdown = parsed.get("skill_breakdown", [])
+    if not isinstance(skill_breakdown, list):
+        skill_breakdown = []
+
+    # Validate each skill entry
+    parsed["skill_breakdown"] = [_validate_skill(skill) for skill in skill_breakdown if isinstance(skill, dict)]
+    return parsed
+
+
 def _safe_parse_json(raw_output: str) -> Dict[str, Any]:
     try:
         json_start = raw_output.find("{")
         json_end = raw_output.rfind("}") + 1
         json_str = raw_output[json_start:json_end]
-        parsed = json.loads(json_str)
-
-        # Ensure all required fields with defaults
-        parsed["match_score"] = int(round(float(parsed.get("match_score", 0))))
-        parsed["match_score"] = max(0, min(100, parsed["match_score"]))
-        parsed["strengths"] = str(parsed.get("strengths", ""))
-        parsed["gaps"] = str(parsed.get("gaps", ""))
-        
-        # Ensure skill_breakdown exists and has proper structure
-        skill_breakdown = parsed.get("skill_breakdown", [])
-        if not isinstance(skill_breakdown, list):
-            skill_breakdown = []
-        
-        # Validate each skill entry
-        validated_skills = []
-        for skill in skill_breakdown:
-            if isinstance(skill, dict):
-                validated_skills.append({
-                    "skill": str(skill.get("skill", "Unknown")),
-                    "match_level": str(skill.get("match_level", "missing")),
-                    "reason": str(skill.get("reason", "")),
-                    "importance": str(skill.get("importance", "medium"))
-                })
-        
-        parsed["skill_breakdown"] = validated_skills
-        return parsed
+        return _normalize_result(json.loads(json_str))
 
     except Exception as e:
-        print("❌ Failed to parse JSON:", e)
+        logger.warning("Failed to parse model output as JSON", extra={"error": str(e)})
         return {
             "match_score": 50,
             "strengths": "Parsing failed",
@@ -107,79 +129,133 @@ def _safe_parse_json(raw_output: str) -> Dict[str, Any]:
         }
 
 
-def _fallback_match_score(resume: str, job_desc: str) -> Dict[str, Any]:
-    keywords = [
-        {'skill': 'Python', 'weight': 15},
-        {'skill': 'SQL', 'weight': 10},
-        {'skill': 'ETL', 'weight': 12},
-        {'skill': 'Docker', 'weight': 10},
-        {'skill': 'Kubernetes', 'weight': 10},
-        {'skill': 'AWS', 'weight': 10},
-        {'skill': 'PostgreSQL', 'weight': 8},
-        {'skill': 'Rust', 'weight': 8},
-        {'skill': 'B2B', 'weight': 7},
-        {'skill': 'MongoDB', 'weight': 5},
-        {'skill': 'FastAPI', 'weight': 5},
-        {'skill': 'React', 'weight': 5},
-        {'skill': 'Spark', 'weight': 8},
-        {'skill': 'Airflow', 'weight': 8},
-        {'skill': 'Tableau', 'weight': 5},
-        {'skill': 'Power BI', 'weight': 5},
-        {'skill': 'NumPy', 'weight': 5},
-        {'skill': 'Pandas', 'weight': 5},
-        {'skill': 'Scikit-Learn', 'weight': 5},
-        {'skill': 'OpenCV', 'weight': 4},
-    ]
-
+SKILL_KEYWORDS = [
+    {'skill': 'Python', 'weight': 15},
+    {'skill': 'SQL', 'weight': 10},
+    {'skill': 'ETL', 'weight': 12},
+    {'skill': 'Docker', 'weight': 10},
+    {'skill': 'Kubernetes', 'weight': 10},
+    {'skill': 'AWS', 'weight': 10},
+    {'skill': 'PostgreSQL', 'weight': 8},
+    {'skill': 'Rust', 'weight': 8},
+    {'skill': 'B2B', 'weight': 7},
+    {'skill': 'MongoDB', 'weight': 5},
+    {'skill': 'FastAPI', 'weight': 5},
+    {'skill': 'React', 'weight': 5},
+    {'skill': 'Spark', 'weight': 8},
+    {'skill': 'Airflow', 'weight': 8},
+    {'skill': 'Tableau', 'weight': 5},
+    {'skill': 'Power BI', 'weight': 5},
+    {'skill': 'NumPy', 'weight': 5},
+    {'skill': 'Pandas', 'weight': 5},
+    {'skill': 'Scikit-Learn', 'weight': 5},
+    {'skill': 'OpenCV', 'weight': 4},
+]
+
+
+class _LiteralMatcher:
+    """Finds every occurrence of a fixed set of lowercase literals, built once at import.
+
+    Each literal is located with str.find, which runs CPython's C fast-search; on
+    multi-KB job descriptions that beats a single alternation regex several times
+    over. With word_bounded=True a hit only counts when it is not part of a longer
+    word, so "rust" does not match inside "trust" nor "sql" inside "postgresql".
+    """
+
+    def __init__(self, literals: List[str], word_bounded: bool):
+        self._literals = [(i, literal.lower(), len(literal)) for i, literal in enumerate(literals)]
+        self._word_bounded = word_bounded
+
+    def find_all(self, text_lower: str) -> Dict[int, List[int]]:
+        """Literal index -> start offsets of every hit."""
+        hits: Dict[int, List[int]] = {}
+        text_len = len(text_lower)
+        for i, literal, size in self._literals:
+            start = text_lower.find(literal)
+            while start != -1:
+                end = start + size
+                if not self._word_bounded or (
+                    (start == 0 or not _is_word_char(text_lower[start - 1]))
+                    and (end == text_len or not _is_word_char(text_lower[end]))
+                ):
+                    hits.setdefault(i, []).append(start)
+                start = text_lower.find(literal, start + 1)
+        return hits
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+_SKILL_MATCHER = _LiteralMatcher([kw['skill'] for kw in SKILL_KEYWORDS], word_bounded=True)
+_SKILL_INDEX = {kw['skill']: i for i, kw in enumerate(SKILL_KEYWORDS)}
+_SECTION_MARKERS = ["required", "must have", "nice to have", "nice", "preferred"]
+_SECTION_MATCHER = _LiteralMatcher(_SECTION_MARKERS, word_bounded=False)
+
+
+def _resume_signals(resume: str) -> Tuple[frozenset, bool]:
+    """Resume-side inputs to the fallback scorer: matched keyword indexes and experience flag."""
     resume_lower = resume.lower()
+    has_experience = "senior" in resume_lower or "years" in resume_lower
+    return frozenset(_SKILL_MATCHER.find_all(resume_lower)), has_experience
+
+
+def resume_skill_names(resume: str) -> Tuple[List[str], bool]:
+    """Skill keywords found in a resume plus the experience flag, for storing in a resume profile."""
+    skills, has_experience = _resume_signals(resume)
+    return [SKILL_KEYWORDS[i]['skill'] for i in sorted(skills)], has_experience
+
+
+def _profile_signals(profile: Dict[str, Any]) -> Tuple[frozenset, bool]:
+    skills = frozenset(_SKILL_INDEX[name] for name in profile["skills"] if name in _SKILL_INDEX)
+    return skills, profile["has_experience"]
+
+
+def _score_job(resume_skills: frozenset, resume_has_experience: bool, job_desc: str) -> Dict[str, Any]:
     jd_lower = job_desc.lower()
+    jd_hits = _SKILL_MATCHER.find_all(jd_lower)
+    markers = sorted(
+        (start, start + len(_SECTION_MARKERS[i]), _SECTION_MARKERS[i])
+        for i, starts in _SECTION_MATCHER.find_all(jd_lower).items()
+        for start in starts
+    )
+
+    # Section boundaries: the required section runs from the first "required" up to the
+    # next section marker; the nice-to-have section runs from "nice to have"/"preferred" to the end.
+    has_required = any(kind == "required" for _, _, kind in markers)
+    required_start = required_end = None
+    nice_start = None
+    for start, end, kind in markers:
+        if required_start is None:
+            if kind == "required":
+                required_start, required_end = end, len(jd_lower)
+        elif required_end == len(jd_lower) and kind in ("required", "nice", "preferred"):
+            required_end = start
+        if kind in ("nice to have", "preferred") and nice_start is None:
+            nice_start = end
+    context_markers = [(start, end) for start, end, kind in markers if kind in ("required", "must have")]
 
-    # First, identify which skills are REQUIRED vs NICE-TO-HAVE in the JD
     required_skills = []
     nice_to_have_skills = []
-    
-    # Check for explicit "required" section
-    required_section = ""
-    nice_to_have_section = ""
-    
-    if "required" in jd_lower:
-        parts = jd_lower.split("required")
-        if len(parts) > 1:
-            required_section = parts[1].split("nice")[0] if "nice" in parts[1] else parts[1].split("preferred")[0] if "preferred" in parts[1] else parts[1]
-    if "nice to have" in jd_lower:
-        nice_to_have_section = jd_lower.split("nice to have")[1] if "nice to have" in jd_lower else ""
-    if "preferred" in jd_lower:
-        nice_to_have_section += jd_lower.split("preferred")[1] if "preferred" in jd_lower else ""
-    
-    for kw in keywords:
-        skill_name = kw['skill']
-        skill_lower = skill_name.lower()
-        weight = kw['weight']
-        
-        if skill_lower in jd_lower:
-            # Check if skill appears in required section or is explicitly required
+    for i in sorted(jd_hits):
+        kw = SKILL_KEYWORDS[i]
+        positions = jd_hits[i]
+
+        if required_start is not None and any(required_start <= p < required_end for p in positions):
+            is_required = True
+        elif nice_start is not None and any(p >= nice_start for p in positions):
             is_required = False
-            is_nice_to_have = False
-            
-            if required_section and skill_lower in required_section:
-                is_required = True
-            elif nice_to_have_section and skill_lower in nice_to_have_section:
-                is_nice_to_have = True
-            elif "required" in jd_lower and skill_lower in jd_lower:
-                # If there's a required section but skill not in it, check surrounding context
-                idx = jd_lower.find(skill_lower)
-                surrounding = jd_lower[max(0, idx-50):min(len(jd_lower), idx+50)]
-                if "required" in surrounding or "must have" in surrounding:
-                    is_required = True
-                else:
-                    is_nice_to_have = True
-            else:
-                is_required = True  # Default to required if not specified
-            
-            if is_required:
-                required_skills.append({'skill': skill_name, 'weight': weight, 'skill_lower': skill_lower})
-            else:
-                nice_to_have_skills.append({'skill': skill_name, 'weight': weight * 0.5, 'skill_lower': skill_lower})  # Half weight for nice-to-have
+        elif has_required:
+            # Skill sits outside both sections: look for "required"/"must have" nearby
+            idx = positions[0]
+            is_required = any(start >= idx - 50 and end <= idx + 50 for start, end in context_markers)
+        else:
+            is_required = True  # Default to required if not specified
+
+        if is_required:
+            required_skills.append((i, kw['skill'], kw['weight']))
+        else:
+            nice_to_have_skills.append((i, kw['skill'], kw['weight'] * 0.5))  # Half weight for nice-to-have
 
     # Calculate weighted score
     total_weight = 0
@@ -189,13 +265,10 @@ def _fallback_match_score(resume: str, job_desc: str) -> Dict[str, Any]:
     gaps = []
 
     # Score required skills
-    for kw in required_skills:
-        skill_name = kw['skill']
-        weight = kw['weight']
-        skill_lower = kw['skill_lower']
+    for i, skill_name, weight in required_skills:
         total_weight += weight
-        
-        if skill_lower in resume_lower:
+
+        if i in resume_skills:
             # Full points if in resume
             earned_weight += weight
             strengths.append(skill_name)
@@ -216,13 +289,10 @@ def _fallback_match_score(resume: str, job_desc: str) -> Dict[str, Any]:
             })
 
     # Score nice-to-have skills
-    for kw in nice_to_have_skills:
-        skill_name = kw['skill']
-        weight = kw['weight']
-        skill_lower = kw['skill_lower']
+    for i, skill_name, weight in nice_to_have_skills:
         total_weight += weight
-        
-        if skill_lower in resume_lower:
+
+        if i in resume_skills:
             earned_weight += weight
             skill_breakdown.append({
                 "skill": skill_name,
@@ -243,28 +313,28 @@ def _fallback_match_score(resume: str, job_desc: str) -> Dict[str, Any]:
         raw_score = (earned_weight / total_weight) * 100
     else:
         raw_score = 50
-    
+
     # Add bonus/penalty for senior/experience level keywords
     experience_bonus = 0
-    if "senior" in job_desc.lower():
-        if "senior" in resume_lower or "years" in resume_lower:
+    if "senior" in jd_lower:
+        if resume_has_experience:
             experience_bonus = 5
         else:
             experience_bonus = -10  # Bigger penalty for senior roles with no experience
-    
+
     # Penalty for missing key required skills (if more than 2 required skills missing)
-    missing_required_count = len([s for s in skill_breakdown if s['importance'] == 'high' and s['match_level'] == 'missing'])
+    missing_required_count = len(gaps)
     if missing_required_count >= 3:
         experience_bonus -= 10
     elif missing_required_count >= 2:
         experience_bonus -= 5
-    
+
     # Bonus for having all required skills
     if missing_required_count == 0 and len(required_skills) > 0:
         experience_bonus += 8
-    
+
     final_score = max(0, min(100, raw_score + experience_bonus))
-    
+
     # Format strengths and gaps strings
     strengths_str = ", ".join(strengths[:5]) if strengths else "Some alignment found"
     gaps_str = ", ".join(gaps[:5]) if gaps else "No major gaps identified"
@@ -277,33 +347,299 @@ def _fallback_match_score(resume: str, job_desc: str) -> Dict[str, Any]:
     }
 
 
+def _fallback_match_score(resume: str, job_desc: str) -> Dict[str, Any]:
+    return _score_job(*_resume_signals(resume), job_desc)
+
+
+def _fallback_for(resume: str, job_desc: str, profile: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if profile is not None:
+        return _score_job(*_profile_signals(profile), job_desc)
+    return _fallback_match_score(resume, job_desc)
+
+
+def fallback_match_scores(resume: str, job_descs: List[str],
+                          profile: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Keyword-score one resume against many job descriptions.
+
+    The resume is scanned once (or not at all when a resume profile is given);
+    each description then costs a single pass of the skill and section matchers.
+    """
+    resume_skills, resume_has_experience = _profile_signals(profile) if profile else _resume_signals(resume)
+    return [_score_job(resume_skills, resume_has_experience, jd) for jd in job_descs]
+
+
+llm_scheduler = LLMScheduler(
+    requests_per_minute=LLM_REQUESTS_PER_MINUTE,
+    tokens_per_minute=LLM_TOKENS_PER_MINUTE,
+    max_concurrency=LLM_MAX_CONCURRENCY,
+    max_queue=LLM_QUEUE_MAX,
+    max_retries=LLM_MAX_RETRIES,
+)
+
+
+def _async_client():
+    """Shared AsyncOpenAI client, or None without an API key.
+
+    openai is only imported along with the client, so llm_scheduler learns which
+    of its errors to retry here rather than at import.
+    """
+    client = async_openai_client()
+    if client is not None and not llm_scheduler.rate_limit_errors:
+        import openai
+
+        llm_scheduler.rate_limit_errors = (openai.RateLimitError,)
+        llm_scheduler.transient_errors = (openai.APIConnectionError, openai.InternalServerError)
+    return client
+
+
+def _fallback_errors() -> Tuple[type, ...]:
+    """Errors answered with the keyword score and logged without a traceback.
+
+    Only evaluated once a call has failed, by which point openai is imported.
+    """
+    import openai
+
+    return openai.RateLimitError, openai.AuthenticationError, SchedulerBusy
+
+# Tokens in the prompt template itself, counted once
+_PROMPT_OVERHEAD_TOKENS = count_tokens(_prompt_for_match("", "")) + 20
+
+
+# The same resume is sent with every job and the same description again on retries
+@lru_cache(maxsize=16)
+def _prompt_resume(resume: str) -> Tuple[str, int]:
+    text = compact_resume(resume, PROMPT_RESUME_MAX_TOKENS)
+    return text, count_tokens(text)
+
+
+@lru_cache(maxsize=1024)
+def _prompt_job_desc(job_desc: str) -> Tuple[str, int]:
+    text = compact_job_description(job_desc, PROMPT_JD_MAX_TOKENS)
+    return text, count_tokens(text)
+
+
+def _estimated_tokens(resume: str, job_desc: str) -> int:
+    """What a scoring call counts against tokens/min: prompt plus the completion allowance."""
+    return _PROMPT_OVERHEAD_TOKENS + _prompt_resume(resume)[1] + _prompt_job_desc(job_desc)[1] + MATCH_MAX_TOKENS
+
+
+def _messages_for_match(resume: str, job_desc: str):
+    return [
+        {"role": "system", "content": "Only return valid JSON. No markdown."},
+        {"role": "user", "content": _prompt_for_match(_prompt_resume(resume)[0], _prompt_job_desc(job_desc)[0])},
+    ]
+
+
+def _cache_result(cache_key: str, raw_output: str) -> Dict[str, Any]:
+    parsed = _safe_parse_json(raw_output)
+    # Parse failures come back as a placeholder; only real answers are worth keeping
+    if parsed.get("strengths") != "Parsing failed":
+        match_cache.set(cache_key, parsed)
+    return parsed
+
+
+def _observed(outcome: str, started: float, result: Dict[str, Any]) -> Dict[str, Any]:
+    LLM_SECONDS.labels(outcome=outcome).observe(time.perf_counter() - started)
+    return result
+
+
 def get_match_score(resume: str, job_desc: str) -> Dict[str, Any]:
+    started = time.perf_counter()
+    client = openai_client()
     if client is None:
-        return _fallback_match_score(resume, job_desc)
+        return _observed("fallback", started, _fallback_match_score(resume, job_desc))
 
-    try:
-        messages = [
-            {"role": "system", "content": "Only return valid JSON. No markdown."},
-            {"role": "user", "content": _prompt_for_match(resume, job_desc)},
-        ]
+    cache_key = make_key(content_hash(resume), job_desc, MODEL_NAME, PROMPT_VERSION)
+    cached = match_cache.get(cache_key)
+    if cached is not None:
+        return _observed("cache_hit", started, cached)
 
+    try:
         response = client.chat.completions.create(
             model=MODEL_NAME,
-            messages=messages,
+            messages=_messages_for_match(resume, job_desc),
             temperature=0.3,
-            max_tokens=1000,  # Increased for detailed breakdown
+            max_tokens=MATCH_MAX_TOKENS,  # Increased for detailed breakdown
         )
 
         raw_output = response.choices[0].message.content
-        return _safe_parse_json(raw_output)
-
-    except (RateLimitError, AuthenticationError) as e:
-        print(f"❌ GPT error: {e}. Using fallback.")
-        return _fallback_match_score(resume, job_desc)
+        return _observed("llm", started, _cache_result(cache_key, raw_output))
+
+    except _fallback_errors() as e:
+        logger.warning("OpenAI error, using fallback", extra={"error": str(e)})
+        return _observed("fallback", started, _fallback_match_score(resume, job_desc))
+
+    except Exception:
+        logger.exception("Unexpected scoring error, using fallback")
+        return _observed("fallback", started, _fallback_match_score(resume, job_desc))
+
+
+async def get_match_score_async(resume: str, job_desc: str,
+                                profile: Optional[Dict[str, Any]] = None,
+                                fallback: bool = True) -> Dict[str, Any]:
+    """Non-blocking variant of get_match_score for use inside the API event loop.
+
+    Calls go through llm_scheduler: paced to the per-minute request and token
+    limits, at most LLM_MAX_CONCURRENCY in flight, retried with backoff on 429s
+    and connection errors, and shared with any identical call already running.
+    With a resume
+    profile (llm/resume_profile.py) its normalized text and precomputed hash and
+    skills are used instead of re-deriving them from `resume`. With fallback=False,
+    OpenAI errors are raised instead of answered with the keyword score, so a
+    caller that can retry later (api/scoring_queue.py) gets the real result.
+    """
+    started = time.perf_counter()
+    if profile is not None:
+        resume = profile["normalized_text"]
+
+    async_client = _async_client()
+    if async_client is None:
+        return _observed("fallback", started, _fallback_for(resume, job_desc, profile))
+
+    resume_hash = profile["content_hash"] if profile is not None else content_hash(resume)
+    cache_key = make_key(resume_hash, job_desc, MODEL_NAME, PROMPT_VERSION)
+    cached = await match_cache.aget(cache_key)
+    if cached is not None:
+        return _observed("cache_hit", started, cached)
+
+    async def score_with_llm():
+        response = await async_client.chat.completions.create(
+            model=MODEL_NAME,
+            messages=_messages_for_match(resume, job_desc),
+            temperature=0.3,
+            max_tokens=MATCH_MAX_TOKENS,
+        )
+        return _cache_result(cache_key, response.choices[0].message.content)
 
+    try:
+        result = await llm_scheduler.run(cache_key, _estimated_tokens(resume, job_desc), score_with_llm)
+        return _observed("llm", started, result)
+
+    except _fallback_errors() as e:
+        if not fallback:
+            _observed("error", started, {})
+            raise
+        logger.warning("OpenAI error, using fallback", extra={"error": str(e)})
+        return _observed("fallback", started, _fallback_for(resume, job_desc, profile))
+
+    except Exception:
+        if not fallback:
+            _observed("error", started, {})
+            raise
+        logger.exception("Unexpected scoring error, using fallback")
+        return _observed("fallback", started, _fallback_for(resume, job_desc, profile))
+
+
+# Top-level fields reported individually while a streamed answer is still arriving
+STREAMED_FIELDS = ("match_score", "strengths", "gaps")
+
+
+def _result_events(result: Dict[str, Any]):
+    """Events for a result that is already complete (cache hit or keyword fallback)."""
+    for name in STREAMED_FIELDS:
+        yield "field", {"name": name, "value": result[name]}
+    for index, skill in enumerate(result["skill_breakdown"]):
+        yield "skill", {"index": index, **skill}
+    yield "result", result
+
+
+def _stream_event(path: tuple, value: Any):
+    """Turn a parser event into a client event, or None for parts nobody waits on."""
+    if len(path) == 1 and path[0] in STREAMED_FIELDS:
+        if path[0] == "match_score":
+            value = _clamp_score(value)
+        return "field", {"name": path[0], "value": value if path[0] == "match_score" else str(value)}
+    if len(path) == 2 and path[0] == "skill_breakdown" and isinstance(value, dict):
+        return "skill", {"index": path[1], **_validate_skill(value)}
+    return None
+
+
+async def stream_match_score(resume: str, job_desc: str,
+                             profile: Optional[Dict[str, Any]] = None) -> AsyncIterator[Tuple[str, Any]]:
+    """Score one job while the completion streams in.
+
+    Yields ("field", {name, value}) for match_score/strengths/gaps and
+    ("skill", {index, ...}) for each skill_breakdown entry as soon as each is
+    complete, then ("result", full result). Output that stops being valid JSON
+    aborts the call at that point and yields ("error", message) followed by the
+    keyword-based result.
+    """
+    started = time.perf_counter()
+    if profile is not None:
+        resume = profile["normalized_text"]
+
+    async_client = _async_client()
+    if async_client is None:
+        for event in _result_events(_observed("fallback", started, _fallback_for(resume, job_desc, profile))):
+            yield event
+        return
+
+    resume_hash = profile["content_hash"] if profile is not None else content_hash(resume)
+    cache_key = make_key(resume_hash, job_desc, MODEL_NAME, PROMPT_VERSION)
+    cached = await match_cache.aget(cache_key)
+    if cached is not None:
+        for event in _result_events(_observed("cache_hit", started, cached)):
+            yield event
+        return
+
+    parsed_events: asyncio.Queue = asyncio.Queue()
+
+    async def stream_with_llm():
+        parser = JSONStreamParser()
+        response = await async_client.chat.completions.create(
+            model=MODEL_NAME,
+            messages=_messages_for_match(resume, job_desc),
+            temperature=0.3,
+            max_tokens=MATCH_MAX_TOKENS,
+            stream=True,
+        )
+        try:
+            async for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    for path, value in parser.feed(delta):
+                        parsed_events.put_nowait((path, value))
+        finally:
+            await response.close()
+        if not parser.done:
+            raise StreamError("Completion ended before the JSON object was closed")
+        # Cached here so the answer is kept even if the client disconnected meanwhile
+        return _cache_result(cache_key, parser.text)
+
+    call = asyncio.ensure_future(
+        llm_scheduler.run(None, _estimated_tokens(resume, job_desc), stream_with_llm))
+    call.add_done_callback(lambda _: parsed_events.put_nowait(None))
+    # Keeps running (and caches) if the consumer goes away; mark its error as seen
+    call.add_done_callback(lambda task: task.cancelled() or task.exception())
+    # A retried call re-sends what an earlier attempt already produced
+    sent = set()
+    try:
+        while True:
+            item = await parsed_events.get()
+            if item is None:
+                break
+            event = _stream_event(*item)
+            if event is not None and item[0] not in sent:
+                sent.add(item[0])
+                yield event
+        yield "result", _observed("llm", started, call.result())
+    except (StreamError,) + _fallback_errors() as e:
+        logger.warning("Streamed scoring failed, using fallback", extra={"error": str(e)})
+        yield "error", {"message": str(e)}
+        yield "result", _observed("fallback", started, _fallback_for(resume, job_desc, profile))
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
-        return _fallback_match_score(resume, job_desc)
+        logger.exception("Unexpected streamed scoring error, using fallback")
+        yield "error", {"message": str(e)}
+        yield "result", _observed("fallback", started, _fallback_for(resume, job_desc, profile))
+
+
+async def get_match_scores_async(resume: str, job_descs: List[str],
+                                 profile: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Score one resume against many job descriptions, in input order."""
+    if not openai_configured():
+        # CPU-bound keyword scoring of the whole batch, kept off the event loop
+        return await asyncio.to_thread(fallback_match_scores, resume, job_descs, profile)
+    return list(await asyncio.gather(*(get_match_score_async(resume, jd, profile) for jd in job_descs)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+# llm/prompt_compactor.py
+# Shrinks the resume and job description before they are embedded in the match
+# prompt: normalized whitespace and bullets, no boilerplate sections (benefits,
+# EEO statements, company blurbs), no repeated lines, and a hard token budget.
+
+import re
+from typing import List, Optional, Tuple
+
+from llm.text_utils import count_tokens, normalize_text
+
+_BULLET = re.compile(r"^(?:[-*•·●▪◦‣∙]|\d{1,2}[.)])\s+")
+_HEADING_MARKUP = re.compile(r"^[#*_=\s]+|[#*_=:\s]+$")
+
+# Sections that say nothing about the skills being matched
+_BOILERPLATE_HEADING = re.compile(
+    r"(?:about (?!(?:the |this )?(?:role|job|position|opportunity|team)\b|you\b)[\w&.' -]+"
+    r"|who we are|our (?:company|story|mission|values)|life at \w+"
+    r"|why (?:join us|work (?:with|for) us|you'll love working here)|what we offer|we offer|perks.*|benefits.*"
+    r"|compensation.*|salary.*|pay (?:range|transparency).*|equal (?:employment )?opportunity.*|eeo.*"
+    r"|diversity.*|inclusion.*|accommodations?|reasonable accommodations?|privacy.*|how to apply"
+    r"|application process|disclaimer|legal.*)"
+)
+# Sections the score depends on most; the last to be cut when over budget
+_KEY_HEADING = re.compile(
+    r".*(?:requirement|qualification|skill|must have|nice to have|preferred|what you(?:'ll)? bring"
+    r"|you have|you will need|experience|tech stack).*"
+)
+# Other common headings, recognised so they end a boilerplate section
+_ROLE_HEADING = re.compile(
+    r"(?:about (?:the |this )?(?:role|job|position|opportunity|team)|about you|the (?:role|job|opportunity|team)"
+    r"|your role|overview|(?:key )?responsibilities|what you(?:'ll| will) do|you will|day to day|in this role)"
+)
+# Stock sentences that turn up outside any heading
+_BOILERPLATE_LINE = re.compile(
+    r"equal opportunity employer|without regard to (?:race|age|sex)|reasonable accommodation|e-verify"
+    r"|protected veteran|fair chance|recruitment agenc|by applying|privacy (?:policy|notice)"
+    r"|^(?:compensation|salary|pay range|benefits)\b[^:]{0,20}:",
+    re.IGNORECASE,
+)
+
+
+def _heading(line: str) -> Optional[str]:
+    """Lower-cased heading text if `line` looks like a section heading."""
+    if _BULLET.match(line):
+        return None
+    text = _HEADING_MARKUP.sub("", line)
+    if not text or len(text.split()) > 6 or text[-1] in ".!?,;":
+        return None
+    lowered = text.lower()
+    marked = line.endswith(":") or line.startswith(("#", "**", "__")) or text.isupper()
+    if marked or any(p.fullmatch(lowered) for p in (_BOILERPLATE_HEADING, _KEY_HEADING, _ROLE_HEADING)):
+        return lowered
+    return None
+
+
+def _clean_lines(text: str) -> List[str]:
+    """Normalized, bullet-unified lines with blank lines and exact repeats removed."""
+    lines, seen = [], set()
+    for line in normalize_text(text).split("\n"):
+        if not line:
+            continue
+        line = _BULLET.sub("- ", line)
+        key = " ".join(line.lstrip("- ").lower().split())
+        if key in seen:
+            continue
+        seen.add(key)
+        lines.append(line)
+    return lines
+
+
+def _fit(lines: List[Tuple[int, str]], max_tokens: Optional[int]) -> List[str]:
+    """Drop lines from the end, lowest priority (highest number) first, until within max_tokens."""
+    costs = [count_tokens(line) + 1 for _, line in lines]
+    total = sum(costs)
+    if max_tokens is None or total <= max_tokens:
+        return [line for _, line in lines]
+    keep = [True] * len(lines)
+    for priority in sorted({p for p, _ in lines}, reverse=True):
+        for i in range(len(lines) - 1, -1, -1):
+            if total <= max_tokens:
+                break
+            if keep[i] and lines[i][0] == priority:
+                keep[i] = False
+                total -= costs[i]
+    return [line for (_, line), kept in zip(lines, keep) if kept]
+
+
+def compact_job_description(text: str, max_tokens: Optional[int] = None) -> str:
+    """Job description reduced to what bears on the match, within max_tokens.
+
+    Boilerplate sections run from their heading to the next heading. When the
+    text is still over budget, lines outside requirement/skill sections are
+    dropped before lines inside them, last lines first.
+    """
+    lines: List[Tuple[int, str]] = []
+    skipping, priority = False, 1
+    for line in _clean_lines(text):
+        heading = _heading(line)
+        if heading is not None:
+            skipping = bool(_BOILERPLATE_HEADING.fullmatch(heading))
+            priority = 0 if _KEY_HEADING.fullmatch(heading) else 1
+        if skipping or _BOILERPLATE_LINE.search(line):
+            continue
+        lines.append((priority, line))
+    if not lines:
+        # Nothing but boilerplate by these rules; better to send it than an empty description
+        lines = [(1, line) for line in _clean_lines(text)]
+    return "\n".join(_fit(lines, max_tokens))
+
+
+def compact_resume(text: str, max_tokens: Optional[int] = None) -> str:
+    """Resume with normalized whitespace and no repeated lines, cut from the end to max_tokens."""
+    return "\n".join(_fit([(0, line) for line in _clean_lines(text)], max_tokens))
@@ -1,45 +1,131 @@
 # llm/resume_parser.py
-import PyPDF2
-import docx
+import asyncio
+import hashlib
 import io
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from fastapi import UploadFile, HTTPException
-import re
 
-async def extract_text_from_pdf(file: UploadFile) -> str:
-    """Extract text from PDF file"""
+from telemetry import RESUME_PARSE_SECONDS
+
+PDF_TYPE = "application/pdf"
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+MAX_RESUME_BYTES = int(os.getenv("MAX_RESUME_BYTES", str(10 * 1024 * 1024)))
+RESUME_PARSER_WORKERS = int(os.getenv("RESUME_PARSER_WORKERS", "2"))
+RESUME_PARSE_CACHE_SIZE = int(os.getenv("RESUME_PARSE_CACHE_SIZE", "64"))
+_READ_CHUNK = 1024 * 1024
+
+_pool = None
+_pool_lock = threading.Lock()
+# sha256 of file bytes -> extracted text
+_parsed: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn, not fork: the API process has threads and a running event loop
+            _pool = ProcessPoolExecutor(max_workers=RESUME_PARSER_WORKERS,
+                                        mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _discard_pool(broken: ProcessPoolExecutor) -> None:
+    """Drop a pool whose worker died (OOM, crash in a parser) so the next call starts a new one."""
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def _pdf_to_text(contents: bytes) -> str:
+    """Runs in a worker process. Pages are extracted one at a time and joined once."""
+    import PyPDF2
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(contents))
+    return "\n".join(page.extract_text() or "" for page in pdf_reader.pages).strip()
+
+
+def _docx_to_text(contents: bytes) -> str:
+    """Runs in a worker process."""
+    import docx
+    doc = docx.Document(io.BytesIO(contents))
+    return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
+
+
+async def _read_upload(file: UploadFile) -> bytes:
+    """Read the upload in chunks, rejecting it as soon as it exceeds MAX_RESUME_BYTES."""
+    chunks = []
+    size = 0
+    while True:
+        chunk = await file.read(_READ_CHUNK)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > MAX_RESUME_BYTES:
+            raise HTTPException(status_code=413,
+                                detail=f"Resume file is larger than {MAX_RESUME_BYTES // (1024 * 1024)} MB")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def _extract(file: UploadFile, extractor, label: str) -> str:
+    started = time.perf_counter()
+    contents = await _read_upload(file)
+    digest = hashlib.sha256(contents).hexdigest()
+    cached = _parsed.get(digest)
+    if cached is not None:
+        _parsed.move_to_end(digest)
+        RESUME_PARSE_SECONDS.labels(format=label.lower(), cache="hit").observe(time.perf_counter() - started)
+        return cached
+
     try:
-        contents = await file.read()
-        pdf_file = io.BytesIO(contents)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        
-        return text.strip()
+        loop = asyncio.get_running_loop()
+        # A pool broken by another upload gets one retry on a fresh pool
+        for attempt in range(2):
+            pool = _get_pool()
+            try:
+                text = await loop.run_in_executor(pool, extractor, contents)
+                break
+            except BrokenProcessPool:
+                _discard_pool(pool)
+                if attempt:
+                    raise HTTPException(status_code=503, detail="Resume parser is restarting; try again")
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=400, detail=f"PDF extraction failed: {str(e)}")
+        raise HTTPException(status_code=400, detail=f"{label} extraction failed: {str(e)}")
+    finally:
+        RESUME_PARSE_SECONDS.labels(format=label.lower(), cache="miss").observe(time.perf_counter() - started)
+
+    _parsed[digest] = text
+    while len(_parsed) > RESUME_PARSE_CACHE_SIZE:
+        _parsed.popitem(last=False)
+    return text
+
+
+async def extract_text_from_pdf(file: UploadFile) -> str:
+    """Extract text from PDF file"""
+    return await _extract(file, _pdf_to_text, "PDF")
+
 
 async def extract_text_from_docx(file: UploadFile) -> str:
     """Extract text from DOCX file"""
-    try:
-        contents = await file.read()
-        doc_file = io.BytesIO(contents)
-        doc = docx.Document(doc_file)
-        
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        
-        return text.strip()
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"DOCX extraction failed: {str(e)}")
+    return await _extract(file, _docx_to_text, "DOCX")
+
 
 async def parse_resume_file(file: UploadFile) -> str:
     """Parse resume file and return extracted text"""
-    if file.content_type == "application/pdf":
+    if file.content_type == PDF_TYPE:
         return await extract_text_from_pdf(file)
-    elif file.content_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+    elif file.content_type == DOCX_TYPE:
         return await extract_text_from_docx(file)
     else:
-        raise HTTPException(status_code=400, detail="Unsupported file type. Please upload PDF or DOCX.")
\ No newline at end of file
+        raise HTTPException(status_code=400, detail="Unsupported file type. Please upload PDF or DOCX.")
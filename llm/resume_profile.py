@@ -0,0 +1,110 @@
+# llm/resume_profile.py
+# A resume is analyzed once, on upload, into a profile keyed by resume_version.
+# Scoring calls reuse the profile instead of re-normalizing and rescanning the text.
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from llm.match_engine import resume_skill_names
+from llm.text_utils import content_hash, count_tokens, normalize_text
+
+DEFAULT_PROFILE_PATH = Path(__file__).resolve().parent.parent / ".data" / "resume_profiles.sqlite3"
+
+
+def build_profile(resume_text: str, resume_version: Optional[str] = None) -> Dict[str, Any]:
+    normalized = normalize_text(resume_text)
+    digest = content_hash(normalized)
+    skills, has_experience = resume_skill_names(normalized)
+    return {
+        "resume_version": resume_version or f"resume-{digest[:8]}",
+        "content_hash": digest,
+        "normalized_text": normalized,
+        "skills": skills,
+        "has_experience": has_experience,
+        "token_count": count_tokens(normalized),
+    }
+
+
+class ResumeProfileStore:
+    """resume_version -> profile, persisted in SQLite with an in-process read cache.
+
+    Other workers may re-save a version, so a cached profile is only used while
+    the stored row still has its content_hash.
+    """
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA busy_timeout=5000")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS resume_profiles ("
+            " resume_version TEXT PRIMARY KEY, content_hash TEXT NOT NULL,"
+            " normalized_text TEXT NOT NULL, skills TEXT NOT NULL,"
+            " has_experience INTEGER NOT NULL, token_count INTEGER NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Dict[str, Any]] = {}
+
+    def save(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO resume_profiles VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (profile["resume_version"], profile["content_hash"], profile["normalized_text"],
+                 json.dumps(profile["skills"]), int(profile["has_experience"]),
+                 profile["token_count"], time.time()),
+            )
+            self._cache[profile["resume_version"]] = profile
+        return profile
+
+    def get(self, resume_version: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            stored = self._db.execute("SELECT content_hash FROM resume_profiles WHERE resume_version = ?",
+                                      (resume_version,)).fetchone()
+            if stored is None:
+                self._cache.pop(resume_version, None)
+                return None
+            profile = self._cache.get(resume_version)
+            if profile is not None and profile["content_hash"] == stored[0]:
+                return profile
+            row = self._db.execute(
+                "SELECT resume_version, content_hash, normalized_text, skills, has_experience, token_count"
+                " FROM resume_profiles WHERE resume_version = ?", (resume_version,)
+            ).fetchone()
+            if row is None:
+                return None
+            profile = {
+                "resume_version": row[0],
+                "content_hash": row[1],
+                "normalized_text": row[2],
+                "skills": json.loads(row[3]),
+                "has_experience": bool(row[4]),
+                "token_count": row[5],
+            }
+            self._cache[resume_version] = profile
+            return profile
+
+
+resume_profiles = ResumeProfileStore(os.getenv("RESUME_PROFILE_PATH", str(DEFAULT_PROFILE_PATH)))
+
+
+def resolve_profile(resume_text: Optional[str], resume_version: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Profile for a scoring request: built from resume_text when given, else the stored one for resume_version.
+
+    Profiles built from text are saved so later requests can refer to them by
+    version; text that differs from what is stored under its resume_version
+    replaces it, as a re-upload does.
+    """
+    if not resume_text:
+        return resume_profiles.get(resume_version) if resume_version else None
+    profile = build_profile(resume_text, resume_version)
+    stored = resume_profiles.get(profile["resume_version"])
+    if stored is not None and stored["content_hash"] == profile["content_hash"]:
+        return stored
+    return resume_profiles.save(profile)
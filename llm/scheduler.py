@@ -0,0 +1,144 @@
+# llm/scheduler.py
+# Client-side pacing for OpenAI calls: request and token budgets per minute, a
+# concurrency cap, a bounded wait queue, retries with exponential backoff, and
+# coalescing of identical calls that are already in flight.
+
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SchedulerBusy(RuntimeError):
+    """Raised instead of queueing when max_queue calls are already waiting."""
+
+
+class TokenBucket:
+    """Budget of `per_minute` units refilled continuously.
+
+    reserve() always succeeds and returns how long the caller must wait before
+    using what it took; the balance may go negative, which queues later callers
+    behind earlier ones in arrival order.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.tokens = per_minute
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= min(amount, self.capacity)
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Seconds from a Retry-After header on the error's HTTP response, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class LLMScheduler:
+    """Runs LLM calls within per-minute request/token limits.
+
+    `rate_limit_errors` (429s) pause every caller of this scheduler for the
+    backoff period before retrying; `transient_errors` are retried for the
+    failing call only. Calls sharing a key while one is in flight wait for that
+    one instead of making their own.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float, max_concurrency: int = 8,
+                 max_queue: int = 1000, max_retries: int = 4, backoff_seconds: float = 1.0,
+                 max_backoff_seconds: float = 30.0,
+                 rate_limit_errors: Tuple[type, ...] = (), transient_errors: Tuple[type, ...] = ()):
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.max_queue = max_queue
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.rate_limit_errors = rate_limit_errors
+        self.transient_errors = transient_errors
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._paused_until = 0.0
+        self.pending = 0
+        self.calls = 0
+        self.coalesced = 0
+        self.rate_limited = 0
+        self.retries = 0
+        self.rejected = 0
+
+    async def run(self, key: Optional[str], estimated_tokens: int, call: Callable[[], Awaitable[T]]) -> T:
+        """Run `call` when the budgets allow, or join the in-flight call for `key`.
+
+        key=None opts out of coalescing (e.g. streamed calls with their own consumer).
+        """
+        shared = self._inflight.get(key) if key is not None else None
+        if shared is not None:
+            self.coalesced += 1
+            return await asyncio.shield(shared)
+
+        if self.pending >= self.max_queue:
+            self.rejected += 1
+            raise SchedulerBusy(f"{self.pending} LLM calls already queued")
+
+        # Counted before the task is scheduled, so a burst of callers sees the queue fill up
+        self.pending += 1
+        task = asyncio.ensure_future(self._execute(estimated_tokens, call))
+        task.add_done_callback(self._finished)
+        if key is not None:
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller giving up does not cancel the call for the others
+        return await asyncio.shield(task)
+
+    def _finished(self, task: asyncio.Future) -> None:
+        # A done callback rather than a finally in _execute: it also runs for a
+        # task cancelled before it started
+        self.pending -= 1
+
+    async def _execute(self, estimated_tokens: int, call: Callable[[], Awaitable[T]]) -> T:
+        attempt = 0
+        while True:
+            delay = max(self._requests.reserve(1), self._tokens.reserve(estimated_tokens),
+                        self._paused_until - time.monotonic())
+            if delay > 0:
+                await asyncio.sleep(delay)
+            async with self._semaphore:
+                try:
+                    self.calls += 1
+                    return await call()
+                except self.rate_limit_errors + self.transient_errors as e:
+                    limited = isinstance(e, self.rate_limit_errors)
+                    self.rate_limited += limited
+                    if attempt >= self.max_retries:
+                        raise
+                    backoff = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** attempt)
+                    backoff *= random.uniform(0.5, 1.0)
+                    if limited:
+                        backoff = max(backoff, _retry_after(e) or 0.0)
+                        self._paused_until = max(self._paused_until, time.monotonic() + backoff)
+                    self.retries += 1
+                    attempt += 1
+            await asyncio.sleep(backoff)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": self.pending,
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "rate_limited": self.rate_limited,
+            "retries": self.retries,
+            "rejected": self.rejected,
+            "paused_for_seconds": round(max(0.0, self._paused_until - time.monotonic()), 2),
+        }
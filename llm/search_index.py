@@ -0,0 +1,175 @@
+# llm/search_index.py
+# Full-text search over title, company and description: an SQLite FTS5 table
+# kept in step with the job store, ranked with BM25. Like the /jobs/rank index
+# it is per process and rebuilt at startup.
+
+import html
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Porter stemming so "pipelines" finds "pipeline"; + and # kept inside tokens for c++ and c#.
+# status and match_score live in a plain table: FTS5 re-tokenizes a row on any update,
+# and they change far more often than the text
+_SCHEMA = """
+CREATE VIRTUAL TABLE jobs_fts USING fts5(
+    title, company, description,
+    tokenize = "porter unicode61 tokenchars '+#'"
+);
+CREATE TABLE job_fields (id INTEGER PRIMARY KEY, status TEXT, match_score INTEGER);
+"""
+TEXT_COLUMNS = ["title", "company", "description"]
+FIELD_COLUMNS = ["status", "match_score"]
+# BM25 weight of a hit in title, company and description
+COLUMN_WEIGHTS = (3.0, 2.0, 1.0)
+
+# snippet() marks hits with these control characters, which are stripped from indexed
+# text, so the description can be HTML-escaped before they become <mark> tags
+_HIT_START, _HIT_END = "\x02", "\x03"
+_MARKERS = str.maketrans("", "", _HIT_START + _HIT_END)
+
+# "quoted phrases", -excluded terms and prefix* terms
+_QUERY_TERM = re.compile(r'(-?)(?:"([^"]*)"?|([^\s"]+))')
+_WORD = re.compile(r"[\w+#]+")
+
+
+def fts_query(query: str) -> Optional[str]:
+    """FTS5 MATCH expression for a search box query, or None when it has no terms.
+
+    Every term and "quoted phrase" must match; -term or -"phrase" excludes, and
+    a trailing * matches word prefixes. Anything else is treated as text, so the
+    result is always a valid FTS5 expression.
+    """
+    required, excluded = [], []
+    for negate, phrase, term in _QUERY_TERM.findall(query or ""):
+        text = phrase if phrase else term
+        prefix = not phrase and text.endswith("*")
+        words = _WORD.findall(text)
+        if not words:
+            continue
+        expression = '"' + " ".join(words) + '"' + ("*" if prefix else "")
+        (excluded if negate else required).append(expression)
+    if not required:
+        return None
+    return " AND ".join(required) + "".join(f" NOT {e}" for e in excluded)
+
+
+def _snippet_html(snippet: str) -> str:
+    """The snippet() excerpt HTML-escaped, with its hits in <mark> tags."""
+    escaped = html.escape(snippet or "")
+    return escaped.replace(_HIT_START, "<mark>").replace(_HIT_END, "</mark>")
+
+
+class SearchIndex:
+    """Incremental BM25 index over job postings.
+
+    Lives in a private temporary SQLite database, so a large corpus can spill
+    to disk instead of staying in memory.
+    """
+
+    def __init__(self):
+        # "" opens a private temporary database; the lock serializes access from the threadpool
+        self._conn = sqlite3.connect("", check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        # Hash of each indexed row's text, so updates that leave it alone skip the FTS write
+        self._digest: Dict[Any, int] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self._digest)
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM jobs_fts")
+            self._conn.execute("DELETE FROM job_fields")
+            self._digest = {}
+
+    def rebuild(self, pages: Iterable[List[Dict[str, Any]]]) -> None:
+        """Index every row from scratch (startup); `pages` yields lists of job rows."""
+        self.clear()
+        for page in pages:
+            self.apply("insert", page)
+
+    def apply(self, kind: str, rows: List[Dict[str, Any]]) -> None:
+        """JobStore change listener; rows need id, and description to be indexed.
+
+        Updates carrying only some columns (a status change, a new score) are
+        merged into the indexed row.
+        """
+        with self._lock, self._conn:
+            for row in rows:
+                job_id = row["id"]
+                if kind == "delete":
+                    if self._digest.pop(job_id, None) is not None:
+                        self._conn.execute("DELETE FROM jobs_fts WHERE rowid = ?", (job_id,))
+                        self._conn.execute("DELETE FROM job_fields WHERE id = ?", (job_id,))
+                    continue
+                indexed = job_id in self._digest
+                if not indexed and "description" not in row:
+                    continue
+                text = {column: (row[column] or "").translate(_MARKERS)
+                        for column in TEXT_COLUMNS if column in row}
+                digest = hash(tuple(text.get(column) for column in TEXT_COLUMNS))
+                if not indexed:
+                    columns = ", ".join(text)
+                    self._conn.execute(f"INSERT INTO jobs_fts (rowid, {columns}) VALUES (?{', ?' * len(text)})",
+                                       [job_id, *text.values()])
+                    self._conn.execute("INSERT INTO job_fields (id) VALUES (?)", (job_id,))
+                    self._digest[job_id] = digest
+                elif text and self._digest[job_id] != digest:
+                    assignments = ", ".join(f"{column} = ?" for column in text)
+                    self._conn.execute(f"UPDATE jobs_fts SET {assignments} WHERE rowid = ?",
+                                       [*text.values(), job_id])
+                    self._digest[job_id] = digest
+                fields = {column: row[column] for column in FIELD_COLUMNS if column in row}
+                if fields:
+                    assignments = ", ".join(f"{column} = ?" for column in fields)
+                    self._conn.execute(f"UPDATE job_fields SET {assignments} WHERE id = ?",
+                                       [*fields.values(), job_id])
+
+    def search(self, query: str, statuses: Optional[List[str]] = None, limit: int = 20,
+               offset: int = 0) -> Tuple[int, List[Dict[str, Any]]]:
+        """(total matches, best `limit` matches after `offset`), best first.
+
+        Each match has id, title, company, status, match_score, a BM25 `score`
+        (higher is better) and a description `snippet`: HTML-escaped text with
+        hits in <mark> tags.
+        Raises ValueError when the query has no searchable terms.
+        """
+        expression = fts_query(query)
+        if expression is None:
+            raise ValueError("Query has no searchable terms")
+        # CROSS JOIN keeps jobs_fts as the outer loop: one MATCH, then a primary key lookup per hit
+        source, where, params = "jobs_fts", "jobs_fts MATCH ?", [expression]
+        if statuses:
+            source += " CROSS JOIN job_fields ON id = jobs_fts.rowid"
+            where += f" AND status IN ({', '.join('?' * len(statuses))})"
+            params += statuses
+        weights = ", ".join(str(w) for w in COLUMN_WEIGHTS)
+        with self._lock:
+            total = self._conn.execute(f"SELECT count(*) FROM {source} WHERE {where}", params).fetchone()[0]
+            # Ranks ids only: SQLite computes every selected column before sorting, so
+            # snippets and fields are read afterwards for the page alone
+            ranked = self._conn.execute(
+                f"SELECT jobs_fts.rowid, bm25(jobs_fts, {weights}) AS rank FROM {source} WHERE {where} "
+                f"ORDER BY rank LIMIT ? OFFSET ?", params + [limit, offset]).fetchall()
+            if not ranked:
+                return total, []
+            details = {row[0]: row[1:] for row in self._conn.execute(
+                f"SELECT jobs_fts.rowid, title, company, status, match_score, "
+                f"snippet(jobs_fts, 2, char(2), char(3), '…', 16) FROM jobs_fts "
+                f"CROSS JOIN job_fields ON id = jobs_fts.rowid "
+                f"WHERE jobs_fts MATCH ? AND jobs_fts.rowid IN ({', '.join('?' * len(ranked))})",
+                [expression] + [job_id for job_id, _ in ranked])}
+        # FTS5's bm25() is negative, lower being better
+        results = []
+        for job_id, rank in ranked:
+            title, company, status, match_score, snippet = details[job_id]
+            results.append({"id": job_id, "title": title, "company": company, "status": status,
+                            "match_score": match_score, "score": round(-rank, 4), "snippet": _snippet_html(snippet)})
+        return total, results
+
+
+search_index = SearchIndex()
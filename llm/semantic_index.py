@@ -0,0 +1,184 @@
+# llm/semantic_index.py
+# Offline similarity between a resume and every stored job description: hashed
+# word n-gram TF-IDF vectors in a sparse matrix, so ranking all jobs is one
+# sparse matrix-vector product instead of an LLM call per job.
+
+import math
+import os
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+# Keeps tokens such as c++, c#, node.js and ci/cd pieces intact
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+
+# Job fields kept next to each vector so ranked results need no storage round trip
+META_COLUMNS = ["title", "company", "status", "match_score"]
+INDEX_COLUMNS = ["id", "description"] + META_COLUMNS
+
+
+def _features(text: str, mask: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Hashed unigram + bigram ids and sublinear term frequencies for one document.
+
+    Uses the built-in str hash: stable within a process, which is all an
+    in-memory index needs.
+    """
+    hashes = list(map(hash, _TOKEN_RE.findall((text or "").lower())))
+    grams = Counter(h & mask for h in hashes)
+    # Bigram ids are mixed from the unigram hashes rather than hashing joined strings
+    grams.update((a * 1000003 ^ b) & mask for a, b in zip(hashes, hashes[1:]))
+    indices = np.fromiter(grams.keys(), dtype=np.int32, count=len(grams))
+    counts = np.fromiter(grams.values(), dtype=np.float32, count=len(grams))
+    order = np.argsort(indices)
+    return indices[order], (1 + np.log(counts[order])).astype(np.float32)
+
+
+class SemanticIndex:
+    """Incremental TF-IDF index over job descriptions.
+
+    Rows are appended as jobs arrive and tombstoned when they change or are
+    deleted; the matrix is compacted once a quarter of it is dead. IDF weights
+    are applied at query time, so adding documents never re-weights stored rows.
+    """
+
+    def __init__(self, dim_bits: int = 18):
+        self.dim = 1 << dim_bits
+        self._mask = self.dim - 1
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._df = np.zeros(self.dim, dtype=np.int32)
+        self._matrix = sparse.csr_matrix((0, self.dim), dtype=np.float32)
+        self._squared = self._matrix   # element-wise square, for document norms
+        self._pending: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._ids: List[Any] = []
+        self._alive: List[bool] = []
+        self._row_of: Dict[Any, int] = {}
+        self._digest: Dict[Any, int] = {}
+        self._meta: Dict[Any, Dict[str, Any]] = {}
+        self._features: Dict[int, np.ndarray] = {}   # row -> feature ids, for df on removal
+        self._dead = 0
+        self._idf_cache: Optional[Tuple[int, np.ndarray]] = None
+        self._version = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._row_of)
+
+    def rebuild(self, pages: Iterable[List[Dict[str, Any]]]) -> None:
+        """Index every row from scratch (startup); `pages` yields lists of job rows."""
+        with self._lock:
+            self._reset()
+        for page in pages:
+            self.apply("insert", page)
+
+    def apply(self, kind: str, rows: List[Dict[str, Any]]) -> None:
+        """JobStore change listener; rows need id, and description to be (re)indexed."""
+        with self._lock:
+            for row in rows:
+                job_id = row["id"]
+                if kind == "delete":
+                    self._remove(job_id)
+                    continue
+                meta = self._meta.setdefault(job_id, {})
+                meta.update({k: row[k] for k in META_COLUMNS if k in row})
+                if "description" not in row:
+                    continue
+                digest = hash(row["description"] or "")
+                if self._digest.get(job_id) == digest:
+                    continue
+                self._remove(job_id, keep_meta=True)
+                self._add(job_id, row["description"], digest)
+            self._version += 1
+
+    def _add(self, job_id: Any, text: str, digest: int) -> None:
+        indices, values = _features(text, self._mask)
+        row = len(self._ids)
+        self._ids.append(job_id)
+        self._alive.append(True)
+        self._pending.append((indices, values))
+        self._features[row] = indices
+        self._row_of[job_id] = row
+        self._digest[job_id] = digest
+        self._df[indices] += 1
+
+    def _remove(self, job_id: Any, keep_meta: bool = False) -> None:
+        row = self._row_of.pop(job_id, None)
+        self._digest.pop(job_id, None)
+        if not keep_meta:
+            self._meta.pop(job_id, None)
+        if row is None:
+            return
+        self._alive[row] = False
+        self._df[self._features.pop(row)] -= 1
+        self._dead += 1
+
+    def _flush(self) -> None:
+        """Fold pending rows into the CSR matrix and compact out dead rows."""
+        if self._pending:
+            indptr = np.zeros(len(self._pending) + 1, dtype=np.int64)
+            np.cumsum([len(i) for i, _ in self._pending], out=indptr[1:])
+            block = sparse.csr_matrix(
+                (np.concatenate([v for _, v in self._pending]),
+                 np.concatenate([i for i, _ in self._pending]), indptr),
+                shape=(len(self._pending), self.dim))
+            self._matrix = sparse.vstack([self._matrix, block], format="csr")
+            self._pending = []
+            self._squared = self._matrix.power(2)
+
+        if self._dead and self._dead * 4 >= len(self._ids):
+            keep = np.flatnonzero(self._alive)
+            self._matrix = self._matrix[keep]
+            self._squared = self._squared[keep]
+            self._ids = [self._ids[r] for r in keep]
+            self._features = {new: self._features[old] for new, old in enumerate(keep)}
+            self._alive = [True] * len(keep)
+            self._row_of = {job_id: row for row, job_id in enumerate(self._ids)}
+            self._dead = 0
+
+    def _idf(self) -> np.ndarray:
+        if self._idf_cache is None or self._idf_cache[0] != self._version:
+            n = self.size
+            idf = (np.log((n + 1) / (self._df + 1)) + 1).astype(np.float32)
+            self._idf_cache = (self._version, idf)
+        return self._idf_cache[1]
+
+    def rank(self, query: str, limit: int = 20, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Jobs most similar to `query` (cosine over TF-IDF), best first.
+
+        Each result is the job's indexed fields plus id and similarity in [0, 1].
+        """
+        q_indices, q_values = _features(query, self._mask)
+        with self._lock:
+            self._flush()
+            if not self._row_of or not len(q_indices):
+                return []
+            idf = self._idf()
+            idf_sq = idf * idf
+            weights = np.zeros(self.dim, dtype=np.float32)
+            weights[q_indices] = q_values * idf_sq[q_indices]
+            dots = self._matrix @ weights
+            norms = np.sqrt(self._squared @ idf_sq)
+            q_norm = math.sqrt(float(np.sum((q_values * idf[q_indices]) ** 2)))
+            scores = dots / np.maximum(norms * q_norm, 1e-12)
+
+            valid = np.asarray(self._alive)
+            if status is not None:
+                valid &= np.fromiter((self._meta.get(job_id, {}).get("status") == status for job_id in self._ids),
+                                     dtype=bool, count=len(self._ids))
+            scores = np.where(valid, scores, -1.0)
+            count = min(limit, int(valid.sum()))
+            if count <= 0:
+                return []
+            top = np.argpartition(-scores, count - 1)[:count]
+            top = top[np.argsort(-scores[top])]
+            return [{"id": self._ids[r], **self._meta.get(self._ids[r], {}),
+                     "similarity": round(float(scores[r]), 4)} for r in top]
+
+
+job_index = SemanticIndex(dim_bits=int(os.getenv("SEMANTIC_INDEX_BITS", "18")))
@@ -0,0 +1,51 @@
+# llm/text_utils.py
+# Small text helpers shared by the scoring pipeline.
+
+import hashlib
+import re
+
+try:
+    import tiktoken
+except ImportError:  # optional exact BPE counts
+    tiktoken = None
+
+from telemetry import get_logger
+
+logger = get_logger(__name__)
+
+_WHITESPACE = re.compile(r"[ \t\r\f\v]+")
+_BLANK_LINES = re.compile(r"\n\s*\n+")
+# Rough stand-in for a BPE tokenizer: words and individual punctuation marks
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+_encoding = None
+
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of spaces/tabs and blank lines, keeping line structure."""
+    text = _WHITESPACE.sub(" ", text or "")
+    text = _BLANK_LINES.sub("\n\n", text)
+    return "\n".join(line.strip() for line in text.split("\n")).strip()
+
+
+def _tiktoken_encoding():
+    """The gpt-4o tokenizer, or False when tiktoken is missing or its encoding cannot be loaded."""
+    global _encoding
+    if _encoding is None:
+        _encoding = False
+        if tiktoken is not None:
+            try:
+                _encoding = tiktoken.get_encoding("o200k_base")
+            except Exception as e:  # the encoding file is fetched on first use
+                logger.warning("tiktoken unavailable — estimating token counts", extra={"error": str(e)})
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    encoding = _tiktoken_encoding()
+    if encoding:
+        return len(encoding.encode(text or "", disallowed_special=()))
+    return len(_TOKEN.findall(text or ""))
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
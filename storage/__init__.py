@@ -0,0 +1,29 @@
+# storage/__init__.py
+
+import os
+from pathlib import Path
+
+from storage.base import JOB_COLUMNS, JOB_STATUSES, SCORING_STATES, JobStore
+
+DEFAULT_SQLITE_PATH = Path(__file__).resolve().parent.parent / ".data" / "jobs.sqlite3"
+
+_store = None
+
+
+def get_job_store() -> JobStore:
+    """Process-wide job store chosen by JOB_STORE ("supabase", the default, or "sqlite")."""
+    global _store
+    if _store is None:
+        backend = os.getenv("JOB_STORE", "supabase").lower()
+        if backend == "sqlite":
+            from storage.sqlite_store import SQLiteJobStore
+            _store = SQLiteJobStore(os.getenv("JOB_STORE_PATH", str(DEFAULT_SQLITE_PATH)))
+        elif backend == "supabase":
+            from storage.supabase_store import SupabaseJobStore
+            _store = SupabaseJobStore()
+        else:
+            raise ValueError(f"Unknown JOB_STORE backend: {backend}")
+    return _store
+
+
+__all__ = ["JOB_COLUMNS", "JOB_STATUSES", "SCORING_STATES", "JobStore", "get_job_store"]
@@ -0,0 +1,176 @@
+# storage/base.py
+# Interface for the `jobs` table. api/routes.py and app.py talk to this instead
+# of building Supabase queries inline, so the backend can be swapped.
+
+import functools
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from telemetry import DB_SECONDS, get_logger, timed
+
+logger = get_logger(__name__)
+
+# Columns of the jobs table, in schema order (see README)
+JOB_COLUMNS = [
+    "id", "created_at", "title", "company", "description", "match_score", "strengths",
+    "gaps", "skill_breakdown", "status", "resume_version", "notes", "scoring_status", "duplicate_of",
+    "updated_at",
+]
+
+# scoring_status values; NULL on rows scored inline by POST /jobs
+SCORING_STATES = ["pending", "done", "failed"]
+
+JOB_STATUSES = ["wishlist", "applied", "interview", "offer", "rejected"]
+
+# listener(kind, rows) with kind in "insert", "update", "delete". Rows are full rows
+# for insert/update and {"id": ...} for delete.
+ChangeListener = Callable[[str, List[Dict[str, Any]]], None]
+
+
+def timed_call(operation: str):
+    """Decorator for backend methods: records each call in DB_SECONDS under the store's backend name."""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with timed(DB_SECONDS, backend=self.backend, operation=operation):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class JobStore:
+    """Backend-neutral access to the jobs table.
+
+    Rows are plain dicts keyed by column name. `company` filters are
+    case-insensitive substring matches, like Supabase's ilike("%...%").
+
+    Backends implement the underscore methods; the public mutators wrap them and
+    tell subscribed listeners which rows changed, once per call.
+
+    Every write stamps the row's updated_at, which doubles as its version for
+    optimistic concurrency: an "updated_at" in an update or delete is not
+    written but checked, and the row is left alone (and omitted from the
+    result) unless it still has that updated_at.
+    """
+
+    # Label for this backend in db_call_duration_seconds
+    backend = "unknown"
+
+    def __init__(self):
+        self._listeners: List[ChangeListener] = []
+
+    def subscribe(self, listener: ChangeListener) -> None:
+        self._listeners.append(listener)
+
+    def _notify(self, kind: str, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        for listener in self._listeners:
+            try:
+                listener(kind, rows)
+            except Exception:
+                # A broken listener must not fail a write that already happened
+                logger.exception("Job change listener failed", extra={"kind": kind, "rows": len(rows)})
+
+    def list_jobs(self, status: Optional[str] = None, company: Optional[str] = None,
+                  columns: Optional[List[str]] = None, limit: Optional[int] = None,
+                  after: Optional[Tuple[str, int]] = None) -> List[Dict[str, Any]]:
+        """Rows matching the filters, newest first (created_at, then id, descending).
+
+        `columns` restricts the returned fields. `after` is the (created_at, id) of the
+        last row of the previous page; only rows strictly after it in that order are
+        returned (keyset pagination), at most `limit` of them.
+        """
+        raise NotImplementedError
+
+    def get(self, job_id: int, columns: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def count(self, status: Optional[str] = None, company: Optional[str] = None) -> int:
+        raise NotImplementedError
+
+    def data_version(self) -> str:
+        """Cheap token that changes whenever the table's contents change (for ETags)."""
+        raise NotImplementedError
+
+    def insert(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert one row and return it as stored (with id and created_at)."""
+        return self.insert_many([row])[0]
+
+    def insert_many(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert rows in one round trip; returned rows are in input order."""
+        inserted = self._insert_many(rows) if rows else []
+        self._notify("insert", inserted)
+        return inserted
+
+    def update(self, job_id: int, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Apply `changes` to one row; returns the updated row, or None if it does not
+        exist or no longer has the expected updated_at."""
+        row = self._update(job_id, changes)
+        if row is not None:
+            self._notify("update", [row])
+        return row
+
+    def update_many(self, changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Apply per-row changes (each dict carries its row's "id") as one batch.
+
+        Returns the updated rows; ids that no longer exist, or whose updated_at is
+        not the expected one, are skipped. Listeners hear about the whole batch once.
+        """
+        updated = self._update_many(changes) if changes else []
+        self._notify("update", updated)
+        return updated
+
+    def delete(self, job_id: int) -> bool:
+        deleted = self._delete(job_id)
+        if deleted:
+            self._notify("delete", [{"id": job_id}])
+        return deleted
+
+    def delete_many(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """Delete rows (dicts with "id" and optionally the expected "updated_at") as one batch.
+
+        Returns the ids actually deleted; missing or since-modified rows are skipped.
+        Listeners hear about the whole batch once.
+        """
+        deleted = self._delete_many(rows) if rows else []
+        self._notify("delete", [{"id": job_id} for job_id in deleted])
+        return deleted
+
+    def iter_jobs(self, columns: Optional[List[str]] = None, page_size: int = 1000,
+                  status: Optional[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Walk the whole table page by page (keyset order), yielding each page."""
+        if columns is not None:
+            columns = list(dict.fromkeys(["id", "created_at", *columns]))
+        after = None
+        while True:
+            page = self.list_jobs(status=status, columns=columns, limit=page_size, after=after)
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            after = (page[-1]["created_at"], page[-1]["id"])
+
+    def _insert_many(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def _update(self, job_id: int, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def _update_many(self, changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Backends without a batched write fall back to one update per row
+        rows = [self._update(change["id"], change) for change in changes]
+        return [row for row in rows if row is not None]
+
+    def _delete(self, job_id: int) -> bool:
+        raise NotImplementedError
+
+    def _delete_many(self, rows: List[Dict[str, Any]]) -> List[int]:
+        raise NotImplementedError
+
+    def aggregate(self, group_by: str) -> Dict[Any, Dict[str, Any]]:
+        """Row count and match_score sum per distinct value of `group_by`.
+
+        Returns {value: {"count": int, "score_sum": int}}.
+        """
+        raise NotImplementedError
@@ -0,0 +1,247 @@
+# storage/sqlite_store.py
+# Local single-node backend for the jobs table. Also the offline test bed for benchmarks.
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from storage.base import JOB_COLUMNS, JobStore, timed_call
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    title TEXT,
+    -- NOCASE lets the company index serve case-insensitive lookups and prefix LIKE
+    company TEXT COLLATE NOCASE,
+    description TEXT,
+    match_score INTEGER,
+    strengths TEXT,
+    gaps TEXT,
+    skill_breakdown TEXT,
+    status TEXT,
+    resume_version TEXT,
+    notes TEXT,
+    scoring_status TEXT,
+    duplicate_of INTEGER,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status);
+CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company COLLATE NOCASE);
+
+-- Change counter behind data_version(); bumped by triggers so writes from every
+-- process sharing the file are seen
+CREATE TABLE IF NOT EXISTS jobs_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO jobs_meta (key, value) VALUES ('data_version', 0);
+CREATE TRIGGER IF NOT EXISTS jobs_version_insert AFTER INSERT ON jobs BEGIN
+    UPDATE jobs_meta SET value = value + 1 WHERE key = 'data_version';
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_version_update AFTER UPDATE ON jobs BEGIN
+    UPDATE jobs_meta SET value = value + 1 WHERE key = 'data_version';
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_version_delete AFTER DELETE ON jobs BEGIN
+    UPDATE jobs_meta SET value = value + 1 WHERE key = 'data_version';
+END;
+"""
+
+# Columns stored as JSON text
+_JSON_COLUMNS = {"skill_breakdown"}
+# Column types other than TEXT, for files migrated by _add_missing_columns
+_COLUMN_TYPES = {"match_score": "INTEGER", "duplicate_of": "INTEGER"}
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class SQLiteJobStore(JobStore):
+    backend = "sqlite"
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+            self._add_missing_columns(conn)
+
+    @staticmethod
+    def _add_missing_columns(conn: sqlite3.Connection) -> None:
+        """Bring job files created before a column was added up to the current schema."""
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+        for column in JOB_COLUMNS:
+            if column not in existing:
+                conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {_COLUMN_TYPES.get(column, 'TEXT')}")
+                if column == "updated_at":
+                    conn.execute("UPDATE jobs SET updated_at = created_at")
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread; FastAPI runs sync work on a thread pool
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _decode(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        for column in _JSON_COLUMNS & job.keys():
+            if job[column] is not None:
+                job[column] = json.loads(job[column])
+        return job
+
+    @staticmethod
+    def _encode(row: Dict[str, Any]) -> Dict[str, Any]:
+        unknown = set(row) - set(JOB_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown job columns: {', '.join(sorted(unknown))}")
+        return {
+            column: json.dumps(value) if column in _JSON_COLUMNS and value is not None else value
+            for column, value in row.items()
+        }
+
+    @staticmethod
+    def _where(status, company):
+        clauses, params = [], []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if company:
+            # Substring match can't seek the company index, but the subquery scans the
+            # narrow covering index instead of full rows with their descriptions
+            clauses.append("id IN (SELECT id FROM jobs WHERE company LIKE ? ESCAPE '\\')")
+            params.append(f"%{_escape_like(company)}%")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    @staticmethod
+    def _select_list(columns: Optional[List[str]]) -> str:
+        if not columns:
+            return "*"
+        unknown = set(columns) - set(JOB_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown job columns: {', '.join(sorted(unknown))}")
+        return ", ".join(columns)
+
+    @timed_call("list_jobs")
+    def list_jobs(self, status: Optional[str] = None, company: Optional[str] = None,
+                  columns: Optional[List[str]] = None, limit: Optional[int] = None,
+                  after: Optional[Tuple[str, int]] = None) -> List[Dict[str, Any]]:
+        where, params = self._where(status, company)
+        if after is not None:
+            # Row-value comparison walks idx_jobs_created_at from the cursor position
+            where += (" AND " if where else " WHERE ") + "(created_at, id) < (?, ?)"
+            params.extend(after)
+        sql = f"SELECT {self._select_list(columns)} FROM jobs{where} ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._decode(row) for row in self._conn().execute(sql, params)]
+
+    @timed_call("get")
+    def get(self, job_id: int, columns: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute(
+            f"SELECT {self._select_list(columns)} FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return self._decode(row) if row else None
+
+    @timed_call("count")
+    def count(self, status: Optional[str] = None, company: Optional[str] = None) -> int:
+        where, params = self._where(status, company)
+        return self._conn().execute(f"SELECT COUNT(*) FROM jobs{where}", params).fetchone()[0]
+
+    @timed_call("data_version")
+    def data_version(self) -> str:
+        row = self._conn().execute("SELECT value FROM jobs_meta WHERE key = 'data_version'").fetchone()
+        return str(row[0])
+
+    @timed_call("insert")
+    def _insert_many(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        conn = self._conn()
+        inserted = []
+        with conn:
+            for row in rows:
+                values = self._encode({k: v for k, v in row.items() if k != "id"})
+                values.setdefault("created_at", _utc_now())
+                values["updated_at"] = values["created_at"]
+                names = ", ".join(values)
+                marks = ", ".join("?" for _ in values)
+                cursor = conn.execute(
+                    f"INSERT INTO jobs ({names}) VALUES ({marks}) RETURNING *", list(values.values())
+                )
+                inserted.append(self._decode(cursor.fetchone()))
+        return inserted
+
+    @staticmethod
+    def _match(job_id: int, changes: Dict[str, Any]) -> Tuple[str, list]:
+        """WHERE clause for one row, requiring the expected updated_at when one is given."""
+        if "updated_at" not in changes:
+            return "id = ?", [job_id]
+        # IS so rows from before updated_at existed (NULL) can be matched too
+        return "id = ? AND updated_at IS ?", [job_id, changes["updated_at"]]
+
+    def _update_row(self, conn: sqlite3.Connection, job_id: int,
+                    changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        values = self._encode({k: v for k, v in changes.items() if k not in ("id", "updated_at")})
+        where, params = self._match(job_id, changes)
+        if not values:
+            row = conn.execute(f"SELECT * FROM jobs WHERE {where}", params).fetchone()
+            return self._decode(row) if row else None
+        values["updated_at"] = _utc_now()
+        assignments = ", ".join(f"{name} = ?" for name in values)
+        row = conn.execute(
+            f"UPDATE jobs SET {assignments} WHERE {where} RETURNING *", [*values.values(), *params]
+        ).fetchone()
+        return self._decode(row) if row else None
+
+    @timed_call("update")
+    def _update(self, job_id: int, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        conn = self._conn()
+        with conn:
+            return self._update_row(conn, job_id, changes)
+
+    @timed_call("update_many")
+    def _update_many(self, changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # One transaction (and one fsync) for the whole batch
+        conn = self._conn()
+        with conn:
+            rows = [self._update_row(conn, change["id"], change) for change in changes]
+        return [row for row in rows if row is not None]
+
+    @timed_call("delete")
+    def _delete(self, job_id: int) -> bool:
+        conn = self._conn()
+        with conn:
+            return conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,)).rowcount > 0
+
+    @timed_call("delete_many")
+    def _delete_many(self, rows: List[Dict[str, Any]]) -> List[int]:
+        conn = self._conn()
+        with conn:
+            deleted = []
+            for row in rows:
+                where, params = self._match(row["id"], row)
+                if conn.execute(f"DELETE FROM jobs WHERE {where}", params).rowcount:
+                    deleted.append(row["id"])
+        return deleted
+
+    @timed_call("aggregate")
+    def aggregate(self, group_by: str) -> Dict[Any, Dict[str, Any]]:
+        if group_by not in JOB_COLUMNS:
+            raise ValueError(f"Unknown job column: {group_by}")
+        rows = self._conn().execute(
+            f"SELECT {group_by}, COUNT(*), COALESCE(SUM(match_score), 0) FROM jobs GROUP BY {group_by}"
+        )
+        return {row[0]: {"count": row[1], "score_sum": row[2]} for row in rows}
@@ -0,0 +1,140 @@
+# storage/supabase_store.py
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from storage.base import JobStore, timed_call
+
+# Rows per update/delete request; each row adds a condition to the request URL
+WRITE_BATCH_SIZE = 100
+
+
+def _quoted(value: Any) -> str:
+    """A value as a double-quoted PostgREST filter operand (timestamps contain ':' and '+')."""
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _row_condition(row: Dict[str, Any]) -> str:
+    """PostgREST filter for one row, requiring the expected updated_at when one is given."""
+    job_id = int(row["id"])
+    if "updated_at" not in row:
+        return f"id.eq.{job_id}"
+    if row["updated_at"] is None:
+        return f"and(id.eq.{job_id},updated_at.is.null)"
+    return f"and(id.eq.{job_id},updated_at.eq.{_quoted(row['updated_at'])})"
+
+
+class SupabaseJobStore(JobStore):
+    backend = "supabase"
+
+    def __init__(self, client=None):
+        super().__init__()
+        self._client = client
+
+    @property
+    def client(self):
+        # Connected on first query, through the shared keep-alive pool (clients/__init__.py)
+        if self._client is None:
+            from clients import supabase_client
+            return supabase_client()
+        return self._client
+
+    def _filtered(self, query, status, company):
+        if status:
+            query = query.eq("status", status)
+        if company:
+            query = query.ilike("company", f"%{company}%")
+        return query
+
+    @timed_call("list_jobs")
+    def list_jobs(self, status: Optional[str] = None, company: Optional[str] = None,
+                  columns: Optional[List[str]] = None, limit: Optional[int] = None,
+                  after: Optional[Tuple[str, int]] = None) -> List[Dict[str, Any]]:
+        query = self.client.table("jobs").select(",".join(columns) if columns else "*")
+        query = self._filtered(query, status, company)
+        if after is not None:
+            created_at, job_id = after
+            query = query.or_(
+                f"created_at.lt.{_quoted(created_at)},and(created_at.eq.{_quoted(created_at)},id.lt.{int(job_id)})"
+            )
+        query = query.order("created_at", desc=True).order("id", desc=True)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.execute().data
+
+    @timed_call("get")
+    def get(self, job_id: int, columns: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        data = self.client.table("jobs").select(",".join(columns) if columns else "*") \
+            .eq("id", job_id).limit(1).execute().data
+        return data[0] if data else None
+
+    @timed_call("count")
+    def count(self, status: Optional[str] = None, company: Optional[str] = None) -> int:
+        # head=True asks PostgREST for the count only, without shipping any rows
+        query = self.client.table("jobs").select("id", count="exact", head=True)
+        return self._filtered(query, status, company).execute().count or 0
+
+    @timed_call("data_version")
+    def data_version(self) -> str:
+        # Row count plus newest updated_at, from one request that returns at most one row.
+        # Inserts and updates move updated_at, deletes the count, whichever worker made them.
+        result = self.client.table("jobs").select("updated_at", count="exact") \
+            .order("updated_at", desc=True, nullsfirst=False).limit(1).execute()
+        latest = result.data[0]["updated_at"] if result.data else ""
+        return f"{result.count or 0}:{latest}"
+
+    @timed_call("insert")
+    def _insert_many(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return self.client.table("jobs").insert(rows).execute().data
+
+    @staticmethod
+    def _values(changes: Dict[str, Any]) -> Dict[str, Any]:
+        values = {k: v for k, v in changes.items() if k not in ("id", "updated_at")}
+        values["updated_at"] = datetime.now(timezone.utc).isoformat()
+        return values
+
+    @timed_call("update")
+    def _update(self, job_id: int, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        data = self.client.table("jobs").update(self._values(changes)) \
+            .or_(_row_condition({**changes, "id": job_id})).execute().data
+        return data[0] if data else None
+
+    @timed_call("update_many")
+    def _update_many(self, changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Rows getting the same values share requests, WRITE_BATCH_SIZE rows at a time
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for change in changes:
+            values = {k: v for k, v in change.items() if k not in ("id", "updated_at")}
+            groups.setdefault(json.dumps(values, sort_keys=True, default=str), []).append(change)
+        updated = []
+        for rows in groups.values():
+            values = self._values(rows[0])
+            for start in range(0, len(rows), WRITE_BATCH_SIZE):
+                batch = rows[start:start + WRITE_BATCH_SIZE]
+                updated += self.client.table("jobs").update(values) \
+                    .or_(",".join(map(_row_condition, batch))).execute().data
+        return updated
+
+    @timed_call("delete")
+    def _delete(self, job_id: int) -> bool:
+        return bool(self.client.table("jobs").delete().eq("id", job_id).execute().data)
+
+    @timed_call("delete_many")
+    def _delete_many(self, rows: List[Dict[str, Any]]) -> List[int]:
+        deleted = []
+        for start in range(0, len(rows), WRITE_BATCH_SIZE):
+            batch = rows[start:start + WRITE_BATCH_SIZE]
+            data = self.client.table("jobs").delete() \
+                .or_(",".join(map(_row_condition, batch))).execute().data
+            deleted += [row["id"] for row in data]
+        return deleted
+
+    @timed_call("aggregate")
+    def aggregate(self, group_by: str) -> Dict[Any, Dict[str, Any]]:
+        groups: Dict[Any, Dict[str, Any]] = {}
+        for row in self.client.table("jobs").select(f"{group_by}, match_score").execute().data:
+            group = groups.setdefault(row[group_by], {"count": 0, "score_sum": 0})
+            group["count"] += 1
+            group["score_sum"] += row.get("match_score") or 0
+        return groups
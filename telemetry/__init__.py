@@ -0,0 +1,12 @@
+# telemetry/__init__.py
+# Metrics and logging shared by api/, llm/ and storage/.
+
+from telemetry.logs import configure_logging, get_logger
+from telemetry.metrics import (ANALYTICS_SECONDS, DB_SECONDS, HTTP_SECONDS, LLM_SECONDS, RESUME_PARSE_SECONDS,
+                               render_metrics, timed)
+from telemetry.middleware import TimingMiddleware
+
+__all__ = [
+    "ANALYTICS_SECONDS", "DB_SECONDS", "HTTP_SECONDS", "LLM_SECONDS", "RESUME_PARSE_SECONDS",
+    "TimingMiddleware", "configure_logging", "get_logger", "render_metrics", "timed",
+]
@@ -0,0 +1,109 @@
+# telemetry/logs.py
+# Leveled, structured logging for the api, llm and storage packages. Records are
+# handed to a background thread through a queue, so the event loop never waits
+# on stdout, and records below WARNING can be sampled.
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+from datetime import datetime, timezone
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+# Share of DEBUG/INFO records kept; warnings and errors are never dropped
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1"))
+
+# Loggers configured here; everything else (uvicorn, httpx, ...) keeps its own setup
+PACKAGES = ("api", "llm", "storage", "telemetry")
+
+# Attributes every LogRecord has; anything else came in through `extra=`
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_configured = False
+_lock = threading.Lock()
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock version pre-formats the record, which would fold the traceback into
+        # msg. The queue never leaves the process, so only the message is resolved
+        # here (its arguments could change before the listener gets to it).
+        record = copy.copy(record)
+        record.msg, record.args = record.getMessage(), None
+        return record
+
+
+def _fields(record: logging.LogRecord) -> dict:
+    return {k: v for k, v in vars(record).items() if k not in _RECORD_ATTRS}
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, msg, any `extra` fields, exc."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            **_fields(record),
+        }
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable lines with `extra` fields appended as key=value."""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s: %(message)s")
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        # Fields go on the message line, before any traceback
+        return super().formatMessage(record) + "".join(f" {k}={v}" for k, v in _fields(record).items())
+
+
+class SampleFilter(logging.Filter):
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or random.random() < self.rate
+
+
+def configure_logging() -> None:
+    """Attach the queue handler to the package loggers (once per process)."""
+    global _configured
+    with _lock:
+        if _configured:
+            return
+        _configured = True
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(JSONFormatter() if LOG_FORMAT == "json" else TextFormatter())
+        records: queue.Queue = queue.Queue(-1)
+        handler = _InProcessQueueHandler(records)
+        if LOG_SAMPLE_RATE < 1:
+            handler.addFilter(SampleFilter(LOG_SAMPLE_RATE))
+        listener = logging.handlers.QueueListener(records, output)
+        listener.start()
+        atexit.register(listener.stop)
+        for name in PACKAGES:
+            logger = logging.getLogger(name)
+            logger.setLevel(LOG_LEVEL)
+            logger.addHandler(handler)
+            logger.propagate = False
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger for a module of this project (pass __name__)."""
+    configure_logging()
+    return logging.getLogger(name)
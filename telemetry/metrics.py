@@ -0,0 +1,53 @@
+# telemetry/metrics.py
+# Prometheus histograms for where request time goes: HTTP handling, job store
+# calls, LLM scoring, resume parsing and analytics. Served by GET /metrics.
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Histogram, generate_latest
+
+# Seconds; spans sub-millisecond cache hits up to slow LLM calls
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+HTTP_SECONDS = Histogram(
+    "http_request_duration_seconds", "Time until the response headers are sent, by route template",
+    ["method", "route", "status"], buckets=BUCKETS)
+DB_SECONDS = Histogram(
+    "db_call_duration_seconds", "Job store calls", ["backend", "operation"], buckets=BUCKETS)
+# outcome: llm (answered by the model), cache_hit, fallback (keyword score), error (raised to the caller)
+LLM_SECONDS = Histogram(
+    "llm_scoring_duration_seconds", "Match scoring calls by how they were answered",
+    ["outcome"], buckets=BUCKETS)
+RESUME_PARSE_SECONDS = Histogram(
+    "resume_parse_duration_seconds", "Resume text extraction", ["format", "cache"], buckets=BUCKETS)
+ANALYTICS_SECONDS = Histogram(
+    "analytics_duration_seconds", "Analytics aggregation and maintenance", ["operation"], buckets=BUCKETS)
+
+
+@contextmanager
+def timed(histogram: Histogram, **labels):
+    """Observe the duration of the with-block, including when it raises."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.labels(**labels).observe(time.perf_counter() - started)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Exposition body and content type.
+
+    With PROMETHEUS_MULTIPROC_DIR set (required for uvicorn --workers > 1), the
+    samples of every worker process are merged.
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
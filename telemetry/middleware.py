@@ -0,0 +1,53 @@
+# telemetry/middleware.py
+# ASGI middleware recording every HTTP request in HTTP_SECONDS and the access log.
+
+import logging
+import time
+
+from telemetry.logs import get_logger
+from telemetry.metrics import HTTP_SECONDS
+
+access_log = get_logger("api.access")
+
+
+class TimingMiddleware:
+    """Times each request until its response headers are sent.
+
+    Requests are labelled with the matched route template (/jobs/{job_id}), not
+    the raw path, so the metric has one series per endpoint. Streaming
+    responses (GET /events) count only up to their first byte.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        recorded = False
+
+        def record(status: int) -> None:
+            nonlocal recorded
+            recorded = True
+            route = getattr(scope.get("route"), "path", "unmatched")
+            elapsed = time.perf_counter() - started
+            HTTP_SECONDS.labels(method=scope["method"], route=route, status=str(status)).observe(elapsed)
+            # Debug level so the default configuration skips it; see LOG_SAMPLE_RATE
+            level = logging.WARNING if status >= 500 else logging.DEBUG
+            access_log.log(level, "request", extra={
+                "method": scope["method"], "route": route, "status": status,
+                "duration_ms": round(elapsed * 1000, 2)})
+
+        async def timed_send(message):
+            if message["type"] == "http.response.start":
+                record(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, timed_send)
+        finally:
+            if not recorded:
+                record(500)  # the app raised before responding
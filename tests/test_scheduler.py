@@ -0,0 +1,23 @@
+import asyncio
+
+from llm.scheduler import LLMScheduler, SchedulerBusy
+
+
+def test_burst_beyond_max_queue_is_rejected():
+    async def burst():
+        scheduler = LLMScheduler(requests_per_minute=6000, tokens_per_minute=10**6,
+                                 max_concurrency=1, max_queue=5)
+
+        async def call():
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        results = await asyncio.gather(*(scheduler.run(None, 10, call) for _ in range(50)),
+                                       return_exceptions=True)
+        return scheduler, results
+
+    scheduler, results = asyncio.run(burst())
+    assert results.count("ok") == 5
+    assert sum(isinstance(r, SchedulerBusy) for r in results) == 45
+    assert scheduler.rejected == 45
+    assert scheduler.pending == 0